@@ -0,0 +1,93 @@
+"""
+Benchmark line-coverage collection overhead.
+
+Runs a loop- and call-heavy workload (the shape of a typical student test
+suite: small helpers called many times) three ways and reports the best
+of several timings:
+- baseline: no collector
+- settrace: LineCollector on sys.settrace (fallback before Python 3.12)
+- sys.monitoring: LineCollector with DISABLE after each line's first
+  event (Python 3.12+ only; skipped on older interpreters)
+
+Both collectors must record the same executed lines.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.line_coverage import MONITORING, LineCollector  # noqa: E402
+
+WORKLOAD = '''
+def classify(i):
+    if i % 15 == 0:
+        return 'fizzbuzz'
+    if i % 3 == 0:
+        return 'fizz'
+    if i % 5 == 0:
+        return 'buzz'
+    return str(i)
+
+
+def checksum(words):
+    total = 0
+    for word in words:
+        for ch in word:
+            total = (total * 31 + ord(ch)) % 1000003
+    return total
+
+
+def run(n):
+    return checksum(classify(i) for i in range(n))
+'''
+
+
+def timed(source_dir: str, n: int, use_monitoring: bool = None) -> tuple:
+    """Run the workload once; return (seconds, executed lines or None)."""
+    path = os.path.join(source_dir, 'workload.py')
+    namespace = {}
+    collector = None if use_monitoring is None else LineCollector(source_dir, (), use_monitoring)
+    if collector:
+        collector.start()
+    start = time.perf_counter()
+    exec(compile(WORKLOAD, path, 'exec'), namespace)
+    namespace['run'](n)
+    elapsed = time.perf_counter() - start
+    if collector:
+        collector.stop()
+        return elapsed, collector.executed.get(path)
+    return elapsed, None
+
+
+def best(source_dir: str, n: int, repeats: int, use_monitoring: bool = None) -> tuple:
+    """Best time of repeats runs, with the executed lines of the last run."""
+    runs = [timed(source_dir, n, use_monitoring) for _ in range(repeats)]
+    return min(seconds for seconds, _ in runs), runs[-1][1]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark coverage collector overhead')
+    parser.add_argument('--n', type=int, default=200_000, help='Workload size')
+    parser.add_argument('--repeats', type=int, default=3, help='Timings per mode')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as source_dir:
+        baseline, _ = best(source_dir, args.n, args.repeats)
+        results = {'settrace': best(source_dir, args.n, args.repeats, use_monitoring=False)}
+        if MONITORING:
+            results['sys.monitoring'] = best(source_dir, args.n, args.repeats, use_monitoring=True)
+
+    print(f"Python {sys.version.split()[0]}, n={args.n}, best of {args.repeats}")
+    print(f"  baseline        {baseline:7.3f}s")
+    for name, (seconds, _) in results.items():
+        print(f"  {name:<15} {seconds:7.3f}s  ({seconds / baseline:.2f}x baseline)")
+    if not MONITORING:
+        print("  sys.monitoring  skipped (requires Python 3.12+)")
+
+    line_sets = [lines for _, lines in results.values()]
+    assert all(lines == line_sets[0] for lines in line_sets), "Collectors disagree"
+    print(f"[OK] {len(results)} collector(s) recorded {len(line_sets[0])} identical lines")
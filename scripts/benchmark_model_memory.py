@@ -0,0 +1,88 @@
+"""
+Benchmark memory use of result models.
+
+Builds N docstring violations spread over 300 files three ways and
+reports the traced allocation per record, both with per-record path
+strings (unpickled cache/worker results, history scans) and with one
+shared path string per file (in-process analyzers):
+- legacy: plain dataclass with a per-instance __dict__ (previous models)
+- slotted: the current frozen, slotted DocstringViolation
+- columnar: the same records stored in a ViolationTable
+"""
+
+import os
+import sys
+import tracemalloc
+from dataclasses import make_dataclass
+from typing import Callable, Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.code_models import DocstringViolation  # noqa: E402
+from src.models.compact import ViolationTable  # noqa: E402
+
+LegacyViolation = make_dataclass('LegacyViolation', [
+    ('file_path', str), ('item_type', str), ('item_name', str), ('line_number', int)
+])
+
+
+def _records(model: type, count: int, shared_paths: bool) -> list:
+    """Build records for 300 files, optionally sharing one path object per file."""
+    paths = [f"/submissions/student/src/module_{i}.py" for i in range(300)]
+    return [
+        model(
+            paths[i % 300] if shared_paths else f"/submissions/student/src/module_{i % 300}.py",
+            'function', f"f{i}", i % 150
+        )
+        for i in range(count)
+    ]
+
+
+def measure(build: Callable[[], object]) -> int:
+    """Return bytes still allocated by the object build() returns."""
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def benchmark(count: int = 200_000, shared_paths: bool = False) -> Dict[str, float]:
+    """
+    Measure bytes per record for each representation.
+
+    Args:
+        count: Number of violation records
+        shared_paths: Reuse one path string per file instead of one per record
+
+    Returns:
+        Dict[str, float]: Bytes per record for legacy, slotted and columnar
+    """
+    def build(model: type) -> list:
+        return _records(model, count, shared_paths)
+
+    return {
+        'legacy': measure(lambda: build(LegacyViolation)) / count,
+        'slotted': measure(lambda: build(DocstringViolation)) / count,
+        'columnar': measure(
+            lambda: ViolationTable(DocstringViolation, build(DocstringViolation))
+        ) / count,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark result-model memory use")
+    parser.add_argument("--records", type=int, default=200_000, help="Number of records")
+
+    args = parser.parse_args()
+
+    for shared_paths in (False, True):
+        results = benchmark(args.records, shared_paths)
+        print("Shared path strings:" if shared_paths else "Per-record path strings:")
+        for name, per_record in results.items():
+            print(f"  {name:<9} {per_record:8.1f} bytes/record  "
+                  f"({results['legacy'] / per_record:.1f}x vs legacy)")
+    print(f"[OK] Measured {args.records} records")
@@ -0,0 +1,61 @@
+"""
+Regenerate the secret-finding baseline.
+
+Scans one or more reviewed projects (e.g. the starter projects handed
+out to a class) and writes the fingerprints of ALL their current secret
+findings to the baseline file. Later grading runs suppress these
+findings. Check the printed findings before committing the baseline:
+anything listed here will no longer be reported.
+"""
+
+import os
+import sys
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analyzers.secret_baseline import (  # noqa: E402
+    DEFAULT_BASELINE_PATH, fingerprint, load_baseline, save_baseline
+)
+from src.analyzers.security_scanner import scan_for_secrets  # noqa: E402
+
+
+def regenerate_baseline(
+    project_paths: List[str],
+    baseline_path: str = DEFAULT_BASELINE_PATH,
+    merge: bool = False,
+    detect_entropy: bool = False
+) -> int:
+    """
+    Fingerprint every finding in the given projects and write the baseline.
+
+    Args:
+        project_paths: Reviewed project directories to baseline
+        baseline_path: Baseline file to write
+        merge: Keep fingerprints already present in the baseline file
+        detect_entropy: Also baseline high-entropy findings
+
+    Returns:
+        int: Number of fingerprints in the written baseline
+    """
+    fingerprints = load_baseline(baseline_path) if merge else set()
+    for project_path in project_paths:
+        for finding in scan_for_secrets(project_path, detect_entropy=detect_entropy):
+            print(f"  {finding}")
+            fingerprints.add(fingerprint(finding, project_path))
+    return save_baseline(fingerprints, baseline_path)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Regenerate the secret-finding baseline")
+    parser.add_argument("projects", nargs="+", help="Reviewed project directories")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="Baseline file")
+    parser.add_argument("--merge", action="store_true", help="Keep existing fingerprints")
+    parser.add_argument("--entropy", action="store_true", help="Include entropy findings")
+
+    args = parser.parse_args()
+
+    count = regenerate_baseline(args.projects, args.baseline, args.merge, args.entropy)
+    print(f"[OK] Baseline written: {args.baseline} ({count} fingerprints)")
@@ -0,0 +1,106 @@
+"""
+Cohort Test Runner Module
+
+Runs the test suites of a whole cohort of submissions through
+run_test_suite with a bounded number of concurrent jobs.
+
+Key Features:
+- At most `workers` sandboxed jobs at once, whatever the cohort size
+- Results cached in the AnalysisCache by tree hash (paths + contents),
+  so unchanged resubmissions are never re-run
+- Identical trees within one cohort (e.g. untouched starter code) run once
+- With a VenvPool, each suite runs in a shared environment holding its
+  declared dependencies
+
+Design Decision: Threads, not processes, drive the pool - each job
+spends its time waiting on its own sandboxed subprocess. Cache reads and
+writes stay on the calling thread (the SQLite connection is not shared).
+"""
+
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List
+
+from ..utils.analysis_cache import MISSING, AnalysisCache
+from ..utils.cache_lookup import tree_sha
+from ..utils.project_snapshot import ProjectSnapshot
+from ..utils.sandbox import DEFAULT_MEMORY_MB, DEFAULT_TIMEOUT
+from ..utils.venv_pool import VenvPool
+from .test_runner import run_test_suite
+
+
+DEFAULT_WORKERS = 4
+TEST_RUN_CACHE_VERSION = 2  # Bump whenever run_test_suite output changes
+
+
+def run_cohort_tests(
+    project_paths: List[str],
+    workers: int = DEFAULT_WORKERS,
+    cache: AnalysisCache = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    memory_mb: int = DEFAULT_MEMORY_MB,
+    pool: VenvPool = None
+) -> Dict[str, Dict]:
+    """
+    Run every submission's tests, reusing cached results for unchanged trees.
+
+    Args:
+        project_paths: Submission root directories
+        workers: Most test suites running at once (default: 4)
+        cache: Persistent cache for results by tree hash (optional)
+        timeout: Wall-clock limit per submission in seconds
+        memory_mb: Address-space limit per submission in MB
+        pool: Environments with each submission's dependencies (optional;
+            default: run with this interpreter)
+
+    Returns:
+        Dict[str, Dict]: run_test_suite result per project path, each with
+        'cached' telling whether it was served without running
+
+    Example:
+        >>> with AnalysisCache() as cache:
+        ...     results = run_cohort_tests(submissions, workers=8, cache=cache)
+        >>> print(results[submissions[0]]['coverage'])
+    """
+    version = f"{TEST_RUN_CACHE_VERSION}-{timeout}-{memory_mb}"  # Limits change outcomes
+    results: Dict[str, Dict] = {}
+    pending: Dict[str, List[str]] = {}  # tree hash -> paths sharing that tree
+    snapshots: Dict[str, ProjectSnapshot] = {}
+
+    for path in project_paths:
+        snapshot = ProjectSnapshot.build(path)
+        key = tree_sha(snapshot)
+        cached = cache.get(key, 'test_run', version) if cache is not None else MISSING
+        if cached is not MISSING:
+            results[path] = {**cached, 'cached': True}
+            continue
+        pending.setdefault(key, []).append(path)
+        snapshots.setdefault(key, snapshot)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {
+            executor.submit(_run, paths[0], snapshots[key], timeout, memory_mb, pool): key
+            for key, paths in pending.items()
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            result = future.result()
+            if cache is not None and result['status'] != 'error':
+                cache.put(key, 'test_run', version, result)  # Errors may be transient
+            for path in pending[key]:
+                results[path] = {**result, 'cached': False}
+
+    return {path: results[path] for path in project_paths}
+
+
+def _run(path: str, snapshot: ProjectSnapshot, timeout: float, memory_mb: int,
+         pool: VenvPool) -> Dict:
+    """Run one suite, in a pooled environment when a pool is given."""
+    if pool is None:
+        return run_test_suite(path, snapshot, timeout, memory_mb)
+    try:
+        with pool.environment(snapshot) as python:
+            return run_test_suite(path, snapshot, timeout, memory_mb, python)
+    except (RuntimeError, OSError, subprocess.SubprocessError) as e:  # Environment build failed
+        return {'status': 'error', 'tests_run': 0, 'failures': 0, 'errors': 0, 'skipped': 0,
+                'coverage': None, 'file_coverage': {}, 'duration': 0.0, 'output': str(e)}
@@ -0,0 +1,121 @@
+"""
+Complexity Analyzer Module
+
+Checks McCabe cyclomatic complexity of every function and method.
+Academic requirement: no function above max_function_complexity (10).
+
+Complexity is computed during the shared module-summary traversal, so
+this check costs no extra parse when docstrings and naming are also
+analyzed with the same ProjectSnapshot.
+"""
+
+from typing import Dict, Optional
+
+from ..models.code_models import ComplexityViolation, ModuleSummary
+from ..models.compact import ViolationTable
+from ..parsers.module_summary import NOT_SUMMARIZED, summarize_file
+from ..parsers.parallel_summaries import summarize_files
+from ..utils.content_store import ContentStore
+from ..utils.file_finder import find_code_files
+from ..utils.project_snapshot import ProjectSnapshot
+
+
+MAX_FUNCTION_COMPLEXITY = 10  # thresholds.max_function_complexity in grading_config.yaml
+
+
+def check_complexity(
+    file_path: str,
+    max_complexity: int = MAX_FUNCTION_COMPLEXITY,
+    store: ContentStore = None,
+    summary: Optional[ModuleSummary] = NOT_SUMMARIZED
+) -> Dict:
+    """
+    Check cyclomatic complexity of each function in a Python file.
+
+    Args:
+        file_path: Path to Python file
+        max_complexity: Highest allowed complexity per function
+        store: Shared content cache (optional)
+        summary: Pre-built module summary, None if it failed to parse
+            (optional, avoids a parse)
+
+    Returns:
+        Dict containing functions (name, line, complexity) and violations
+
+    Example:
+        >>> result = check_complexity('script.py')
+        >>> for name, line, complexity in result['functions']:
+        ...     print(f"{name}:{line} -> {complexity}")
+    """
+    if summary is NOT_SUMMARIZED:
+        summary = summarize_file(file_path, store)
+    if summary is None:
+        return {'functions': [], 'violations': [], 'error': 'Failed to parse file'}
+
+    scored = [('function', func.name, func) for func in summary.functions]
+    scored += [
+        ('method', f"{cls.name}.{method.name}", method)
+        for cls in summary.classes for method in cls.methods
+    ]
+    scored.sort(key=lambda item: item[2].line_number)
+
+    violations = [
+        ComplexityViolation(
+            file_path, item_type, name, func.line_number, func.complexity, max_complexity
+        )
+        for item_type, name, func in scored if func.complexity > max_complexity
+    ]
+    return {
+        'functions': [(name, func.line_number, func.complexity) for _, name, func in scored],
+        'violations': violations
+    }
+
+
+def analyze_project_complexity(
+    project_path: str,
+    max_complexity: int = MAX_FUNCTION_COMPLEXITY,
+    snapshot: ProjectSnapshot = None,
+    workers: int = 1
+) -> Dict:
+    """
+    Analyze cyclomatic complexity across entire project.
+
+    Args:
+        project_path: Root directory
+        max_complexity: Highest allowed complexity per function (default: 10)
+        snapshot: Pre-built project index (optional, avoids a directory walk)
+        workers: Worker processes for parsing large projects (default: 1)
+
+    Returns:
+        Dict with total_functions, average and highest complexity, per-file
+        function scores, violations (a ViolationTable; list() it for a list)
+        and passed
+
+    Example:
+        >>> result = analyze_project_complexity('/path/to/project')
+        >>> for v in result['violations']:
+        ...     print(v)
+    """
+    python_files = find_code_files(project_path, extensions=['.py'], snapshot=snapshot)
+    summaries = summarize_files(python_files, snapshot, workers)
+
+    per_file = {}
+    all_violations = ViolationTable(ComplexityViolation)
+
+    for file_path in python_files:
+        result = check_complexity(file_path, max_complexity, summary=summaries[file_path])
+        if result['functions']:
+            per_file[file_path] = result['functions']
+        all_violations.extend(result['violations'])
+
+    scores = [complexity for functions in per_file.values() for _, _, complexity in functions]
+
+    return {
+        'total_files': len(python_files),
+        'total_functions': len(scores),
+        'average_complexity': sum(scores) / len(scores) if scores else 0.0,
+        'max_complexity_found': max(scores, default=0),
+        'functions': per_file,
+        'violations': all_violations,
+        'passed': len(all_violations) == 0
+    }
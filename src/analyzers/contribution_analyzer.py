@@ -0,0 +1,123 @@
+"""
+Contribution Analyzer Module
+
+Per-author contribution analytics for pair projects: commits, lines
+added and removed, active days and file ownership per partner, plus a
+balance figure for the rubric's "distribution" criterion.
+
+Everything comes from the same streamed `git log --numstat` pass the
+git analyzer already makes (ContributionTracker is a summarize_history
+observer); `git blame` is never run. File ownership is therefore
+authorship-based: a file belongs to whoever added the most lines to it.
+"""
+
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from ..models.git_models import AuthorStats, CommitInfo
+from ..utils.author_identity import IdentityFolder
+from ..utils.git_log_stream import summarize_history
+
+
+class ContributionTracker:
+    """
+    Aggregates commits per raw (name, email) identity; folds them on report.
+
+    Example:
+        >>> tracker = ContributionTracker()
+        >>> summarize_history('/path/to/repo', observers=[tracker])
+        >>> print(tracker.report()['balance'])
+    """
+
+    def __init__(self):
+        """Start with no identities."""
+        self._totals: Dict[Tuple[str, str], List[int]] = {}  # commits, added, deleted
+        self._days: Dict[Tuple[str, str], set] = {}
+        self._file_lines: Dict[str, Counter] = {}  # path -> identity -> lines added
+
+    def add(self, commit: CommitInfo, changes: List[Tuple[int, int, str]]) -> None:
+        """Fold one streamed commit and its numstat changes."""
+        identity = (commit.author, commit.email)
+        totals = self._totals.setdefault(identity, [0, 0, 0])
+        totals[0] += 1
+        totals[1] += commit.insertions
+        totals[2] += commit.deletions
+        self._days.setdefault(identity, set()).add(commit.date)
+        for added, _, path in changes:
+            if added:
+                self._file_lines.setdefault(path, Counter())[identity] += added
+
+    def report(self) -> Dict:
+        """
+        Per-author statistics with identities folded.
+
+        Returns:
+            Dict with authors (List[AuthorStats], most commits first),
+            file_owners (path -> author name) and balance (smallest over
+            largest line share of the top two authors; 1.0 is an even
+            split, 0.0 a single author)
+        """
+        folder = IdentityFolder()
+        for name, email in self._totals:
+            folder.add(name, email)
+        members: Dict[str, List[Tuple[str, str]]] = {}
+        for identity in self._totals:
+            members.setdefault(folder.key(*identity), []).append(identity)
+
+        file_owners = {}
+        owned = Counter()
+        for path, lines in self._file_lines.items():
+            per_author = Counter()
+            for identity, count in lines.items():
+                per_author[folder.key(*identity)] += count
+            owner = per_author.most_common(1)[0][0]
+            owned[owner] += 1
+            file_owners[path] = owner
+
+        total_added = sum(totals[1] for totals in self._totals.values()) or 1
+        by_key = {key: self._author(identities, owned[key], total_added)
+                  for key, identities in members.items()}
+        authors = sorted(by_key.values(), key=lambda author: (-author.commits, author.name))
+
+        shares = sorted((author.line_share for author in authors), reverse=True)[:2]
+        return {
+            'authors': authors,
+            'file_owners': {path: by_key[key].name for path, key in file_owners.items()},
+            'balance': round(shares[1] / shares[0], 3) if len(shares) == 2 and shares[0] else 0.0
+        }
+
+    def _author(self, identities: List[Tuple[str, str]], files_owned: int,
+                total_added: int) -> AuthorStats:
+        """Merge the raw identities of one person."""
+        main = max(identities, key=lambda identity: self._totals[identity][:2])
+        sums = [sum(self._totals[identity][i] for identity in identities) for i in range(3)]
+        return AuthorStats(
+            name=main[0] or main[1],
+            emails=tuple(sorted({email for _, email in identities if email})),
+            commits=sums[0],
+            insertions=sums[1],
+            deletions=sums[2],
+            active_days=len(set().union(*(self._days[identity] for identity in identities))),
+            files_owned=files_owned,
+            line_share=round(sums[1] / total_added, 3)
+        )
+
+
+def analyze_contributions(project_path: str) -> Dict:
+    """
+    Analyze partner contributions from one streamed git log.
+
+    Args:
+        project_path: Root directory of git repo
+
+    Returns:
+        Dict from ContributionTracker.report plus history_complete
+
+    Example:
+        >>> result = analyze_contributions('/path/to/repo')
+        >>> for author in result['authors']:
+        ...     print(author.name, author.commits, author.line_share)
+    """
+    tracker = ContributionTracker()
+    stats = summarize_history(project_path, sample_size=0, observers=[tracker])
+    return {**tracker.report(), 'history_complete': stats.complete}
@@ -7,16 +7,15 @@ Academic requirement: 90% of functions/classes must have docstrings.
 Uses AST parsing for accurate detection.
 """
 
-from typing import List, Dict
-
-from ..models.code_models import DocstringViolation
-from ..parsers.python_parser import (
-    parse_python_file,
-    extract_functions,
-    extract_classes,
-    get_module_docstring
-)
+from typing import Dict, Optional
+
+from ..models.code_models import DocstringViolation, ModuleSummary
+from ..models.compact import ViolationTable
+from ..parsers.module_summary import NOT_SUMMARIZED, summarize_file
+from ..parsers.parallel_summaries import summarize_files
+from ..utils.content_store import ContentStore
 from ..utils.file_finder import find_code_files
+from ..utils.project_snapshot import ProjectSnapshot
 
 
 def _should_check_function(func_name: str) -> bool:
@@ -29,12 +28,16 @@ def _should_check_method(method_name: str) -> bool:
     return not (method_name.startswith('_') and method_name != '__init__')
 
 
-def check_docstrings(file_path: str) -> Dict:
+def check_docstrings(file_path: str, store: ContentStore = None,
+                     summary: Optional[ModuleSummary] = NOT_SUMMARIZED) -> Dict:
     """
     Check docstring coverage in a Python file.
 
     Args:
         file_path: Path to Python file
+        store: Shared content cache (optional)
+        summary: Pre-built module summary, None if it failed to parse
+            (optional, avoids a parse)
 
     Returns:
         Dict containing total_items, missing, coverage, violations
@@ -43,8 +46,9 @@ def check_docstrings(file_path: str) -> Dict:
         >>> result = check_docstrings('script.py')
         >>> print(f"Coverage: {result['coverage']:.1%}")
     """
-    tree = parse_python_file(file_path)
-    if not tree:
+    if summary is NOT_SUMMARIZED:
+        summary = summarize_file(file_path, store)
+    if summary is None:
         return {'total_items': 0, 'missing': 0, 'coverage': 0.0,
                 'violations': [], 'error': 'Failed to parse file'}
 
@@ -52,12 +56,12 @@ def check_docstrings(file_path: str) -> Dict:
     total_items = 1  # Module counts as 1
 
     # Check module docstring
-    if not get_module_docstring(tree):
+    if not summary.docstring:
         violations.append(DocstringViolation(
             file_path, 'module', '<module>', 1))
 
     # Check functions
-    for func in extract_functions(tree):
+    for func in summary.functions:
         if not _should_check_function(func.name):
             continue
         total_items += 1
@@ -66,7 +70,7 @@ def check_docstrings(file_path: str) -> Dict:
                 file_path, 'function', func.name, func.line_number))
 
     # Check classes and methods
-    for cls in extract_classes(tree):
+    for cls in summary.classes:
         total_items += 1
         if not cls.has_docstring:
             violations.append(DocstringViolation(
@@ -93,7 +97,9 @@ def check_docstrings(file_path: str) -> Dict:
 
 def analyze_project_docstrings(
     project_path: str,
-    min_coverage: float = 0.9
+    min_coverage: float = 0.9,
+    snapshot: ProjectSnapshot = None,
+    workers: int = 1
 ) -> Dict:
     """
     Analyze docstring coverage across entire project.
@@ -101,23 +107,27 @@ def analyze_project_docstrings(
     Args:
         project_path: Root directory
         min_coverage: Minimum acceptable coverage (default: 0.9 = 90%)
+        snapshot: Pre-built project index (optional, avoids a directory walk)
+        workers: Worker processes for parsing large projects (default: 1)
 
     Returns:
-        Dict with project-wide docstring analysis
+        Dict with project-wide docstring analysis; violations is a ViolationTable
+        (read-only Sequence; list(result['violations']) for a list)
 
     Example:
         >>> result = analyze_project_docstrings('/path/to/project')
         >>> if result['passed']:
         ...     print(f"Coverage: {result['coverage']:.1%}")
     """
-    python_files = find_code_files(project_path, extensions=['.py'])
+    python_files = find_code_files(project_path, extensions=['.py'], snapshot=snapshot)
+    summaries = summarize_files(python_files, snapshot, workers)
 
     total_items = 0
     total_missing = 0
-    all_violations = []
+    all_violations = ViolationTable(DocstringViolation)  # Columnar: cohorts hold many
 
     for file_path in python_files:
-        result = check_docstrings(file_path)
+        result = check_docstrings(file_path, summary=summaries[file_path])
 
         total_items += result['total_items']
         total_missing += result['missing']
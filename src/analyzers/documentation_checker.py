@@ -10,9 +10,14 @@ from typing import Dict, List
 
 from ..validators.document_validator import validate_document
 from ..validators.document_requirements import DEFAULT_DOC_REQUIREMENTS
+from ..utils.project_snapshot import ProjectSnapshot
 
 
-def _validate_all_docs(project_path: str, required_docs: List[Dict]) -> tuple:
+def _validate_all_docs(
+    project_path: str,
+    required_docs: List[Dict],
+    snapshot: ProjectSnapshot = None
+) -> tuple:
     """Validate all required documents and collect results."""
     results = {}
     all_issues = []
@@ -25,7 +30,8 @@ def _validate_all_docs(project_path: str, required_docs: List[Dict]) -> tuple:
         result = validate_document(
             doc_path,
             doc_spec.get('required_sections', []),
-            doc_spec.get('min_words', 0)
+            doc_spec.get('min_words', 0),
+            snapshot=snapshot
         )
 
         results[doc_name] = result
@@ -55,13 +61,18 @@ def _calculate_doc_score(results: Dict) -> Dict:
     }
 
 
-def check_project_documentation(project_path: str, config: Dict = None) -> Dict:
+def check_project_documentation(
+    project_path: str,
+    config: Dict = None,
+    snapshot: ProjectSnapshot = None
+) -> Dict:
     """
     Validate all required documentation in a project.
 
     Args:
         project_path: Root directory of project
         config: Grading config dict (if None, uses defaults)
+        snapshot: Pre-built project index (optional)
 
     Returns:
         Dict with overall validation results and score
@@ -74,7 +85,9 @@ def check_project_documentation(project_path: str, config: Dict = None) -> Dict:
         config = DEFAULT_DOC_REQUIREMENTS
 
     required_docs = config.get('required_documents', [])
-    results, all_issues, docs_passed = _validate_all_docs(project_path, required_docs)
+    results, all_issues, docs_passed = _validate_all_docs(
+        project_path, required_docs, snapshot=snapshot
+    )
     score_info = _calculate_doc_score(results)
 
     return {
@@ -0,0 +1,132 @@
+"""
+Entropy Detector Module
+
+Flags random-looking string literals (keys assigned to arbitrary names,
+tokens inlined in URLs) that SECRET_PATTERNS cannot recognize by name.
+
+Key Features:
+- Candidates: runs of base64 or hex characters inside string literals
+- Shannon entropy of all candidates in a file computed in one NumPy batch
+- Separate thresholds for the base64 and hex alphabets, scaled down for
+  tokens too short to reach them (a 20-char token has at most 4.32 bits)
+- Hex tokens of digest length (40 or 64 chars: git object ids, SHA-1
+  and SHA-256 checksums) are not candidates; they are as random as a key
+- Confidence = observed entropy / maximum entropy possible for the
+  candidate's length and alphabet
+"""
+
+import re
+from typing import List, Tuple
+
+import numpy as np
+
+from .security_matcher import is_exception
+
+
+BASE64_ENTROPY_THRESHOLD = 4.5  # Bits per character
+HEX_ENTROPY_THRESHOLD = 3.0
+# Short tokens: fraction of the maximum entropy for their length (5th
+# percentile of random base64 keys of 20-40 chars)
+MIN_CONFIDENCE = 0.87
+MIN_TOKEN_LENGTH = 20
+DIGEST_HEX_LENGTHS = (40, 64)  # Commit/object SHAs and checksums, not secrets
+ENTROPY_RULES_VERSION = 2  # Bump whenever detection rules change (cache key)
+
+# String literals long enough to hold a candidate (one line, any quote style)
+_LITERAL = re.compile(
+    r'"[^"\n]{%d,}"|\'[^\'\n]{%d,}\'|`[^`\n]{%d,}`' % ((MIN_TOKEN_LENGTH,) * 3)
+)
+_TOKEN = re.compile(r'[A-Za-z0-9+/_\-]{%d,}={0,2}' % MIN_TOKEN_LENGTH)
+_HEX = re.compile(r'[0-9a-fA-F]+')
+_DIGIT = re.compile(r'[0-9]')
+
+
+def shannon_entropy(tokens: List[str]) -> np.ndarray:
+    """
+    Compute the Shannon entropy (bits per character) of many ASCII strings at once.
+
+    Args:
+        tokens: Non-empty ASCII strings
+
+    Returns:
+        np.ndarray: Entropy of each token, in input order
+
+    Example:
+        >>> shannon_entropy(['aaaa', 'abcd']).tolist()
+        [0.0, 2.0]
+    """
+    if not tokens:
+        return np.zeros(0)
+    lengths = np.fromiter(map(len, tokens), dtype=np.int64, count=len(tokens))
+    data = np.frombuffer(''.join(tokens).encode('ascii'), dtype=np.uint8)
+    owner = np.repeat(np.arange(len(tokens)), lengths)
+
+    # Count (token, byte) pairs, then sum -p*log2(p) per token
+    keys, counts = np.unique(owner * 256 + data, return_counts=True)
+    owner = keys // 256
+    probabilities = counts / lengths[owner]
+    return 0.0 - np.bincount(owner, weights=probabilities * np.log2(probabilities),
+                             minlength=len(tokens))
+
+
+def _is_candidate(token: str, is_hex: bool) -> bool:
+    """Reject tokens that are plain words, paths or identifiers."""
+    has_digit = _DIGIT.search(token) is not None
+    if is_hex:
+        return has_digit and not token.isdigit() and len(token) not in DIGEST_HEX_LENGTHS
+    has_upper = token.lower() != token
+    has_lower = token.upper() != token
+    return has_digit + has_upper + has_lower >= 2 and not is_exception(token)
+
+
+def find_high_entropy_strings(text: str) -> List[Tuple[int, str, str, str, float]]:
+    """
+    Find high-entropy tokens inside string literals of a file buffer.
+
+    Args:
+        text: Decoded file contents
+
+    Returns:
+        List of (line_number, secret_type, line_text, token, confidence)
+        tuples in file order; secret_type is 'high_entropy_base64' or
+        'high_entropy_hex'
+
+    Example:
+        >>> find_high_entropy_strings('url = "https://x.io/?c=Zx9Qr2LmT8vB4nWk7YpD3sHf"\\n')[0][1:]
+        ('high_entropy_base64', 'url = "https://x.io/?c=Zx9Qr2LmT8vB4nWk7YpD3sHf"',
+         'Zx9Qr2LmT8vB4nWk7YpD3sHf', 1.0)
+    """
+    starts, tokens, hex_flags = [], [], []
+    for literal in _LITERAL.finditer(text):
+        for token in _TOKEN.finditer(text, literal.start() + 1, literal.end() - 1):
+            value = token.group()
+            is_hex = _HEX.fullmatch(value) is not None
+            if _is_candidate(value, is_hex):
+                starts.append(token.start())
+                tokens.append(value)
+                hex_flags.append(is_hex)
+    if not tokens:
+        return []
+
+    entropy = shannon_entropy(tokens)
+    is_hex = np.array(hex_flags)
+    lengths = np.fromiter(map(len, tokens), dtype=np.float64, count=len(tokens))
+    alphabet = np.where(is_hex, 16.0, 64.0)
+    max_entropy = np.log2(np.minimum(lengths, alphabet))
+    threshold = np.minimum(np.where(is_hex, HEX_ENTROPY_THRESHOLD, BASE64_ENTROPY_THRESHOLD),
+                           MIN_CONFIDENCE * max_entropy)
+    confidence = np.clip(entropy / max_entropy, 0.0, 1.0)
+
+    findings = []
+    line_number, counted_to = 1, 0
+    for index in np.flatnonzero(entropy >= threshold):
+        start = starts[index]
+        line_number += text.count('\n', counted_to, start)
+        counted_to = start
+        line_start = text.rfind('\n', 0, start) + 1
+        line_end = text.find('\n', start)
+        line_text = text[line_start:line_end if line_end != -1 else len(text)]
+        secret_type = 'high_entropy_hex' if hex_flags[index] else 'high_entropy_base64'
+        findings.append((line_number, secret_type, line_text, tokens[index],
+                         round(float(confidence[index]), 2)))
+    return findings
@@ -4,19 +4,20 @@ File Size Analyzer Module
 Enforces the CRITICAL 150-line file size limit requirement.
 This is a strict academic requirement with NO EXCEPTIONS.
 
-Design Decision: Simple line counting approach for clarity and reliability.
+Design Decision: Byte-level newline counting (no decoding) for speed.
 Does not exclude comments/blanks - total file size matters for maintainability.
 """
 
 import os
 from typing import List, Dict
-from dataclasses import dataclass
 
+from ..models.compact import frozen_model
 from ..utils.file_finder import find_code_files
-from ..utils.line_counter import count_lines
+from ..utils.line_counter import exceeds_line_limit
+from ..utils.project_snapshot import ProjectSnapshot
 
 
-@dataclass
+@frozen_model
 class FileSizeViolation:
     """
     Represents a file that exceeds the size limit.
@@ -44,7 +45,8 @@ class FileSizeViolation:
 def check_file_sizes(
     project_path: str,
     limit: int = 150,
-    extensions: List[str] = None
+    extensions: List[str] = None,
+    snapshot: ProjectSnapshot = None
 ) -> List[FileSizeViolation]:
     """
     Check all code files for size limit violations.
@@ -57,6 +59,7 @@ def check_file_sizes(
         project_path: Root directory of project to analyze
         limit: Maximum allowed lines per file (default: 150)
         extensions: File extensions to check (default: ['.py', '.js', '.ts'])
+        snapshot: Pre-built project index (optional, avoids a directory walk)
 
     Returns:
         List[FileSizeViolation]: All files exceeding the limit
@@ -74,22 +77,24 @@ def check_file_sizes(
           src/main.py: 215 lines (exceeds limit by 65 lines)
           src/utils.py: 180 lines (exceeds limit by 30 lines)
     """
-    if not os.path.isdir(project_path):
+    if snapshot is None and not os.path.isdir(project_path):
         raise NotADirectoryError(f"Not a directory: {project_path}")
 
     if extensions is None:
         extensions = ['.py', '.js', '.ts']
 
-    # Find all code files
-    code_files = find_code_files(project_path, extensions=extensions)
+    if snapshot is not None:
+        candidates = [(e.path, e.size) for e in snapshot.files(extensions)]
+    else:
+        candidates = [(path, None) for path in find_code_files(project_path, extensions)]
 
     violations = []
 
-    for file_path in code_files:
+    for file_path, size in candidates:
         try:
-            line_count = count_lines(file_path)
+            line_count = exceeds_line_limit(file_path, limit, size)  # One read at most
 
-            if line_count > limit:
+            if line_count:
                 violation = FileSizeViolation(
                     file_path=file_path,
                     line_count=line_count,
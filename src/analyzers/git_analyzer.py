@@ -5,20 +5,36 @@ Analyzes git repository history and workflow quality.
 Evaluates commit count, message quality, and development progression.
 
 Requirements: Minimum 10 commits with meaningful messages.
+
+The whole history is read from one streamed git log (no commit cap);
+message quality is aggregated on the fly, so memory stays constant. The
+same pass feeds the commit timeline, so the score also reflects when the
+work was committed, not just how many commits there are.
 """
 
-from typing import Dict
+from typing import Dict, Optional
+
+from ..utils.git_commands import check_git_repo
+from ..utils.git_log_stream import count_commits, summarize_history
+from .commit_timeline import CommitTimeline
+from .contribution_analyzer import ContributionTracker
 
-from ..utils.git_commands import check_git_repo, get_commit_history
 
+LAST_MINUTE_CHURN = 0.5  # Over half of all lines changed in the final 24 hours
+MIN_ACTIVE_DAYS = 3
+MAX_BURSTINESS = 0.7  # Goh-Barabasi coefficient; 0 is random, 1 a single burst
 
-def assess_git_workflow(project_path: str, min_commits: int = 10) -> Dict:
+
+def assess_git_workflow(project_path: str, min_commits: int = 10,
+                        deadline: Optional[float] = None) -> Dict:
     """
     Assess git workflow quality.
 
     Args:
         project_path: Root directory of project
         min_commits: Minimum required commits (default: 10)
+        deadline: Submission deadline in unix seconds (optional; without
+            one the last-minute churn penalty is skipped)
 
     Returns:
         Dict with git assessment results and score (out of 10)
@@ -37,10 +53,9 @@ def assess_git_workflow(project_path: str, min_commits: int = 10) -> Dict:
             'message': 'Not a git repository'
         }
 
-    # Get commit history
-    commits = get_commit_history(project_path)
+    total_commits = count_commits(project_path)
 
-    if not commits:
+    if total_commits == 0:
         return {
             'score': 0,
             'max_score': 10,
@@ -50,15 +65,17 @@ def assess_git_workflow(project_path: str, min_commits: int = 10) -> Dict:
             'message': 'No commits found'
         }
 
-    # Analyze commits
-    total_commits = len(commits)
-    short_messages = sum(1 for c in commits if c.message_length < 10)
-    vague_messages = sum(1 for c in commits if not c.is_meaningful)
-
-    # Calculate score
+    # Analyze commits (message ratios over the commits actually streamed)
+    contributions = ContributionTracker()  # Per-author figures from the same pass
+    timeline = CommitTimeline()
+    stats = summarize_history(project_path, observers=[contributions, timeline])
+    distribution = timeline.report(deadline)
     score, message = _calculate_git_score(
-        total_commits, min_commits, short_messages, vague_messages
+        total_commits, min_commits, stats.short_messages, stats.vague_messages, stats.commits,
+        distribution
     )
+    if not stats.complete:
+        message += f' (message quality from the newest {stats.commits} commits; git log timed out)'
 
     return {
         'score': score,
@@ -66,15 +83,29 @@ def assess_git_workflow(project_path: str, min_commits: int = 10) -> Dict:
         'passed': score >= 7,  # 70% threshold
         'is_git_repo': True,
         'commit_count': total_commits,
-        'short_messages': short_messages,
-        'vague_messages': vague_messages,
-        'commits': commits[:10],  # First 10 for display
+        'analyzed_commits': stats.commits,
+        'history_complete': stats.complete,
+        'short_messages': stats.short_messages,
+        'vague_messages': stats.vague_messages,
+        'insertions': stats.insertions,
+        'deletions': stats.deletions,
+        'commits': stats.sample,  # Newest 10 for display
+        'contributors': contributions.report(),
+        'timeline': distribution,
         'message': message
     }
 
 
-def _calculate_git_score(total: int, min_req: int, short: int, vague: int) -> tuple:
-    """Calculate git score and build message."""
+def _calculate_git_score(total: int, min_req: int, short: int, vague: int,
+                         analyzed: int = None, timeline: Dict = None) -> tuple:
+    """
+    Calculate git score and build message; short/vague are out of analyzed commits.
+
+    The count and message penalties stay first-match (at most -5); the
+    timeline penalties (CommitTimeline report; None skips them) add up to
+    -3 on top, so the scale runs from 10 down to 2.
+    """
+    analyzed = total if analyzed is None else analyzed
     max_score = 10
     score = max_score
 
@@ -83,14 +114,28 @@ def _calculate_git_score(total: int, min_req: int, short: int, vague: int) -> tu
         score -= 5
         message = f'Only {total} commits (minimum: {min_req})'
     # Penalty for short messages (> 20%)
-    elif short > total * 0.2:
+    elif short > analyzed * 0.2:
         score -= 2
         message = f'{short} commits have short messages (< 10 chars)'
     # Penalty for vague messages (> 30%)
-    elif vague > total * 0.3:
+    elif vague > analyzed * 0.3:
         score -= 2
         message = f'{vague} commits have vague messages'
     else:
         message = f'{total} commits with good message quality'
 
-    return max(0, score), message
+    problems = []
+    if timeline:
+        # Penalty for a last-minute dump (needs a deadline to measure against)
+        if (timeline['final_day_churn'] or 0) > LAST_MINUTE_CHURN:
+            score -= 2
+            problems.append(f"{timeline['final_day_churn']:.0%} of changes in the final 24 hours")
+        # Penalty for work crammed into a few bursts
+        if (timeline['burstiness'] or 0) > MAX_BURSTINESS:
+            score -= 1
+            problems.append(f"bursty history (burstiness {timeline['burstiness']})")
+        elif timeline['active_days'] < MIN_ACTIVE_DAYS:
+            score -= 1
+            problems.append(f"commits on only {timeline['active_days']} day(s)")
+
+    return max(0, score), '; '.join([message] + problems)
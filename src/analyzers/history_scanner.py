@@ -0,0 +1,102 @@
+"""
+History Scanner Module
+
+Scans the full git history for hardcoded secrets, so a key that was
+committed and later deleted is still reported.
+
+Key Features:
+- Every unique blob reachable from any ref is scanned exactly once
+  (blobs are deduplicated by SHA, so history costs close to one
+  working-tree scan)
+- All blobs stream through one long-lived `git cat-file --batch` process
+- Findings name the commit that introduced the secret
+- Blobs under DEFAULT_IGNORE_DIRS (a committed venv/, node_modules/, ...)
+  are skipped, as in the working-tree scan
+"""
+
+import os
+from typing import List, Set
+
+from ..models.code_models import SecretFinding
+from ..utils.content_store import decode_text
+from ..utils.file_finder_config import DEFAULT_IGNORE_DIRS
+from ..utils.git_commands import check_git_repo
+from ..utils.git_objects import BlobReader, list_history_blobs, map_introducing_commits
+from .secret_baseline import filter_baselined
+from .security_matcher import find_secrets
+from .security_prefilter import ScanStats, candidate_spans
+from .security_scanner import DEFAULT_SCAN_EXTENSIONS, is_excluded_path
+
+
+def scan_history_for_secrets(
+    project_path: str,
+    extensions: List[str] = None,
+    stats: ScanStats = None,
+    baseline: Set[str] = None
+) -> List[SecretFinding]:
+    """
+    Scan every version of every file in the git history for secrets.
+
+    Args:
+        project_path: Root directory of git repo
+        extensions: File extensions to scan (default: DEFAULT_SCAN_EXTENSIONS)
+        stats: Collects prefilter statistics such as bytes skipped (optional)
+        baseline: Fingerprints of reviewed findings to suppress (optional)
+
+    Returns:
+        List[SecretFinding]: Detected secrets, each with the short hash of
+        the commit that introduced it; empty if not a git repository
+
+    Example:
+        >>> findings = scan_history_for_secrets('/path/to/repo')
+        >>> print(findings[0])
+        /path/to/repo/config.py@1a2b3c4d:3 - api_key: API_KEY = "..."...
+    """
+    if not check_git_repo(project_path):
+        return []
+    if extensions is None:
+        extensions = DEFAULT_SCAN_EXTENSIONS
+
+    blobs = list_history_blobs(project_path, extensions, DEFAULT_IGNORE_DIRS)
+    if not blobs:
+        return []
+    introduced_by, complete = map_introducing_commits(project_path)
+    if not complete:
+        print(f"Warning: git log did not finish in {project_path}; "
+              "some findings will not name their introducing commit")
+    findings = []
+
+    with BlobReader(project_path) as reader:
+        for sha, rel_path in blobs:
+            file_path = os.path.join(project_path, rel_path)
+            if is_excluded_path(file_path):
+                continue
+            try:
+                data = reader.read(sha)
+            except OSError as e:
+                print(f"Warning: Could not read git objects in {project_path}: {e}")
+                break
+            if data is None:
+                continue
+
+            text = decode_text(data)
+            spans = candidate_spans(text)
+            if stats is not None:
+                stats.record(len(text), spans)
+            commit = introduced_by.get(sha, '')[:8]  # Short hash, like CommitInfo
+            findings.extend(
+                SecretFinding(
+                    secret_type=secret_type,
+                    file_path=file_path,
+                    line_number=line_number,
+                    snippet=line_text.strip(),
+                    commit=commit,
+                    match=match_text
+                )
+                for line_number, secret_type, line_text, match_text
+                in find_secrets(text, spans)
+            )
+
+    if baseline:
+        return list(filter_baselined(findings, baseline, project_path))
+    return findings
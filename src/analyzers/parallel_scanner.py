@@ -0,0 +1,121 @@
+"""
+Parallel Scanner Module
+
+Process-pool secret scanning for large submissions. Regex evaluation is
+CPU-bound, so threads would serialize on the GIL; worker processes each
+scan one size-balanced shard of the file list.
+
+Key Features:
+- Longest-first shard balancing by byte size (see utils.sharding)
+- Deterministic output: findings merge back in input file order
+- Streaming results; abandoning the iterator cancels pending shards
+- Files already in the snapshot's AnalysisCache are served in this
+  process; only the misses are sharded, and their results are cached
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ..models.code_models import SecretFinding
+from ..utils.analysis_cache import MISSING, AnalysisCache
+from ..utils.cache_lookup import content_sha
+from ..utils.content_store import ContentStore
+from ..utils.sharding import shard_by_size
+from .secret_file_scanner import SECRET_CACHE_VERSION, scan_contents, secret_analyzer, with_path
+from .security_prefilter import ScanStats
+
+
+ScanResult = Tuple[int, List[Tuple[int, int]], List[SecretFinding]]  # See scan_contents
+
+
+def iter_files_parallel(
+    file_paths: List[str],
+    sizes: Dict[str, int],
+    workers: int,
+    stats: Optional[ScanStats] = None,
+    detect_entropy: bool = False,
+    cache: Optional[AnalysisCache] = None,
+    store: Optional[ContentStore] = None
+) -> Iterator[SecretFinding]:
+    """
+    Scan files for secrets across a process pool.
+
+    Findings are yielded in file_paths order as soon as the shard holding
+    each file is done. Closing the generator early cancels shards that
+    have not started and does not wait for running ones.
+
+    Args:
+        file_paths: Files to scan, in the order findings should be reported
+        sizes: Byte size of each file (used to balance the shards)
+        workers: Maximum number of worker processes
+        stats: Collects prefilter statistics (optional)
+        detect_entropy: Also report high-entropy string literals
+        cache: Persistent analysis cache (optional); hits never reach a worker
+        store: Shared content cache used to hash files for the cache (optional)
+
+    Returns:
+        Iterator[SecretFinding]: Same findings, in the same order, as
+        scanning file_paths one by one
+
+    Example:
+        >>> findings = list(iter_files_parallel(paths, sizes, workers=4))
+    """
+    analyzer = secret_analyzer(detect_entropy)
+    cached, shas = _cached_results(file_paths, analyzer, cache, store)
+    misses = ((path, sizes.get(path, 0)) for path in file_paths if path not in cached)
+    shards = shard_by_size(misses, workers)
+    pool = ProcessPoolExecutor(max_workers=len(shards)) if shards else None
+    finished = False
+    try:
+        futures = [pool.submit(_scan_shard, shard, detect_entropy) for shard in shards]
+        future_of = {path: future for shard, future in zip(shards, futures) for path in shard}
+
+        for path in file_paths:
+            result = cached.get(path, MISSING)
+            if result is MISSING:
+                result = future_of[path].result()[path]
+                if result is not None and shas.get(path) is not None:
+                    cache.put(shas[path], analyzer, SECRET_CACHE_VERSION, result)
+            if result is None:
+                continue  # Unreadable; the worker printed a warning
+            text_size, spans, findings = result
+            if stats is not None:
+                stats.record(text_size, spans)
+            yield from with_path(findings, path)
+        finished = True
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=finished, cancel_futures=True)
+
+
+def _cached_results(
+    file_paths: List[str],
+    analyzer: str,
+    cache: Optional[AnalysisCache],
+    store: Optional[ContentStore]
+) -> Tuple[Dict[str, ScanResult], Dict[str, Optional[str]]]:
+    """Look files up in the cache; return (hits by path, content SHA of each miss)."""
+    cached: Dict[str, ScanResult] = {}
+    shas: Dict[str, Optional[str]] = {}
+    if cache is None:
+        return cached, shas
+    for path in file_paths:
+        sha = content_sha(path, store)
+        value = cache.get(sha, analyzer, SECRET_CACHE_VERSION) if sha else MISSING
+        if value is MISSING:
+            shas[path] = sha
+        else:
+            cached[path] = value
+    return cached, shas
+
+
+def _scan_shard(file_paths: List[str], detect_entropy: bool) -> Dict[str, Optional[ScanResult]]:
+    """Worker entry point: scan one shard; None for files that could not be scanned."""
+    results: Dict[str, Optional[ScanResult]] = {}
+    for path in file_paths:
+        try:
+            results[path] = scan_contents(path, None, detect_entropy)
+        except Exception as e:
+            print(f"Warning: Could not scan {path}: {e}")
+            results[path] = None
+    return results
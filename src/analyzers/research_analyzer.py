@@ -11,6 +11,7 @@ import os
 from typing import Dict, List
 
 from ..utils.file_finder import find_code_files, find_markdown_files
+from ..utils.project_snapshot import ProjectSnapshot
 
 
 # Research-related file patterns
@@ -23,12 +24,13 @@ RESEARCH_INDICATORS = {
 }
 
 
-def find_research_documents(project_path: str) -> List[str]:
+def find_research_documents(project_path: str, snapshot: ProjectSnapshot = None) -> List[str]:
     """
     Find research-related documentation files.
 
     Args:
         project_path: Root directory to search
+        snapshot: Pre-built project index (optional, avoids a directory walk)
 
     Returns:
         List[str]: Paths to research documents
@@ -37,7 +39,7 @@ def find_research_documents(project_path: str) -> List[str]:
         >>> docs = find_research_documents('/path/to/project')
         >>> print(f"Found {len(docs)} research documents")
     """
-    md_files = find_markdown_files(project_path)
+    md_files = find_markdown_files(project_path, snapshot=snapshot)
     research_docs = []
 
     for doc_name in RESEARCH_INDICATORS['documentation']:
@@ -48,24 +50,23 @@ def find_research_documents(project_path: str) -> List[str]:
     return research_docs
 
 
-def find_parameter_files(project_path: str) -> List[str]:
+def find_parameter_files(project_path: str, snapshot: ProjectSnapshot = None) -> List[str]:
     """Find configuration/parameter files."""
-    all_files = []
-    for root, dirs, files in os.walk(project_path):
-        # Skip common ignore directories
-        dirs[:] = [d for d in dirs if d not in {'.git', 'node_modules', 'venv', '__pycache__'}]
+    if snapshot is None:
+        snapshot = ProjectSnapshot.build(project_path)
 
-        for file in files:
-            for pattern in RESEARCH_INDICATORS['config_files']:
-                if pattern in file.lower():
-                    all_files.append(os.path.join(root, file))
+    all_files = []
+    for entry in snapshot.entries:
+        for pattern in RESEARCH_INDICATORS['config_files']:
+            if pattern in entry.name.lower():
+                all_files.append(entry.path)
 
     return all_files
 
 
-def find_analysis_scripts(project_path: str) -> List[str]:
+def find_analysis_scripts(project_path: str, snapshot: ProjectSnapshot = None) -> List[str]:
     """Find analysis or experiment scripts."""
-    py_files = find_code_files(project_path, extensions=['.py'])
+    py_files = find_code_files(project_path, extensions=['.py'], snapshot=snapshot)
     analysis_scripts = []
 
     for script in py_files:
@@ -78,12 +79,13 @@ def find_analysis_scripts(project_path: str) -> List[str]:
     return analysis_scripts
 
 
-def evaluate_research_quality(project_path: str) -> Dict:
+def evaluate_research_quality(project_path: str, snapshot: ProjectSnapshot = None) -> Dict:
     """
     Evaluate research quality in a project.
 
     Args:
         project_path: Root directory of project
+        snapshot: Pre-built project index (built once here if not given)
 
     Returns:
         Dict with research evaluation results and score (out of 10)
@@ -92,10 +94,13 @@ def evaluate_research_quality(project_path: str) -> Dict:
         >>> result = evaluate_research_quality('/path/to/project')
         >>> print(f"Research Score: {result['score']}/10")
     """
-    # Find research artifacts
-    research_docs = find_research_documents(project_path)
-    param_files = find_parameter_files(project_path)
-    analysis_scripts = find_analysis_scripts(project_path)
+    if snapshot is None:
+        snapshot = ProjectSnapshot.build(project_path)
+
+    # Find research artifacts (all three share one traversal)
+    research_docs = find_research_documents(project_path, snapshot=snapshot)
+    param_files = find_parameter_files(project_path, snapshot=snapshot)
+    analysis_scripts = find_analysis_scripts(project_path, snapshot=snapshot)
 
     # Calculate score (out of 10)
     max_score = 10
@@ -0,0 +1,106 @@
+"""
+Secret Baseline Module
+
+Suppresses reviewed false positives (test keys in docs, starter-project
+placeholders) across regrades and across a class of similar projects.
+
+A baseline file stores one SHA-256 fingerprint per reviewed finding.
+Loading it yields a set, so each new finding is checked with a single
+O(1) lookup instead of being re-reviewed.
+
+Design Decision: The fingerprint covers (secret_type, normalized match,
+project-relative path) and deliberately NOT the line number, so edits
+elsewhere in a file do not invalidate the baseline.
+"""
+
+import hashlib
+import json
+import os
+from typing import Iterable, Iterator, Set
+
+from ..models.code_models import SecretFinding
+
+
+DEFAULT_BASELINE_PATH = os.path.join('config', 'secrets_baseline.json')
+BASELINE_VERSION = 1
+
+
+def normalize_match(text: str) -> str:
+    """Collapse whitespace so reformatting does not change a fingerprint."""
+    return ' '.join(text.split())
+
+
+def fingerprint(finding: SecretFinding, project_path: str) -> str:
+    """
+    Compute the baseline fingerprint of a finding.
+
+    Args:
+        finding: Detected secret
+        project_path: Root of the scanned project (paths are made relative)
+
+    Returns:
+        str: Hex SHA-256 of (secret_type, normalized match, relative path)
+
+    Example:
+        >>> fingerprint(finding, '/submissions/student-42') in load_baseline()
+        True
+    """
+    rel_path = os.path.relpath(finding.file_path, project_path).replace(os.sep, '/')
+    match = normalize_match(finding.match or finding.snippet)
+    key = '\0'.join((finding.secret_type, match, rel_path))
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def load_baseline(baseline_path: str = DEFAULT_BASELINE_PATH) -> Set[str]:
+    """
+    Load baseline fingerprints into a set.
+
+    Args:
+        baseline_path: Baseline JSON file
+
+    Returns:
+        Set[str]: Fingerprints; empty if the file does not exist
+
+    Raises:
+        ValueError: If the file is not a valid baseline
+    """
+    if not os.path.exists(baseline_path):
+        return set()
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid baseline file {baseline_path}: {e}") from e
+    if not isinstance(data, dict) or not isinstance(data.get('fingerprints'), list):
+        raise ValueError(f"Invalid baseline file {baseline_path}: missing 'fingerprints'")
+    return set(data['fingerprints'])
+
+
+def save_baseline(fingerprints: Iterable[str],
+                  baseline_path: str = DEFAULT_BASELINE_PATH) -> int:
+    """
+    Write fingerprints to a baseline file (sorted, for stable diffs).
+
+    Args:
+        fingerprints: Fingerprints of reviewed findings
+        baseline_path: Baseline JSON file to (over)write
+
+    Returns:
+        int: Number of fingerprints written
+    """
+    data = {'version': BASELINE_VERSION, 'fingerprints': sorted(set(fingerprints))}
+    with open(baseline_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+        f.write('\n')
+    return len(data['fingerprints'])
+
+
+def filter_baselined(
+    findings: Iterable[SecretFinding],
+    baseline: Set[str],
+    project_path: str
+) -> Iterator[SecretFinding]:
+    """Yield only findings whose fingerprint is not in the baseline."""
+    for finding in findings:
+        if fingerprint(finding, project_path) not in baseline:
+            yield finding
@@ -0,0 +1,131 @@
+"""
+Secret File Scanner Module
+
+Scans the contents of ONE file for secrets: anchor prefilter, compiled
+pattern matcher and (optionally) the entropy detector. Shared by the
+in-process and the process-pool scanners.
+
+Results can be served from the persistent AnalysisCache; the cache
+version is derived from the patterns and the entropy rules version, so
+editing either invalidates it.
+"""
+
+import hashlib
+from dataclasses import replace
+from typing import List, Optional, Tuple
+
+from ..models.code_models import SecretFinding
+from ..utils.analysis_cache import AnalysisCache
+from ..utils.cache_lookup import cached_call
+from ..utils.content_store import ContentStore, read_text
+from .entropy_detector import ENTROPY_RULES_VERSION, find_high_entropy_strings
+from .security_matcher import find_secrets
+from .security_patterns import EXCEPTION_PATTERNS, SECRET_PATTERNS
+from .security_prefilter import ScanStats, candidate_spans
+
+
+SECRET_CACHE_VERSION = '2-' + hashlib.sha1(
+    repr((SECRET_PATTERNS, EXCEPTION_PATTERNS, ENTROPY_RULES_VERSION)).encode('utf-8')
+).hexdigest()[:12]
+
+
+def scan_path(
+    file_path: str,
+    store: Optional[ContentStore] = None,
+    stats: Optional[ScanStats] = None,
+    detect_entropy: bool = False,
+    cache: Optional[AnalysisCache] = None
+) -> List[SecretFinding]:
+    """
+    Read and scan one file; unreadable files are reported and skipped.
+
+    Args:
+        file_path: File to scan
+        store: Shared content cache (optional)
+        stats: Collects prefilter statistics (optional)
+        detect_entropy: Also report high-entropy string literals
+        cache: Persistent analysis cache (optional, serves unchanged files)
+
+    Returns:
+        List[SecretFinding]: Secrets in the file, in line order
+    """
+    try:
+        text_size, spans, findings = cached_call(
+            cache, file_path, secret_analyzer(detect_entropy), SECRET_CACHE_VERSION,
+            lambda: scan_contents(file_path, store, detect_entropy), store
+        )
+    except Exception as e:
+        print(f"Warning: Could not scan {file_path}: {e}")
+        return []
+    if stats is not None:
+        stats.record(text_size, spans)
+    return with_path(findings, file_path)
+
+
+def secret_analyzer(detect_entropy: bool) -> str:
+    """AnalysisCache analyzer name for a scan configuration."""
+    return 'secrets+entropy' if detect_entropy else 'secrets'
+
+
+def with_path(findings: List[SecretFinding], file_path: str) -> List[SecretFinding]:
+    """Re-attach file_path to findings (cached ones may come from an identical file)."""
+    return [f if f.file_path == file_path else replace(f, file_path=file_path) for f in findings]
+
+
+def scan_contents(
+    file_path: str,
+    store: Optional[ContentStore],
+    detect_entropy: bool
+) -> Tuple[int, List[Tuple[int, int]], List[SecretFinding]]:
+    """Scan one file; returns (text size, candidate spans, findings), the cached payload."""
+    text = read_text(file_path, store)
+    spans = candidate_spans(text)
+    findings = scan_text(file_path, text, spans, detect_entropy) if spans or detect_entropy else []
+    return len(text), spans, findings
+
+
+def scan_text(
+    file_path: str,
+    text: str,
+    spans: List[Tuple[int, int]],
+    detect_entropy: bool = False
+) -> List[SecretFinding]:
+    """
+    Scan a file's contents (candidate spans only for named patterns).
+
+    Args:
+        file_path: Path reported in the findings
+        text: Decoded file contents
+        spans: Candidate line spans from candidate_spans
+        detect_entropy: Also report high-entropy string literals
+
+    Returns:
+        List[SecretFinding]: Pattern findings, then entropy findings on
+        lines no pattern reported
+    """
+    findings = [
+        SecretFinding(
+            secret_type=secret_type,
+            file_path=file_path,
+            line_number=line_number,
+            snippet=line_text.strip(),
+            match=match_text
+        )
+        for line_number, secret_type, line_text, match_text in find_secrets(text, spans)
+    ]
+    if detect_entropy:
+        flagged = {f.line_number for f in findings}
+        findings.extend(
+            SecretFinding(
+                secret_type=secret_type,
+                file_path=file_path,
+                line_number=line_number,
+                snippet=line_text.strip(),
+                confidence=confidence,
+                match=token
+            )
+            for line_number, secret_type, line_text, token, confidence
+            in find_high_entropy_strings(text)
+            if line_number not in flagged  # Already reported by a named pattern
+        )
+    return findings
@@ -0,0 +1,136 @@
+"""
+Security Matcher Module
+
+Compiles SECRET_PATTERNS and EXCEPTION_PATTERNS once and scans whole
+file buffers in a single regex pass, recovering line numbers from
+match offsets.
+
+Design Decision: Every secret pattern becomes one named alternative of
+a zero-width lookahead, so one finditer over the buffer visits every
+position where ANY pattern matches. Later patterns are re-checked at
+that position and per-pattern end offsets emulate finditer's
+non-overlapping matches, so findings are identical to running each
+pattern over each line separately. A first-character lookahead derived
+from the patterns lets the engine skip most start positions quickly.
+"""
+
+import re
+from typing import List, Optional, Set, Tuple
+
+from .security_patterns import SECRET_PATTERNS, EXCEPTION_PATTERNS
+
+
+def _single_line(pattern: str) -> str:
+    """Rewrite a line-level pattern so it cannot match across newlines."""
+    return pattern.replace('[^', '[^\\n').replace('\\s', '[^\\S\\n]')
+
+
+def _leading_chars(pattern: str) -> Optional[Set[str]]:
+    """Characters a pattern must start with, or None if not a simple literal start."""
+    if pattern.startswith('('):
+        depth = 0
+        for end, char in enumerate(pattern):
+            depth += {'(': 1, ')': -1}.get(char, 0)
+            if depth == 0:
+                break
+        if '(' in pattern[1:end] or pattern[end + 1:end + 2] in ('?', '*', '{'):
+            return None  # Nested or optional group
+        chars = set()
+        for alternative in pattern[1:end].split('|'):
+            leading = _leading_chars(alternative)
+            if leading is None:
+                return None
+            chars |= leading
+        return chars
+    if pattern[:1].isalnum() or pattern[:1] in ('-', '_'):
+        if pattern[1:2] not in ('?', '*', '{'):
+            return {pattern[0]}
+    return None
+
+
+def _first_char_guard(patterns: List[str]) -> str:
+    """Build a lookahead that lets the regex engine skip impossible start positions."""
+    chars = set()
+    for pattern in patterns:
+        leading = _leading_chars(pattern)
+        if leading is None:
+            return ''
+        chars |= leading
+    return '(?=[' + ''.join(sorted(re.escape(c) for c in chars)) + '])'
+
+
+# (secret_type, compiled pattern) pairs in SECRET_PATTERNS order
+_PATTERNS: List[Tuple[str, 're.Pattern']] = [
+    (secret_type, re.compile(_single_line(pattern), re.IGNORECASE))
+    for secret_type, patterns in SECRET_PATTERNS.items()
+    for pattern in patterns
+]
+
+_ANY_SECRET = re.compile(
+    _first_char_guard([p for patterns in SECRET_PATTERNS.values() for p in patterns]) + '(?=' + '|'.join(
+        f'(?P<p{index}>{compiled.pattern})' for index, (_, compiled) in enumerate(_PATTERNS)
+    ) + ')',
+    re.IGNORECASE
+)
+
+_ANY_EXCEPTION = re.compile(
+    '|'.join(f'(?:{pattern})' for pattern in EXCEPTION_PATTERNS), re.IGNORECASE
+)
+
+
+def is_exception(text: str) -> bool:
+    """Check if matched text is a known exception/placeholder."""
+    return _ANY_EXCEPTION.search(text) is not None
+
+
+def find_secrets(
+    text: str,
+    spans: List[Tuple[int, int]] = None
+) -> List[Tuple[int, str, str, str]]:
+    """
+    Find hardcoded secrets in a whole file buffer.
+
+    Args:
+        text: Decoded file contents
+        spans: Ordered (start, end) line-aligned offsets to search
+            (default: the whole buffer), e.g. from candidate_spans
+
+    Returns:
+        List of (line_number, secret_type, line_text, match_text) tuples, ordered by
+        line, then pattern, then position (the line-by-line scan order)
+
+    Example:
+        >>> find_secrets('x = 1\\npassword = "hunter22hunter"\\n')
+        [(2, 'password', 'password = "hunter22hunter"', 'password = "hunter22hunter"')]
+    """
+    if spans is None:
+        spans = [(0, len(text))]
+    hits = []  # (line_number, pattern_index, start, line_text, match_text)
+    last_end = [0] * len(_PATTERNS)
+    line_number, counted_to = 1, 0
+
+    for span_start, span_end in spans:
+        for found in _ANY_SECRET.finditer(text, span_start, span_end):
+            start = found.start()
+            for index in range(int(found.lastgroup[1:]), len(_PATTERNS)):
+                if start < last_end[index]:
+                    continue  # Overlaps this pattern's previous match
+                match = _PATTERNS[index][1].match(text, start, span_end)
+                if match is None:
+                    continue
+                last_end[index] = match.end()
+                if is_exception(match.group(0)):
+                    continue
+
+                line_number += text.count('\n', counted_to, start)
+                counted_to = start
+                line_start = text.rfind('\n', 0, start) + 1
+                line_end = text.find('\n', start)
+                line_text = text[line_start:line_end if line_end != -1 else len(text)]
+                hits.append((line_number, index, start, line_text, match.group(0)))
+
+    hits.sort()
+    return [
+        (line, _PATTERNS[index][0], line_text, match_text)
+        for line, index, _, line_text, match_text in hits
+    ]
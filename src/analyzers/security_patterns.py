@@ -46,3 +46,18 @@ EXCEPTION_PATTERNS = [
     r'<.*>',
     r'\{.*\}',
 ]
+
+# Literal anchors: every SECRET_PATTERNS match contains one of these
+# (case-insensitive). Lines without any anchor are never regex-scanned,
+# so a new pattern MUST be covered by an anchor here.
+SECRET_ANCHORS = [
+    'key',
+    'passw',
+    'pwd',
+    'secret',
+    'token',
+    'akia',
+    'ghp_',
+    'xox',
+    '-----begin',
+]
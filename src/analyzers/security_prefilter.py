@@ -0,0 +1,95 @@
+"""
+Security Prefilter Module
+
+Cheap literal-anchor prefilter for the secret scanner. Every secret
+pattern contains one of SECRET_ANCHORS, so files and lines without any
+anchor are skipped before a single secret regex runs.
+
+Design Decision: One compiled alternation of the anchor literals serves
+as the multi-literal matcher (the standard library has no Aho-Corasick).
+ASCII text is lowercased once and searched case-sensitively, which is
+far faster than an IGNORECASE alternation; non-ASCII text falls back to
+IGNORECASE so the anchors follow exactly the same case folding as the
+secret patterns themselves.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from .security_patterns import SECRET_ANCHORS
+
+
+_ANCHOR = re.compile('|'.join(re.escape(anchor) for anchor in SECRET_ANCHORS))
+_ANCHOR_IGNORECASE = re.compile(_ANCHOR.pattern, re.IGNORECASE)
+
+
+@dataclass
+class ScanStats:
+    """
+    Prefilter statistics for one secret scan.
+
+    Sizes are measured on decoded text (bytes for ASCII source).
+
+    Attributes:
+        files_scanned: Files with at least one anchor (regex-scanned)
+        files_skipped: Files without any anchor (never regex-scanned)
+        bytes_total: Size of all files read
+        bytes_skipped: Size of all text the secret regexes never saw
+    """
+    files_scanned: int = 0
+    files_skipped: int = 0
+    bytes_total: int = 0
+    bytes_skipped: int = 0
+
+    def record(self, text_size: int, spans: List[Tuple[int, int]]) -> None:
+        """Account for one file given its candidate spans."""
+        scanned = sum(end - start for start, end in spans)
+        if spans:
+            self.files_scanned += 1
+        else:
+            self.files_skipped += 1
+        self.bytes_total += text_size
+        self.bytes_skipped += text_size - scanned
+
+    def merge(self, other: 'ScanStats') -> None:
+        """Add the counts of another scan (e.g. from a worker process)."""
+        self.files_scanned += other.files_scanned
+        self.files_skipped += other.files_skipped
+        self.bytes_total += other.bytes_total
+        self.bytes_skipped += other.bytes_skipped
+
+
+def candidate_spans(text: str) -> List[Tuple[int, int]]:
+    """
+    Find runs of lines that contain at least one secret anchor.
+
+    Args:
+        text: Decoded file contents
+
+    Returns:
+        List of (start, end) offsets of line runs, in order; each end is
+        a newline position or len(text). Empty if the file has no anchor.
+
+    Example:
+        >>> candidate_spans('x = 1\\ntoken = "abc"\\ny = 2\\n')
+        [(6, 19)]
+    """
+    if text.isascii():
+        haystack, anchor = text.lower(), _ANCHOR
+    else:
+        haystack, anchor = text, _ANCHOR_IGNORECASE
+
+    spans: List[Tuple[int, int]] = []
+    found = anchor.search(haystack)
+    while found is not None:
+        line_start = text.rfind('\n', 0, found.start()) + 1
+        line_end = text.find('\n', found.end())
+        if line_end == -1:
+            line_end = len(text)
+        if spans and line_start == spans[-1][1] + 1:
+            spans[-1] = (spans[-1][0], line_end)  # Extend run of adjacent lines
+        else:
+            spans.append((line_start, line_end))
+        found = anchor.search(haystack, line_end)
+    return spans
@@ -5,95 +5,138 @@ Detects hardcoded secrets and security vulnerabilities in source code.
 This is a CRITICAL security check - hardcoded secrets result in auto-fail.
 
 Key Features:
-- Regex-based secret detection
+- Regex-based secret detection (all patterns compiled into one pass)
+- Literal-anchor prefilter skips files and lines that cannot hold a secret
+- Optional NumPy entropy detector for unnamed random-looking strings
 - Multiple secret types (API keys, passwords, tokens, AWS keys, etc.)
 - Line-level reporting for easy fixing
+- Optional process-pool mode with size-balanced shards
+- Streaming iter_secrets API with early exit (stop_after) for auto-fail
+- Baseline fingerprints suppress reviewed false positives in O(1)
 """
 
-import re
-from typing import List
+from contextlib import closing
+from itertools import islice
+from typing import Iterator, List, Optional, Set
 
 from ..utils.file_finder import find_code_files
+from ..utils.project_snapshot import ProjectSnapshot
+from ..utils.sharding import file_sizes
 from ..models.code_models import SecretFinding
-from .security_patterns import SECRET_PATTERNS, EXCEPTION_PATTERNS
+from .parallel_scanner import iter_files_parallel
+from .secret_baseline import filter_baselined
+from .secret_file_scanner import scan_path
+from .security_prefilter import ScanStats
+
+
+DEFAULT_SCAN_EXTENSIONS = ['.py', '.js', '.ts', '.env', '.yaml', '.yml', '.json']
+PARALLEL_MIN_BYTES = 1024 * 1024  # Smaller scans finish before a pool starts
 
 
 def scan_for_secrets(
     project_path: str,
-    extensions: List[str] = None
+    extensions: List[str] = None,
+    snapshot: ProjectSnapshot = None,
+    stats: ScanStats = None,
+    detect_entropy: bool = False,
+    workers: int = 1,
+    stop_after: int = None,
+    baseline: Set[str] = None
 ) -> List[SecretFinding]:
     """
     Scan project for hardcoded secrets.
 
     Args:
         project_path: Root directory to scan
-        extensions: File extensions to scan (default: ['.py', '.js', '.ts'])
+        extensions: File extensions to scan (default: DEFAULT_SCAN_EXTENSIONS)
+        snapshot: Pre-built project index (optional, avoids a directory walk)
+        stats: Collects prefilter statistics such as bytes skipped (optional)
+        detect_entropy: Also report high-entropy string literals (whole files
+            are scanned, since these have no anchor keyword)
+        workers: Worker processes for size-balanced parallel scanning
+            (default: 1, scan in this process)
+        stop_after: Stop scanning after this many findings (default: all);
+            stop_after=1 is enough to decide an auto-fail
+        baseline: Fingerprints of reviewed findings to suppress (see
+            secret_baseline.load_baseline); not counted by stop_after
 
     Returns:
-        List[SecretFinding]: All detected secrets
+        List[SecretFinding]: Detected secrets, in file then line order
 
     Example:
-        >>> findings = scan_for_secrets('/path/to/project')
+        >>> findings = scan_for_secrets('/path/to/project', workers=4)
         >>> if findings:
         ...     print(f"CRITICAL: Found {len(findings)} hardcoded secrets!")
         CRITICAL: Found 2 hardcoded secrets!
     """
-    if extensions is None:
-        extensions = ['.py', '.js', '.ts', '.env', '.yaml', '.yml', '.json']
-
-    code_files = find_code_files(project_path, extensions=extensions)
-    findings = []
-
-    for file_path in code_files:
-        # Skip .env.example files (they're supposed to have placeholders)
-        if file_path.endswith('.env.example'):
-            continue
-
-        # Skip test fixtures (they contain intentional test data)
-        if '/fixtures/' in file_path.replace('\\', '/') or '\\fixtures\\' in file_path:
-            continue
-
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
+    return list(iter_secrets(
+        project_path, extensions, snapshot, stats, detect_entropy, workers, stop_after, baseline
+    ))
 
-            findings.extend(_scan_file(file_path, lines))
 
-        except Exception as e:
-            print(f"Warning: Could not scan {file_path}: {e}")
-            continue
-
-    return findings
+def iter_secrets(
+    project_path: str,
+    extensions: List[str] = None,
+    snapshot: ProjectSnapshot = None,
+    stats: ScanStats = None,
+    detect_entropy: bool = False,
+    workers: int = 1,
+    stop_after: int = None,
+    baseline: Set[str] = None
+) -> Iterator[SecretFinding]:
+    """
+    Yield hardcoded secrets as soon as each file has been scanned.
 
+    Takes the same arguments as scan_for_secrets. Files are scanned lazily:
+    breaking out of the loop (or closing the generator) skips the rest of
+    the scan and cancels pending worker shards.
 
-def _scan_file(file_path: str, lines: List[str]) -> List[SecretFinding]:
-    """Scan a single file for secrets."""
-    findings = []
+    Example:
+        >>> first = next(iter_secrets('/path/to/project'), None)
+        >>> if first is not None:
+        ...     print(f"CRITICAL: {first}")  # Auto-fail, skip remaining analyzers
+    """
+    findings = _iter_findings(project_path, extensions, snapshot, stats, detect_entropy, workers)
+    with closing(findings):
+        reported = filter_baselined(findings, baseline, project_path) if baseline else findings
+        yield from islice(reported, stop_after)
 
-    for line_num, line in enumerate(lines, start=1):
-        for secret_type, patterns in SECRET_PATTERNS.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, line, re.IGNORECASE)
 
-                for match in matches:
-                    # Check if it's an exception (placeholder)
-                    if _is_exception(match.group(0)):
-                        continue
+def _iter_findings(
+    project_path: str,
+    extensions: Optional[List[str]],
+    snapshot: Optional[ProjectSnapshot],
+    stats: Optional[ScanStats],
+    detect_entropy: bool,
+    workers: int
+) -> Iterator[SecretFinding]:
+    """Scan files in sorted order, in-process or across a process pool."""
+    if extensions is None:
+        extensions = DEFAULT_SCAN_EXTENSIONS
+
+    code_files = [
+        path for path in find_code_files(project_path, extensions=extensions, snapshot=snapshot)
+        if not is_excluded_path(path)
+    ]
+    store = snapshot.store if snapshot else None
+    cache = snapshot.cache if snapshot else None
+    if workers > 1 and len(code_files) > 1:
+        sizes = file_sizes(code_files, snapshot)
+        if sum(sizes.values()) >= PARALLEL_MIN_BYTES:
+            yield from iter_files_parallel(
+                code_files, sizes, workers, stats, detect_entropy, cache, store
+            )
+            return
 
-                    finding = SecretFinding(
-                        secret_type=secret_type,
-                        file_path=file_path,
-                        line_number=line_num,
-                        snippet=line.strip()
-                    )
-                    findings.append(finding)
+    for file_path in code_files:
+        yield from scan_path(file_path, store, stats, detect_entropy, cache)
 
-    return findings
 
+def is_excluded_path(file_path: str) -> bool:
+    """Check if a file is expected to hold placeholder or test secrets."""
+    # Skip .env.example files (they're supposed to have placeholders)
+    if file_path.endswith('.env.example'):
+        return True
 
-def _is_exception(text: str) -> bool:
-    """Check if matched text is a known exception/placeholder."""
-    for exception_pattern in EXCEPTION_PATTERNS:
-        if re.search(exception_pattern, text, re.IGNORECASE):
-            return True
-    return False
+    # Skip test fixtures (they contain intentional test data)
+    return '/fixtures/' in file_path.replace('\\', '/') or '\\fixtures\\' in file_path
@@ -9,17 +9,31 @@ Target: 70% minimum coverage, 90% for critical paths.
 
 from typing import Dict
 
+from ..parsers.parallel_summaries import summarize_files
 from ..utils.file_finder import find_test_files
+from ..utils.project_snapshot import ProjectSnapshot
 from .test_counter import analyze_test_file
+from .test_runner import TEST_COVERAGE_MIN
 
 
-def evaluate_tests(project_path: str, language: str = 'python') -> Dict:
+LOW_COVERAGE_PENALTY = 5  # Points off (of 15) when measured coverage < TEST_COVERAGE_MIN
+
+
+def evaluate_tests(
+    project_path: str,
+    language: str = 'python',
+    snapshot: ProjectSnapshot = None,
+    execution: Dict = None
+) -> Dict:
     """
     Evaluate test suite quality and coverage.
 
     Args:
         project_path: Root directory of project
         language: Programming language (default: 'python')
+        snapshot: Pre-built project index (optional, avoids a directory walk)
+        execution: run_test_suite / run_cohort_tests result for this project
+            (optional); its measured coverage is scored against 70%
 
     Returns:
         Dict with test evaluation results and score (out of 15)
@@ -29,7 +43,8 @@ def evaluate_tests(project_path: str, language: str = 'python') -> Dict:
         >>> print(f"Test Score: {result['score']}/15")
         Test Score: 12/15
     """
-    test_files = find_test_files(project_path, language)
+    test_files = find_test_files(project_path, language, snapshot=snapshot)
+    store = snapshot.store if snapshot else None
 
     if not test_files:
         return {
@@ -44,26 +59,38 @@ def evaluate_tests(project_path: str, language: str = 'python') -> Dict:
 
     # Analyze all test files
     total_tests = 0
+    total_cases = 0
     total_assertions = 0
     file_results = []
 
+    # Shared with the docstring/naming/complexity passes via the snapshot
+    summaries = summarize_files([f for f in test_files if f.endswith('.py')], snapshot)
+
     for test_file in test_files:
-        result = analyze_test_file(test_file)
+        result = analyze_test_file(test_file, store, summaries.get(test_file))
         file_results.append(result)
 
         if 'num_tests' in result:
             total_tests += result['num_tests']
-            total_assertions += result.get('num_assertions', 0)
+            total_cases += result['num_cases']
+            total_assertions += result['num_assertions']
 
     # Calculate score using helper
     score, message = _calculate_test_score(total_tests, total_assertions)
+    coverage = execution.get('coverage') if execution else None
+    if total_tests and coverage is not None and coverage < TEST_COVERAGE_MIN:
+        score = max(0, score - LOW_COVERAGE_PENALTY)
+        message += f'; coverage {coverage:.0%} is below {TEST_COVERAGE_MIN:.0%}'
 
     return {
         'score': score,
         'max_score': 15,
         'passed': score >= 10.5,  # 70% threshold
+        'coverage': coverage,
+        'execution': execution,
         'test_files_found': len(test_files),
         'total_tests': total_tests,
+        'total_cases': total_cases,
         'total_assertions': total_assertions,
         'has_tests': total_tests > 0,
         'file_results': file_results,
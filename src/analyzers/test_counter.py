@@ -3,18 +3,34 @@ Test Counter Module
 
 Counts and analyzes test functions in test files.
 Provides metrics for test quality evaluation.
+
+Python test files are measured from their ModuleSummary, so the metrics
+come out of the same parse the docstring, naming and complexity checks
+use. Test collection follows pytest's defaults: test* functions and
+test* methods of Test* classes, sync or async. Assertions are AST nodes,
+so 'assert' inside strings and comments is not counted.
 """
 
 import re
-from typing import Dict
+from typing import Dict, Optional
+
+from ..models.code_models import ModuleSummary
+from ..parsers.module_summary import NOT_SUMMARIZED, summarize_file
+from ..parsers.test_detection import is_test_class, is_test_name
+from ..utils.content_store import ContentStore, read_text
+
+
+# Fallback for files that are not parseable Python
+TEST_DEF_PATTERN = re.compile(r'^\s*def\s+(test_\w+)\s*\(', re.MULTILINE)
 
 
-def count_python_tests(file_path: str) -> int:
+def count_python_tests(file_path: str, store: ContentStore = None) -> int:
     """
     Count test functions in a Python test file.
 
     Args:
         file_path: Path to test file
+        store: Shared content cache (optional)
 
     Returns:
         int: Number of test functions found
@@ -23,54 +39,83 @@ def count_python_tests(file_path: str) -> int:
         >>> count = count_python_tests('test_example.py')
         >>> print(f"Found {count} tests")
     """
-    try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-
-        # Match test function definitions
-        test_pattern = r'^\s*def\s+(test_\w+)\s*\('
-        tests = re.findall(test_pattern, content, re.MULTILINE)
-
-        return len(tests)
-    except Exception:
-        return 0
+    return analyze_test_file(file_path, store).get('num_tests', 0)
 
 
-def analyze_test_file(file_path: str) -> Dict:
+def analyze_test_file(
+    file_path: str,
+    store: ContentStore = None,
+    summary: Optional[ModuleSummary] = NOT_SUMMARIZED
+) -> Dict:
     """
     Analyze a single test file for quality metrics.
 
     Args:
         file_path: Path to test file
+        store: Shared content cache (optional)
+        summary: Pre-built module summary, None if it failed to parse or
+            is not Python (optional, avoids a parse)
 
     Returns:
-        Dict with test metrics (num_tests, num_assertions, has_docstrings, lines)
+        Dict with num_tests, num_cases (after parametrize expansion),
+        num_assertions, assertions_per_test, fixtures, has_docstrings and lines
 
     Example:
         >>> metrics = analyze_test_file('test_example.py')
         >>> print(f"Tests: {metrics['num_tests']}, Assertions: {metrics['num_assertions']}")
     """
+    if summary is NOT_SUMMARIZED:
+        summary = summarize_file(file_path, store) if file_path.endswith('.py') else None
+    if summary is None:
+        return _analyze_text(file_path, store)
+
+    tests = [(func.name, func) for func in summary.functions
+             if func.depth == 0 and is_test_name(func.name)]
+    tests += [
+        (f"{cls.name}.{method.name}", method)
+        for cls in summary.classes if cls.depth == 0 and is_test_class(cls.name)
+        for method in cls.methods if is_test_name(method.name)
+    ]
+    defs = list(summary.functions) + summary.methods
+
+    return {
+        'file_path': file_path,
+        'num_tests': len(tests),
+        'num_cases': sum(func.cases for _, func in tests),
+        'num_async_tests': sum(func.is_async for _, func in tests),
+        # Helpers called from tests assert too, so every def counts here
+        'num_assertions': sum(func.assertions for func in defs),
+        'assertions_per_test': {name: func.assertions for name, func in tests},
+        'fixtures': [func.name for func in defs if func.is_fixture],
+        'has_docstrings': any(func.has_docstring for _, func in tests),
+        'lines': _line_total(file_path, store)
+    }
+
+
+def _analyze_text(file_path: str, store: ContentStore = None) -> Dict:
+    """Regex metrics for non-Python or unparseable test files."""
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-
-        num_tests = count_python_tests(file_path)
-
-        # Count assertions (simple heuristic)
-        assertions = len(re.findall(r'\bassert\b', content))
-
-        # Check for docstrings in tests
-        has_docstrings = bool(re.search(r'def test_\w+\([^)]*\):\s*"""', content))
-
-        return {
-            'file_path': file_path,
-            'num_tests': num_tests,
-            'num_assertions': assertions,
-            'has_docstrings': has_docstrings,
-            'lines': len(content.split('\n'))
-        }
+        content = read_text(file_path, store)
     except Exception as e:
-        return {
-            'file_path': file_path,
-            'error': str(e)
-        }
+        return {'file_path': file_path, 'error': str(e)}
+
+    num_tests = len(TEST_DEF_PATTERN.findall(content))
+    return {
+        'file_path': file_path,
+        'num_tests': num_tests,
+        'num_cases': num_tests,
+        'num_async_tests': 0,
+        'num_assertions': len(re.findall(r'\bassert\b', content)),
+        'assertions_per_test': {},
+        'fixtures': [],
+        'has_docstrings': bool(re.search(r'def test_\w+\([^)]*\):\s*"""', content)),
+        'lines': content.count('\n') + 1
+    }
+
+
+def _line_total(file_path: str, store: ContentStore = None) -> int:
+    """Line count as in the text metrics (served from the store after a parse)."""
+    try:
+        return read_text(file_path, store).count('\n') + 1
+    except OSError:
+        return 0
@@ -0,0 +1,137 @@
+"""
+Test Runner Module
+
+Executes a submission's pytest suite under the line_coverage collector
+in the sandbox and reports pass/fail counts and measured line coverage,
+overall and per file - the figure that test_coverage_min (0.70) in
+grading_config.yaml is checked against. The collector uses
+sys.monitoring on Python 3.12+, so coverage adds little to the run time.
+
+The submission is copied into a scratch directory first (only the files
+in its ProjectSnapshot, so venvs, .git and caches are left behind); the
+tests can write anywhere there without touching the original checkout.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+from typing import Dict, Optional
+
+from ..utils import line_coverage
+from ..utils.coverage_report import coverage_fractions
+from ..utils.project_snapshot import ProjectSnapshot
+from ..utils.sandbox import DEFAULT_MEMORY_MB, DEFAULT_TIMEOUT, run_sandboxed, sandbox_env
+
+
+TEST_COVERAGE_MIN = 0.70  # thresholds.test_coverage_min in grading_config.yaml
+COVERAGE_OMIT = ('*/tests/*', '*/test_*.py', '*_test.py', '*/conftest.py')  # Tests don't count
+COLLECTOR = os.path.abspath(line_coverage.__file__)  # Runs as a script in any environment
+_PYTEST_STATUS = {0: 'passed', 1: 'failed', 5: 'no_tests'}  # Anything else: 'error'
+
+
+def run_test_suite(
+    project_path: str,
+    snapshot: ProjectSnapshot = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    memory_mb: int = DEFAULT_MEMORY_MB,
+    python: str = sys.executable
+) -> Dict:
+    """
+    Run a submission's tests under coverage in a sandboxed subprocess.
+
+    Args:
+        project_path: Root directory of the submission
+        snapshot: Pre-built project index (optional, avoids a directory walk)
+        timeout: Wall-clock limit for the whole run in seconds
+        memory_mb: Address-space limit in MB
+        python: Interpreter with pytest installed
+
+    Returns:
+        Dict with status ('passed', 'failed', 'no_tests', 'timeout' or
+        'error'), tests_run, failures, errors, skipped, coverage (0-1 or
+        None), file_coverage (relative path -> 0-1), duration and output
+        (tail of the pytest output)
+
+    Example:
+        >>> result = run_test_suite('/path/to/project', timeout=120)
+        >>> print(result['status'], result['coverage'])
+        passed 0.83
+    """
+    if snapshot is None:
+        snapshot = ProjectSnapshot.build(project_path)
+
+    with tempfile.TemporaryDirectory(prefix='autograder_run_') as scratch:
+        work = os.path.join(scratch, 'work')
+        _copy_tree(snapshot, work)
+        os.mkdir(os.path.join(scratch, 'home'))
+        env = sandbox_env(os.path.join(scratch, 'home'))
+        junit = os.path.join(scratch, 'junit.xml')
+        report = os.path.join(scratch, 'lines.json')
+
+        run = run_sandboxed([
+            python, COLLECTOR, '--source', work, '--omit', ','.join(COVERAGE_OMIT),
+            '--output', report, '-m', 'pytest', '-q', '-p', 'no:cacheprovider',
+            '-o', 'addopts=', f'--junitxml={junit}'
+        ], work, env, timeout, memory_mb)
+
+        counts = _junit_counts(junit)
+        executed = _executed_lines(report) if counts is not None else None
+        coverage, file_coverage = None, {}
+        if executed is not None:
+            coverage, file_coverage = coverage_fractions(snapshot, work, executed, COVERAGE_OMIT)
+
+        if run.timed_out:
+            status = 'timeout'
+        elif counts is None:
+            status = 'error'
+        else:
+            status = _PYTEST_STATUS.get(run.returncode, 'error')
+
+        tests_run, failures, errors, skipped = counts or (0, 0, 0, 0)
+        return {
+            'status': status,
+            'tests_run': tests_run,
+            'failures': failures,
+            'errors': errors,
+            'skipped': skipped,
+            'coverage': coverage,
+            'file_coverage': file_coverage,
+            'duration': round(run.duration, 2),
+            'output': run.stdout + run.stderr
+        }
+
+
+def _copy_tree(snapshot: ProjectSnapshot, target: str) -> None:
+    """Copy every snapshot file into target, keeping relative paths."""
+    for entry in snapshot.entries:
+        destination = os.path.join(target, *entry.rel_path.split('/'))
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        try:
+            shutil.copyfile(entry.path, destination)
+        except OSError:
+            continue  # Vanished or unreadable; tests needing it will fail
+
+
+def _junit_counts(path: str) -> Optional[tuple]:
+    """(tests, failures, errors, skipped) from a JUnit XML report."""
+    try:
+        root = ET.parse(path).getroot()
+    except (OSError, ET.ParseError):
+        return None
+    suites = [root] if root.tag == 'testsuite' else root.findall('testsuite')
+    return tuple(
+        sum(int(suite.get(field, 0)) for suite in suites)
+        for field in ('tests', 'failures', 'errors', 'skipped')
+    )
+
+
+def _executed_lines(path: str) -> Optional[Dict]:
+    """Executed lines per file written by the collector."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
@@ -10,15 +10,18 @@ Focus: Command-line tools, documentation clarity, error handling.
 from typing import Dict
 
 from ..validators.readme_validator import check_readme_usability
+from ..utils.content_store import read_text
 from ..utils.file_finder import find_code_files
+from ..utils.project_snapshot import ProjectSnapshot
 
 
-def check_cli_help(project_path: str) -> Dict:
+def check_cli_help(project_path: str, snapshot: ProjectSnapshot = None) -> Dict:
     """
     Check for CLI help implementation in Python files.
 
     Args:
         project_path: Root directory of project
+        snapshot: Pre-built project index (optional, avoids a directory walk)
 
     Returns:
         Dict with CLI help metrics (score out of 3)
@@ -27,14 +30,14 @@ def check_cli_help(project_path: str) -> Dict:
         >>> result = check_cli_help('/path/to/project')
         >>> print(f"CLI help score: {result['score']}/3")
     """
-    py_files = find_code_files(project_path, extensions=['.py'])
+    py_files = find_code_files(project_path, extensions=['.py'], snapshot=snapshot)
+    store = snapshot.store if snapshot else None
     has_argparse = False
     has_help_flag = False
 
     for py_file in py_files:
         try:
-            with open(py_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            content = read_text(py_file, store)
 
             # Check for argparse usage
             if 'argparse' in content or 'ArgumentParser' in content:
@@ -62,12 +65,13 @@ def check_cli_help(project_path: str) -> Dict:
     }
 
 
-def evaluate_ux_quality(project_path: str) -> Dict:
+def evaluate_ux_quality(project_path: str, snapshot: ProjectSnapshot = None) -> Dict:
     """
     Evaluate overall UX quality.
 
     Args:
         project_path: Root directory of project
+        snapshot: Pre-built project index (optional, avoids a directory walk)
 
     Returns:
         Dict with UX evaluation results and score (out of 10)
@@ -77,10 +81,10 @@ def evaluate_ux_quality(project_path: str) -> Dict:
         >>> print(f"UX Score: {result['score']}/10")
     """
     # Check README usability (max 4 points)
-    readme_result = check_readme_usability(project_path)
+    readme_result = check_readme_usability(project_path, snapshot=snapshot)
 
     # Check CLI help (max 3 points)
-    cli_result = check_cli_help(project_path)
+    cli_result = check_cli_help(project_path, snapshot=snapshot)
 
     # Calculate total score
     score = readme_result['score'] + cli_result['score']
@@ -2,13 +2,20 @@
 Code Analysis Data Models
 
 Dataclasses for code quality analysis results.
+
+All models are frozen and (on Python 3.10+) slotted: no per-instance
+__dict__, and safe to share between analyzers and caches. Models with
+only scalar fields are hashable; ClassInfo and ModuleSummary hold lists
+and are not.
 """
 
-from dataclasses import dataclass
-from typing import Optional, List
+from dataclasses import field
+from typing import Optional, List, Tuple
+
+from .compact import frozen_model
 
 
-@dataclass
+@frozen_model
 class DocstringViolation:
     """Represents a missing docstring."""
     file_path: str
@@ -20,7 +27,7 @@ class DocstringViolation:
         return f"{self.item_type} '{self.item_name}' at {self.file_path}:{self.line_number}"
 
 
-@dataclass
+@frozen_model
 class FunctionInfo:
     """Information about a function definition."""
     name: str
@@ -29,9 +36,16 @@ class FunctionInfo:
     docstring: Optional[str]
     num_params: int
     is_method: bool = False
+    is_async: bool = False
+    depth: int = 0  # Enclosing function/class scopes (0 = module level)
+    complexity: int = 1  # McCabe cyclomatic complexity
+    assertions: int = 0  # assert statements, assert* calls and pytest.raises
+    cases: int = 1  # Test cases after literal pytest.mark.parametrize expansion
+    is_fixture: bool = False
+    arg_names: Tuple[str, ...] = ()  # Positional parameters (fixture requests for tests)
 
 
-@dataclass
+@frozen_model
 class ClassInfo:
     """Information about a class definition."""
     name: str
@@ -39,9 +53,30 @@ class ClassInfo:
     has_docstring: bool
     docstring: Optional[str]
     methods: List[FunctionInfo]
+    depth: int = 0  # Enclosing function/class scopes (0 = module level)
+
+
+@frozen_model
+class ModuleSummary:
+    """
+    Compact structural summary of one Python module.
+
+    Attributes:
+        docstring: Module docstring, or None
+        functions: Functions that are not methods (module-level and nested)
+        classes: All classes (including nested); each holds its own methods
+    """
+    docstring: Optional[str]
+    functions: List[FunctionInfo] = field(default_factory=list)
+    classes: List[ClassInfo] = field(default_factory=list)
+
+    @property
+    def methods(self) -> List[FunctionInfo]:
+        """All methods of all classes, in class order."""
+        return [method for cls in self.classes for method in cls.methods]
 
 
-@dataclass
+@frozen_model
 class SecretFinding:
     """
     Represents a detected secret in code.
@@ -52,21 +87,28 @@ class SecretFinding:
         line_number: Line number where secret was found
         snippet: Code snippet showing the secret (truncated)
         severity: Always 'critical' for secrets
+        commit: Commit that introduced the secret ('' for working-tree scans)
+        confidence: 1.0 for pattern matches; entropy ratio for entropy findings
+        match: Exact text that matched (used for baseline fingerprints)
     """
     secret_type: str
     file_path: str
     line_number: int
     snippet: str
     severity: str = 'critical'
+    commit: str = ''
+    confidence: float = 1.0
+    match: str = ''
 
     def __str__(self) -> str:
+        location = f"{self.file_path}@{self.commit}" if self.commit else self.file_path
         return (
-            f"{self.file_path}:{self.line_number} - "
+            f"{location}:{self.line_number} - "
             f"{self.secret_type}: {self.snippet[:60]}..."
         )
 
 
-@dataclass
+@frozen_model
 class NamingViolation:
     """Represents a naming convention violation."""
     file_path: str
@@ -77,7 +119,25 @@ class NamingViolation:
     severity: str = 'minor'
 
 
-@dataclass
+@frozen_model
+class ComplexityViolation:
+    """Represents a function whose cyclomatic complexity exceeds the limit."""
+    file_path: str
+    item_type: str  # 'function' or 'method'
+    item_name: str
+    line_number: int
+    complexity: int
+    limit: int
+    severity: str = 'minor'
+
+    def __str__(self) -> str:
+        return (
+            f"{self.item_type} '{self.item_name}' at {self.file_path}:{self.line_number} "
+            f"has complexity {self.complexity} (limit {self.limit})"
+        )
+
+
+@frozen_model
 class DocumentIssue:
     """Represents a documentation issue."""
     doc_name: str
@@ -0,0 +1,96 @@
+"""
+Compact Model Utilities
+
+Memory-lean building blocks for result models that can number in the
+hundreds of thousands on pathological submissions (and are held for
+every project of a cohort at once).
+
+Key Features:
+- frozen_model: frozen dataclasses with __slots__ (no per-instance
+  __dict__) on Python 3.10+; plain frozen dataclasses on older versions
+- ViolationTable: columnar container storing one list/array per field,
+  with interned path strings, that rebuilds model objects on access
+
+Design Decision: ViolationTable is a read-only Sequence, so existing
+code that iterates, indexes, slices, counts, concatenates or compares
+violation lists keeps working unchanged. Slices and concatenations are
+plain lists; code that needs a real list (e.g. to JSON-serialize or
+mutate it) calls list(table).
+"""
+
+import sys
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
+from functools import partial
+from typing import Any, Iterable, Iterator, List, Union
+
+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+frozen_model = partial(dataclass, frozen=True, **_SLOTS)
+
+_ARRAY_CODES = {int: 'q', float: 'd'}
+
+
+class ViolationTable(Sequence):
+    """
+    Columnar, append-only sequence of model records (e.g. violations).
+
+    Example:
+        >>> table = ViolationTable(NamingViolation)
+        >>> table.extend(result['violations'])
+        >>> table.column('line_number')[:3]
+        array('q', [4, 9, 17])
+    """
+
+    def __init__(self, model: type, records: Iterable[Any] = (),
+                 interned: Iterable[str] = ('file_path',)):
+        """Create a table for a dataclass model; values of interned fields are sys.intern'ed."""
+        self.model = model
+        self._names = [f.name for f in fields(model)]
+        self._interned = [name in set(interned) for name in self._names]
+        self._columns: List[Union[list, array]] = [
+            array(_ARRAY_CODES[f.type]) if f.type in _ARRAY_CODES else [] for f in fields(model)
+        ]
+        self.extend(records)
+
+    def append(self, record: Any) -> None:
+        """Add one record (paths are interned, numbers packed)."""
+        for name, column, intern in zip(self._names, self._columns, self._interned):
+            value = getattr(record, name)
+            column.append(sys.intern(value) if intern else value)
+
+    def extend(self, records: Iterable[Any]) -> None:
+        """Add records in order."""
+        for record in records:
+            self.append(record)
+
+    def column(self, name: str) -> Union[list, array]:
+        """One field for all records, without building model objects."""
+        return self._columns[self._names.index(name)]
+
+    def __len__(self) -> int:
+        return len(self._columns[0]) if self._columns else 0
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self.model(*(column[index] for column in self._columns))
+
+    def __iter__(self) -> Iterator[Any]:
+        for values in zip(*self._columns):
+            yield self.model(*values)
+
+    def __add__(self, other: Iterable[Any]) -> List[Any]:
+        return list(self) + list(other)
+
+    def __radd__(self, other: Iterable[Any]) -> List[Any]:
+        return list(other) + list(self)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"ViolationTable({self.model.__name__}, {len(self)} records)"
@@ -0,0 +1,116 @@
+"""
+Git Data Models
+
+Commit records and the running aggregate built from a streamed git log.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+from .compact import frozen_model
+
+
+# Messages starting with these are too vague to describe a change
+VAGUE_MESSAGE_PATTERN = re.compile(r'update|fix|wip|tmp|test|\.', re.IGNORECASE)
+SHORT_MESSAGE_LENGTH = 10  # thresholds.min_commit_message_length in grading_config.yaml
+
+
+def is_vague_message(message: str) -> bool:
+    """
+    Check if a commit message starts with a vague word (update, fix, wip, ...).
+
+    Example:
+        >>> is_vague_message('Fix typo'), is_vague_message('Add parser tests')
+        (True, False)
+    """
+    return VAGUE_MESSAGE_PATTERN.match(message) is not None
+
+
+@frozen_model
+class CommitInfo:
+    """Information about a git commit."""
+    hash: str
+    message: str
+    author: str
+    date: str
+    insertions: int = 0  # Lines added (text files, from --numstat)
+    deletions: int = 0
+    files_changed: int = 0
+    email: str = ''  # Author email after .mailmap
+    timestamp: int = 0  # Author time, unix seconds
+
+    @property
+    def message_length(self) -> int:
+        """Get commit message length."""
+        return len(self.message)
+
+    @property
+    def is_meaningful(self) -> bool:
+        """Check if commit message is meaningful (not vague)."""
+        return not is_vague_message(self.message)
+
+
+@frozen_model
+class AuthorStats:
+    """One author's contribution (all of their folded identities)."""
+    name: str  # Display name: identity with most commits (then most lines)
+    emails: Tuple[str, ...]
+    commits: int
+    insertions: int
+    deletions: int
+    active_days: int  # Distinct commit dates
+    files_owned: int  # Files where they added the most lines
+    line_share: float  # Fraction of all lines added in the project
+
+
+@frozen_model
+class IndexEntry:
+    """One path staged in the git index (.git/index)."""
+    path: str  # POSIX-style, relative to the work tree root
+    sha: str  # Blob SHA (hex)
+    mode: int  # 0o100644, 0o100755, 0o120000 (symlink) or 0o160000 (submodule)
+    size: int  # Work tree file size when last staged (truncated to 32 bits)
+    mtime: float  # Work tree mtime when last staged
+    stage: int = 0  # Non-zero for unmerged (conflicted) entries
+
+
+@dataclass
+class HistoryStats:
+    """
+    Aggregate of a streamed commit history; memory stays constant in its length.
+
+    Attributes:
+        commits: Commits read from the stream
+        short_messages: Messages shorter than SHORT_MESSAGE_LENGTH
+        vague_messages: Messages matching is_vague_message
+        insertions / deletions / files_changed: numstat totals
+        first_date / last_date: Oldest and newest commit dates (YYYY-MM-DD)
+        complete: False if the stream was cut off at the time limit
+        sample: The newest commits, for display (at most sample_size)
+    """
+    commits: int = 0
+    short_messages: int = 0
+    vague_messages: int = 0
+    insertions: int = 0
+    deletions: int = 0
+    files_changed: int = 0
+    first_date: str = ''
+    last_date: str = ''
+    complete: bool = True
+    sample_size: int = 10
+    sample: List[CommitInfo] = field(default_factory=list)
+
+    def add(self, commit: CommitInfo) -> None:
+        """Fold one commit (streamed newest first) into the aggregate."""
+        self.commits += 1
+        self.short_messages += commit.message_length < SHORT_MESSAGE_LENGTH
+        self.vague_messages += not commit.is_meaningful
+        self.insertions += commit.insertions
+        self.deletions += commit.deletions
+        self.files_changed += commit.files_changed
+        self.first_date = commit.date
+        if not self.last_date:
+            self.last_date = commit.date
+        if len(self.sample) < self.sample_size:
+            self.sample.append(commit)
@@ -0,0 +1,58 @@
+"""
+Module Summary Module
+
+Builds a compact ModuleSummary (module docstring, functions, classes,
+methods, async defs, nesting depth and complexity) with ONE
+ast.NodeVisitor pass (see summary_visitor.py).
+
+Key Features:
+- Each file is parsed once and summarized once; every AST consumer
+  (docstrings, naming, complexity, test metrics) reads the same summary
+- Methods belong to their class only, so they are never counted twice
+- Async defs are included (flagged with is_async)
+- Summaries are cached per path on the ProjectSnapshot, and across runs
+  in the snapshot's AnalysisCache (summaries are path-independent)
+"""
+
+from typing import Optional
+
+from ..models.code_models import ModuleSummary
+from ..utils.cache_lookup import cached_call
+from ..utils.content_store import ContentStore
+from ..utils.project_snapshot import ProjectSnapshot
+from .python_parser import parse_python_file
+from .summary_visitor import summarize_module
+
+
+SUMMARY_CACHE_VERSION = 5  # Bump whenever ModuleSummary contents change
+NOT_SUMMARIZED = object()  # summary= default: None is a real result (file failed to parse)
+
+
+def summarize_file(file_path: str, store: ContentStore = None) -> Optional[ModuleSummary]:
+    """Parse and summarize one file; None if it cannot be parsed."""
+    tree = parse_python_file(file_path, store)
+    return summarize_module(tree) if tree is not None else None
+
+
+def get_module_summary(file_path: str,
+                       snapshot: ProjectSnapshot = None) -> Optional[ModuleSummary]:
+    """
+    Get a file's summary, building it at most once per snapshot.
+
+    Args:
+        file_path: Path to Python file
+        snapshot: Project index whose summary cache, content store and
+            persistent analysis cache are used (optional; without one the
+            file is parsed on each call)
+
+    Returns:
+        Optional[ModuleSummary]: Summary, or None if the file cannot be parsed
+    """
+    if snapshot is None:
+        return summarize_file(file_path)
+    if file_path not in snapshot.summaries:
+        snapshot.summaries[file_path] = cached_call(
+            snapshot.cache, file_path, 'module_summary', SUMMARY_CACHE_VERSION,
+            lambda: summarize_file(file_path, snapshot.store), snapshot.store
+        )
+    return snapshot.summaries[file_path]
@@ -0,0 +1,109 @@
+"""
+Parallel Summaries Module
+
+Builds module summaries for many files across a process pool. Parsing is
+CPU-bound, so threads serialize on the GIL; worker processes each parse
+one size-balanced chunk of files and return only the compact
+ModuleSummary objects (never AST objects) over IPC.
+
+Key Features:
+- Several chunks per worker, balanced by byte size (see utils.sharding)
+- In-process fallback for small projects, where pool start-up dominates
+- Summaries already on the snapshot or in its AnalysisCache are never
+  sent to a worker; fresh results are stored in both
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from ..models.code_models import ModuleSummary
+from ..utils.analysis_cache import MISSING
+from ..utils.cache_lookup import content_sha
+from ..utils.project_snapshot import ProjectSnapshot
+from ..utils.sharding import file_sizes, shard_by_size
+from .module_summary import SUMMARY_CACHE_VERSION, get_module_summary, summarize_file
+
+
+PARALLEL_MIN_FILES = 32  # Fewer files parse faster than a pool starts
+CHUNKS_PER_WORKER = 4  # Lets fast workers pick up more chunks
+
+
+def summarize_files(
+    file_paths: List[str],
+    snapshot: ProjectSnapshot = None,
+    workers: int = 1
+) -> Dict[str, Optional[ModuleSummary]]:
+    """
+    Summarize Python files, in worker processes when there are many.
+
+    Args:
+        file_paths: Python files to summarize
+        snapshot: Project index whose summary and analysis caches are used
+            and filled (optional)
+        workers: Worker processes (default: 1, summarize in this process)
+
+    Returns:
+        Dict[str, Optional[ModuleSummary]]: Summary per path (None if the
+        file cannot be parsed)
+
+    Example:
+        >>> summaries = summarize_files(snapshot.paths(['.py']), snapshot, workers=8)
+        >>> result = check_docstrings(path, summary=summaries[path])
+    """
+    if workers > 1 and len(file_paths) >= PARALLEL_MIN_FILES:
+        if snapshot is None:
+            return _summarize_parallel(file_paths, None, workers)
+        pending = _uncached(file_paths, snapshot)
+        if len(pending) >= PARALLEL_MIN_FILES:
+            _store(_summarize_parallel(list(pending), snapshot, workers), pending, snapshot)
+    return {path: get_module_summary(path, snapshot) for path in file_paths}
+
+
+def _uncached(file_paths: List[str], snapshot: ProjectSnapshot) -> Dict[str, Optional[str]]:
+    """Load cached summaries onto the snapshot; map paths still to parse to their SHA."""
+    pending: Dict[str, Optional[str]] = {}
+    for path in file_paths:
+        if path in snapshot.summaries:
+            continue
+        sha = content_sha(path, snapshot.store) if snapshot.cache is not None else None
+        if sha is not None:
+            summary = snapshot.cache.get(sha, 'module_summary', SUMMARY_CACHE_VERSION)
+            if summary is not MISSING:
+                snapshot.summaries[path] = summary
+                continue
+        pending[path] = sha
+    return pending
+
+
+def _store(
+    summaries: Dict[str, Optional[ModuleSummary]],
+    shas: Dict[str, Optional[str]],
+    snapshot: ProjectSnapshot
+) -> None:
+    """Record worker results on the snapshot and in its analysis cache."""
+    for path, summary in summaries.items():
+        snapshot.summaries[path] = summary
+        if shas[path] is not None:
+            snapshot.cache.put(shas[path], 'module_summary', SUMMARY_CACHE_VERSION, summary)
+
+
+def _summarize_parallel(
+    file_paths: List[str],
+    snapshot: Optional[ProjectSnapshot],
+    workers: int
+) -> Dict[str, Optional[ModuleSummary]]:
+    """Summarize size-balanced chunks of files in worker processes."""
+    sizes = file_sizes(file_paths, snapshot)
+    chunks = shard_by_size(
+        ((path, sizes.get(path, 0)) for path in file_paths), workers * CHUNKS_PER_WORKER
+    )
+    summaries: Dict[str, Optional[ModuleSummary]] = {}
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        for chunk_summaries in pool.map(_summarize_chunk, chunks):
+            summaries.update(chunk_summaries)
+    return summaries
+
+
+def _summarize_chunk(file_paths: List[str]) -> List[Tuple[str, Optional[ModuleSummary]]]:
+    """Worker entry point: parse and summarize one chunk of files."""
+    return [(path, summarize_file(path)) for path in file_paths]
@@ -11,14 +11,16 @@ import ast
 from typing import List, Optional
 
 from ..models.code_models import FunctionInfo, ClassInfo
+from ..utils.content_store import ContentStore, read_text
 
 
-def parse_python_file(file_path: str) -> Optional[ast.AST]:
+def parse_python_file(file_path: str, store: ContentStore = None) -> Optional[ast.AST]:
     """
     Parse a Python file into an AST.
 
     Args:
         file_path: Path to Python file
+        store: Shared content cache (optional)
 
     Returns:
         ast.AST: Abstract Syntax Tree, or None if parsing fails
@@ -29,9 +31,7 @@ def parse_python_file(file_path: str) -> Optional[ast.AST]:
         ...     print("Parsed successfully")
     """
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            source = f.read()
-
+        source = read_text(file_path, store)
         return ast.parse(source, filename=file_path)
 
     except SyntaxError as e:
@@ -0,0 +1,136 @@
+"""
+Summary Visitor Module
+
+The single ast.NodeVisitor pass behind ModuleSummary: records module
+docstring, functions, classes, methods, async defs, nesting depth, and
+per function its McCabe complexity, assertions, parametrize case count
+and fixture marker.
+
+Design Decision: Definitions can only appear inside statement blocks, so
+outside function bodies the visitor descends through statement blocks
+only. Inside a function body every node is visited once, to count its
+decision points (complexity.py) and assertions (test_detection.py).
+"""
+
+import ast
+from typing import List, Optional, Union
+
+from ..models.code_models import ClassInfo, FunctionInfo, ModuleSummary
+from .complexity import decision_points
+from .test_detection import assertion_points, is_fixture, parametrize_cases
+
+
+_BLOCK_FIELDS = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+
+
+class _FunctionScope:
+    """Counters for the function whose body is being visited."""
+    __slots__ = ('complexity', 'assertions')
+
+    def __init__(self):
+        """Start complexity at 1 (the function's single entry path)."""
+        self.complexity = 1
+        self.assertions = 0
+
+
+class _SummaryVisitor(ast.NodeVisitor):
+    """Collects function and class definitions with their scope depth."""
+
+    def __init__(self):
+        """Initialize empty result lists and scope stack."""
+        self.functions: List[Optional[FunctionInfo]] = []
+        self.classes: List[ClassInfo] = []
+        self._scopes: List[Union[_FunctionScope, ClassInfo]] = []
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Score and visit every child in functions; elsewhere statement blocks only."""
+        scope = self._scopes[-1] if self._scopes else None
+        if isinstance(scope, _FunctionScope):
+            scope.complexity += decision_points(node)
+            scope.assertions += assertion_points(node)
+            children = ast.iter_child_nodes(node)
+        else:
+            children = (child for block in _BLOCK_FIELDS for child in getattr(node, block, ()))
+        for child in children:
+            self.visit(child)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        """Record a function or method."""
+        self._add_function(node, is_async=False)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        """Record an async function or method."""
+        self._add_function(node, is_async=True)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        """Record a class; its direct function children become methods."""
+        docstring = ast.get_docstring(node)
+        info = ClassInfo(
+            name=node.name,
+            line_number=node.lineno,
+            has_docstring=docstring is not None,
+            docstring=docstring,
+            methods=[],
+            depth=len(self._scopes)
+        )
+        self.classes.append(info)
+        self._visit_body(info, node)
+
+    def _add_function(self, node: ast.AST, is_async: bool) -> None:
+        """Record a def as a method of the enclosing class or as a function."""
+        parent = self._scopes[-1] if self._scopes else None
+        is_method = isinstance(parent, ClassInfo)
+        target = parent.methods if is_method else self.functions
+        slot = len(target)
+        target.append(None)  # Keep definition order; filled once the body is scored
+        depth = len(self._scopes)
+        scope = _FunctionScope()
+        self._visit_body(scope, node)
+
+        docstring = ast.get_docstring(node)
+        target[slot] = FunctionInfo(
+            name=node.name,
+            line_number=node.lineno,
+            has_docstring=docstring is not None,
+            docstring=docstring,
+            num_params=len(node.args.args),
+            is_method=is_method,
+            is_async=is_async,
+            depth=depth,
+            complexity=scope.complexity,
+            assertions=scope.assertions,
+            cases=parametrize_cases(node.decorator_list),
+            is_fixture=is_fixture(node.decorator_list),
+            arg_names=tuple(arg.arg for arg in node.args.args)
+        )
+
+    def _visit_body(self, scope: Union[_FunctionScope, ClassInfo], node: ast.AST) -> None:
+        """Visit a definition's body statements with scope as innermost scope."""
+        self._scopes.append(scope)
+        for statement in node.body:
+            self.visit(statement)
+        self._scopes.pop()
+
+
+def summarize_module(tree: ast.Module) -> ModuleSummary:
+    """
+    Summarize a parsed module in a single traversal.
+
+    Args:
+        tree: Parsed module AST
+
+    Returns:
+        ModuleSummary: Docstring, functions and classes (with methods)
+
+    Example:
+        >>> summary = summarize_module(ast.parse(source))
+        >>> print(len(summary.functions), len(summary.methods))
+        3 5
+    """
+    visitor = _SummaryVisitor()
+    visitor.generic_visit(tree)
+    return ModuleSummary(
+        docstring=ast.get_docstring(tree),
+        functions=visitor.functions,
+        classes=visitor.classes
+    )
@@ -0,0 +1,98 @@
+"""
+Test Detection Module
+
+pytest-style rules applied during the shared module-summary traversal:
+which definitions are tests, how many cases a parametrized test expands
+to, which functions are fixtures, and which nodes are assertions.
+
+Design Decision: Parametrize expansion is computed statically from
+literal argvalues (lists, tuples, sets); values built at runtime count
+as a single case, since they cannot be known without importing the file.
+"""
+
+import ast
+from typing import List, Optional
+
+
+def is_test_name(name: str) -> bool:
+    """Check if a function or method name is collected as a test (pytest default)."""
+    return name.startswith('test')
+
+
+def is_test_class(name: str) -> bool:
+    """Check if a class name is collected as a test class (pytest default)."""
+    return name.startswith('Test')
+
+
+def assertion_points(node: ast.AST) -> int:
+    """
+    Count the assertions a single node makes (children not included).
+
+    Counts assert statements, assert* method calls (self.assertEqual,
+    mock.assert_called_once) and pytest.raises.
+
+    Example:
+        >>> assertion_points(ast.parse('assert x == 1').body[0])
+        1
+    """
+    if isinstance(node, ast.Assert):
+        return 1
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+        if node.func.attr.startswith('assert') or _dotted(node.func) == 'pytest.raises':
+            return 1
+    return 0
+
+
+def parametrize_cases(decorators: List[ast.expr]) -> int:
+    """
+    Number of cases a test expands to under stacked parametrize decorators.
+
+    Args:
+        decorators: The def's decorator_list
+
+    Returns:
+        int: Product of the literal argvalues lengths (1 if not parametrized)
+
+    Example:
+        >>> tree = ast.parse('@pytest.mark.parametrize("x", [1, 2, 3])\\ndef test(x): pass')
+        >>> parametrize_cases(tree.body[0].decorator_list)
+        3
+    """
+    cases = 1
+    for decorator in decorators:
+        if isinstance(decorator, ast.Call) and _dotted(decorator.func).endswith('parametrize'):
+            values = _argvalues(decorator)
+            if isinstance(values, (ast.List, ast.Tuple, ast.Set)):
+                cases *= len(values.elts)
+    return cases
+
+
+def is_fixture(decorators: List[ast.expr]) -> bool:
+    """Check for @pytest.fixture / @fixture, with or without arguments."""
+    for decorator in decorators:
+        target = decorator.func if isinstance(decorator, ast.Call) else decorator
+        if _dotted(target).split('.')[-1] == 'fixture':
+            return True
+    return False
+
+
+def _argvalues(call: ast.Call) -> Optional[ast.expr]:
+    """The argvalues argument of a parametrize call, if given."""
+    if len(call.args) > 1:
+        return call.args[1]
+    for keyword in call.keywords:
+        if keyword.arg == 'argvalues':
+            return keyword.value
+    return None
+
+
+def _dotted(node: ast.expr) -> str:
+    """Dotted name of a Name/Attribute chain ('' for anything else)."""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return ''
+    parts.append(node.id)
+    return '.'.join(reversed(parts))
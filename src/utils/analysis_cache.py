@@ -0,0 +1,139 @@
+"""
+Analysis Cache Module
+
+Persistent per-file cache of analyzer outputs, shared across runs.
+Regrading a cohort after a rubric tweak serves every unchanged file from
+disk instead of re-parsing and re-scanning it.
+
+Key Features:
+- SQLite database under a cache directory (safe for concurrent graders)
+- Keyed by (git blob SHA of the file contents, analyzer, analyzer version)
+- Identical files (e.g. starter code shared by a cohort) share entries
+- Size-based LRU eviction under a configurable byte budget
+- cache_lookup.cached_call wraps any per-file analyzer call
+
+Design Decision: Payloads are pickled, so cached values must not depend
+on the file's location; callers re-attach the path after a lookup. The
+cache directory is trusted local state, like any other pickle cache.
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Union
+
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    'GRADER_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'auto-grader')
+)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MB of pickled payloads
+MISSING = object()  # get() result for absent keys (None is a valid payload)
+
+_SCHEMA = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY, payload BLOB NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL);
+CREATE INDEX IF NOT EXISTS by_last_used ON entries (last_used);
+"""
+
+
+def blob_sha(data: bytes) -> str:
+    """Hash contents exactly like `git hash-object` (SHA-1 of a blob object)."""
+    return hashlib.sha1(b'blob %d\0' % len(data) + data).hexdigest()
+
+
+class AnalysisCache:
+    """
+    On-disk cache of per-file analysis results.
+
+    Example:
+        >>> with AnalysisCache() as cache:
+        ...     snapshot = ProjectSnapshot.build('/path/to/project', cache=cache)
+        ...     analyze_project_docstrings('/path/to/project', snapshot=snapshot)
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """Open (or create) cache_dir/analysis.sqlite3 with a payload budget of max_bytes."""
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, 'analysis.sqlite3')
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._db.executescript(_SCHEMA)
+        self._used = self._total_size()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, sha: str, analyzer: str, version: Union[int, str]) -> Any:
+        """Return the cached payload, or MISSING."""
+        key = f"{sha}:{analyzer}:{version}"
+        with self._lock:
+            row = self._db.execute('SELECT payload FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                try:
+                    value = pickle.loads(row[0])
+                except Exception:
+                    self._db.execute('DELETE FROM entries WHERE key = ?', (key,))
+                    row = None  # Unreadable payload (e.g. class renamed): recompute
+            if row is None:
+                self.misses += 1
+                return MISSING
+            self._db.execute('UPDATE entries SET last_used = ? WHERE key = ?', (time.time(), key))
+            self.hits += 1
+            return value
+
+    def put(self, sha: str, analyzer: str, version: Union[int, str], value: Any) -> None:
+        """Store a payload, evicting least recently used entries if over budget."""
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self.max_bytes:
+            return
+        key = f"{sha}:{analyzer}:{version}"
+        with self._lock:
+            row = self._db.execute('SELECT size FROM entries WHERE key = ?', (key,)).fetchone()
+            self._db.execute(
+                'INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)',
+                (key, payload, len(payload), time.time())
+            )
+            self._used += len(payload) - (row[0] if row else 0)  # A rewrite replaces its row
+            if self._used > self.max_bytes:
+                self._evict()
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache statistics (hits, misses, evictions, bytes used)."""
+        return {'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'bytes_used': self._used}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
+
+    def __enter__(self) -> 'AnalysisCache':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _total_size(self) -> int:
+        """Sum payload sizes in the database (other processes may write too)."""
+        return self._db.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until within budget (lock held)."""
+        self._used = self._total_size()
+        victims = []
+        for key, size in self._db.execute('SELECT key, size FROM entries ORDER BY last_used'):
+            if self._used <= self.max_bytes:
+                break
+            victims.append((key,))
+            self._used -= size
+        self._db.executemany('DELETE FROM entries WHERE key = ?', victims)
+        self.evictions += len(victims)
+
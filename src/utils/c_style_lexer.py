@@ -0,0 +1,90 @@
+"""
+C-Style Lexer Module
+
+Line-oriented state machine that classifies lines of JavaScript,
+TypeScript, Java, C and similar languages as code, comment or blank.
+Understands '//' and '/* */' comments, quoted strings and multi-line
+template literals, so comment markers inside strings are not miscounted.
+"""
+
+import re
+from typing import List, Tuple
+
+
+C_STYLE_EXTENSIONS = {
+    '.js', '.jsx', '.mjs', '.ts', '.tsx', '.java', '.c', '.h', '.cpp', '.cs', '.go', '.rs'
+}
+
+# Start of a comment or string
+_C_START = re.compile(r'//|/\*|[\'"`]')
+_C_END = {
+    "'": re.compile(r"[^'\\]*(?:\\.[^'\\]*)*'"),
+    '"': re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"'),
+    '`': re.compile(r'[^`\\]*(?:\\.[^`\\]*)*`'),
+    '/*': re.compile(r'.*?\*/'),
+}
+
+
+def count_c_style_lines(lines: List[str]) -> Tuple[int, int, int]:
+    """
+    Classify lines of a C-style language in one pass.
+
+    Args:
+        lines: Source lines without trailing newlines
+
+    Returns:
+        Tuple[int, int, int]: (code, comments, blank) line counts
+    """
+    code = comments = blank = 0
+    state = None  # '/*' inside a block comment, '`' inside a template literal
+    for line in lines:
+        pos = 0
+        has_code = has_comment = False
+        if state is not None:
+            end = _C_END[state].match(line)
+            if end is None:
+                if state == '/*':
+                    comments += 1
+                else:
+                    code += 1
+                continue
+            has_comment, has_code = state == '/*', state == '`'
+            pos, state = end.end(), None
+        else:
+            stripped = line.strip()
+            if not stripped:
+                blank += 1
+                continue
+            if stripped.startswith('//'):
+                comments += 1
+                continue
+            if '/' not in line and "'" not in line and '"' not in line and '`' not in line:
+                code += 1
+                continue
+
+        while True:
+            match = _C_START.search(line, pos)
+            if line[pos:match.start() if match else len(line)].strip():
+                has_code = True
+            if match is None:
+                break
+            token = match.group()
+            if token == '//':
+                has_comment = True
+                break
+            has_comment = has_comment or token == '/*'
+            has_code = has_code or token != '/*'
+            end = _C_END[token].match(line, match.end())
+            if end is None:
+                if token in ('/*', '`'):
+                    state = token
+                break
+            pos = end.end()
+
+        if has_code:
+            code += 1
+        elif has_comment:
+            comments += 1
+        else:
+            blank += 1
+    return code, comments, blank
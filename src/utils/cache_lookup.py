@@ -0,0 +1,73 @@
+"""
+Cache Lookup Module
+
+Wraps per-file analyzer calls with the persistent AnalysisCache: the
+file's contents are hashed (read once through the ContentStore) and the
+analyzer only runs when no result exists for that content and version.
+"""
+
+import hashlib
+from typing import Any, Callable, Optional, Union
+
+from .analysis_cache import MISSING, AnalysisCache, blob_sha
+from .content_store import ContentStore
+
+
+def cached_call(cache: AnalysisCache, file_path: str, analyzer: str,
+                version: Union[int, str], compute: Callable[[], Any],
+                store: ContentStore = None) -> Any:
+    """
+    Serve compute() for a file from the cache when its contents are unchanged.
+
+    Args:
+        cache: Analysis cache, or None to always compute
+        file_path: File the result describes (its contents form the key)
+        analyzer: Analyzer name
+        version: Analyzer version; bump it whenever the output changes
+        compute: Computes the (path-independent) result on a miss
+        store: Shared content cache used to read the file (optional)
+
+    Returns:
+        The cached or freshly computed result
+    """
+    if cache is None:
+        return compute()
+    sha = content_sha(file_path, store)
+    if sha is None:
+        return compute()  # Let the analyzer report unreadable files itself
+    value = cache.get(sha, analyzer, version)
+    if value is MISSING:
+        value = compute()
+        cache.put(sha, analyzer, version, value)
+    return value
+
+
+def content_sha(file_path: str, store: ContentStore = None) -> Optional[str]:
+    """Git blob SHA of a file's contents; None if the file cannot be read."""
+    try:
+        if store is not None:
+            return blob_sha(store.read_bytes(file_path))
+        with open(file_path, 'rb') as f:
+            return blob_sha(f.read())
+    except OSError:
+        return None
+
+
+def tree_sha(snapshot) -> str:
+    """
+    Content hash of a whole project tree (paths and file contents).
+
+    Unchanged resubmissions hash identically wherever they are checked
+    out, so whole-project results (e.g. test runs) can be cached by it.
+
+    Args:
+        snapshot: ProjectSnapshot of the project
+
+    Returns:
+        str: SHA-1 hex digest over (relative path, blob SHA) of every file
+    """
+    digest = hashlib.sha1()
+    for entry in snapshot.entries:
+        sha = content_sha(entry.path, snapshot.store) or 'unreadable'
+        digest.update(f"{entry.rel_path}\0{sha}\n".encode('utf-8'))
+    return digest.hexdigest()
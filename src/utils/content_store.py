@@ -0,0 +1,149 @@
+"""
+Content Store Module
+
+Shared, memory-budgeted cache of file contents for all analyzers.
+Each file is read from disk once as bytes and decoded lazily.
+
+Key Features:
+- One decoding policy everywhere: UTF-8 with errors='ignore' and
+  universal newlines (identical to open(path, 'r', errors='ignore'))
+- Bytes, text and lines views of the same cached read
+- LRU eviction under a configurable byte budget; files larger than
+  the per-file cap are served but never retained
+- Thread-safe for parallel skill execution
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, List
+
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MB per project
+DEFAULT_MAX_FILE_BYTES = 8 * 1024 * 1024  # Larger files bypass the cache
+
+
+def decode_text(data: bytes) -> str:
+    """Decode bytes using the project-wide policy (UTF-8, ignore, universal newlines)."""
+    text = data.decode('utf-8', errors='ignore')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def split_lines(text: str) -> List[str]:
+    """Split text into lines keeping '\\n', exactly like file.readlines()."""
+    lines = text.split('\n')
+    tail = lines.pop()
+    result = [line + '\n' for line in lines]
+    if tail:
+        result.append(tail)
+    return result
+
+
+class ContentStore:
+    """
+    LRU cache of file contents bounded by a memory budget.
+
+    Example:
+        >>> store = ContentStore(max_bytes=32 * 1024 * 1024)
+        >>> text = store.read_text('src/main.py')
+        >>> lines = store.read_lines('src/main.py')  # No second disk read
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_file_bytes: int = DEFAULT_MAX_FILE_BYTES):
+        """
+        Initialize an empty store.
+
+        Args:
+            max_bytes: Total budget for cached bytes and decoded text
+            max_file_bytes: Files above this size are never cached
+        """
+        self.max_bytes = max_bytes
+        self.max_file_bytes = min(max_file_bytes, max_bytes)
+        self._entries: 'OrderedDict[str, list]' = OrderedDict()  # path -> [bytes, text]
+        self._used = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def read_bytes(self, file_path: str) -> bytes:
+        """Return raw file contents, reading from disk at most once while cached."""
+        return self._entry(str(file_path))[0]
+
+    def read_text(self, file_path: str) -> str:
+        """Return decoded file contents (decoded on first request)."""
+        file_path = str(file_path)
+        entry = self._entry(file_path)
+        if entry[1] is None:
+            text = decode_text(entry[0])
+            with self._lock:
+                if entry[1] is None:
+                    entry[1] = text
+                    if self._entries.get(file_path) is entry:
+                        self._used += len(text)
+                        self._evict()
+        return entry[1]
+
+    def read_lines(self, file_path: str) -> List[str]:
+        """Return file lines with line endings, like file.readlines()."""
+        return split_lines(self.read_text(file_path))
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache statistics (hits, misses, evictions, bytes used)."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'cached_files': len(self._entries),
+                'bytes_used': self._used,
+            }
+
+    def _entry(self, file_path: str) -> list:
+        """Get (or load and cache) the [bytes, text] entry for a path."""
+        with self._lock:
+            entry = self._entries.get(file_path)
+            if entry is not None:
+                self._entries.move_to_end(file_path)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        entry = [data, None]
+        if len(data) > self.max_file_bytes:
+            return entry  # Served once, never retained
+
+        with self._lock:
+            if file_path in self._entries:  # Loaded concurrently by another thread
+                return self._entries[file_path]
+            self._entries[file_path] = entry
+            self._used += len(data)
+            self._evict()
+        return entry
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until within budget (lock held)."""
+        while self._used > self.max_bytes and self._entries:
+            _, (data, text) = self._entries.popitem(last=False)
+            self._used -= len(data) + (len(text) if text is not None else 0)
+            self.evictions += 1
+
+
+def read_text(file_path: str, store: ContentStore = None) -> str:
+    """Read a file as text through the store when one is provided."""
+    if store is not None:
+        return store.read_text(file_path)
+    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        return f.read()
+
+
+def read_lines(file_path: str, store: ContentStore = None) -> List[str]:
+    """Read a file as lines through the store when one is provided."""
+    if store is not None:
+        return store.read_lines(file_path)
+    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        return f.readlines()
@@ -0,0 +1,88 @@
+"""
+Coverage Report Module
+
+Turns the executed lines recorded by line_coverage into the per-file
+and overall coverage fractions the rubric checks (test_coverage_min).
+
+Executable lines come from the compiled bytecode's line table - the
+same line numbers the collector's LINE events report - so both sides
+of the fraction agree on what counts as a line.
+"""
+
+import dis
+import fnmatch
+import os
+from types import CodeType
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .project_snapshot import ProjectSnapshot
+
+
+def statement_lines(source: str, filename: str = '<source>') -> Set[int]:
+    """
+    Line numbers that carry bytecode, in the module and all nested code.
+
+    Args:
+        source: Python source text
+        filename: Name used in SyntaxError messages
+
+    Returns:
+        Set[int]: Executable line numbers (empty if the source does not compile)
+
+    Example:
+        >>> sorted(statement_lines('x = 1\\n\\ndef f():\\n    return x\\n'))
+        [1, 3, 4]
+    """
+    try:
+        code = compile(source, filename, 'exec')
+    except (SyntaxError, ValueError):
+        return set()
+    lines: Set[int] = set()
+    pending: List[CodeType] = [code]
+    while pending:
+        code = pending.pop()
+        lines.update(line for _, line in dis.findlinestarts(code) if line)
+        pending.extend(const for const in code.co_consts if isinstance(const, CodeType))
+    return lines
+
+
+def coverage_fractions(
+    snapshot: ProjectSnapshot,
+    work_dir: str,
+    executed: Dict[str, Iterable[int]],
+    omit: Iterable[str] = ()
+) -> Tuple[Optional[float], Dict[str, float]]:
+    """
+    Covered fraction of executable lines per file and overall.
+
+    Args:
+        snapshot: Project whose .py files were copied into work_dir
+        work_dir: Directory the tests ran in
+        executed: Collector output (absolute path in work_dir -> line numbers)
+        omit: fnmatch patterns (on work_dir paths) of files not measured
+
+    Returns:
+        Tuple of the overall fraction (None if nothing is executable) and a
+        dict of each measured file's relative path to its fraction
+
+    Example:
+        >>> total, per_file = coverage_fractions(snapshot, work, executed)
+        >>> print(f"{total:.0%}", per_file['src/calc.py'])
+        82% 0.75
+    """
+    executed = {os.path.realpath(path): set(lines) for path, lines in executed.items()}
+    fractions: Dict[str, float] = {}
+    total_lines = total_hit = 0
+    for entry in snapshot.files(extensions=['.py']):
+        work_path = os.path.realpath(os.path.join(work_dir, *entry.rel_path.split('/')))
+        if any(fnmatch.fnmatch(work_path, pattern) for pattern in omit):
+            continue
+        lines = statement_lines(snapshot.store.read_text(entry.path), entry.rel_path)
+        if not lines:
+            continue
+        hit = len(lines & executed.get(work_path, set()))
+        fractions[entry.rel_path] = round(hit / len(lines), 4)
+        total_lines += len(lines)
+        total_hit += hit
+    total = round(total_hit / total_lines, 4) if total_lines else None
+    return total, fractions
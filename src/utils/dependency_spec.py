@@ -0,0 +1,141 @@
+"""
+Dependency Spec Module
+
+Reads a submission's declared dependencies (requirements.txt and/or
+pyproject.toml [project].dependencies) into a normalized, sorted list,
+resolves it against the local wheel cache, and hashes the resolved pins
+into the key of the VenvPool environment that satisfies it. Specs that
+resolve to the same packages share an environment, and an unpinned spec
+moves to a new one when a newer wheel is added to the cache.
+
+Normalization makes trivially different files share an environment:
+comments, blank lines, whitespace, case and '_' vs '-' in project names
+are ignored, and order does not matter. pip option lines (-e, -r,
+--index-url, ...) are dropped; environments install from the local wheel
+cache only.
+"""
+
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List
+
+from .project_snapshot import ProjectSnapshot
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+
+RESOLVE_TIMEOUT = 300  # Seconds
+_NAME = re.compile(r'[A-Za-z0-9._-]+')
+_RESOLVED: Dict[tuple, List[str]] = {}  # (spec, wheel_dir, its mtime) -> pins
+
+
+def read_requirements(snapshot: ProjectSnapshot) -> List[str]:
+    """
+    Collect the normalized requirements declared at the project root.
+
+    Args:
+        snapshot: ProjectSnapshot of the submission
+
+    Returns:
+        List[str]: Sorted, de-duplicated requirement strings
+
+    Example:
+        >>> read_requirements(snapshot)
+        ['numpy>=1.20', 'pandas']
+    """
+    lines: List[str] = []
+    requirements_txt = snapshot.get('requirements.txt')
+    if requirements_txt is not None:
+        text = snapshot.store.read_text(requirements_txt.path)
+        lines += [line.split(' #')[0] for line in text.splitlines()]
+    pyproject = snapshot.get('pyproject.toml')
+    if pyproject is not None:
+        lines += _pyproject_dependencies(snapshot.store.read_text(pyproject.path))
+    return sorted({_normalize(line) for line in lines if _is_requirement(line)})
+
+
+def resolve_requirements(requirements: List[str], wheel_dir: str) -> List[str]:
+    """
+    Pin requirements to exactly what an offline install from wheel_dir installs.
+
+    Results are reused until a wheel is added to or removed from wheel_dir.
+
+    Args:
+        requirements: Normalized requirements (see read_requirements)
+        wheel_dir: Local wheel cache (the only package source)
+
+    Returns:
+        List[str]: Sorted 'name==version' pins, dependencies included
+
+    Raises:
+        RuntimeError: If a dependency is missing from the wheel cache
+
+    Example:
+        >>> resolve_requirements(['numpy>=1.20'], wheel_dir)
+        ['numpy==2.1.0']
+    """
+    if not requirements:
+        return []
+    key = (tuple(requirements), wheel_dir, os.stat(wheel_dir).st_mtime_ns)
+    if key in _RESOLVED:
+        return _RESOLVED[key]
+    result = subprocess.run(
+        [sys.executable, '-m', 'pip', 'install', '--dry-run', '--ignore-installed',
+         '--report', '-', '--no-index', '--only-binary=:all:', '-q',
+         '--disable-pip-version-check', '--find-links', wheel_dir, *requirements],
+        capture_output=True, text=True, timeout=RESOLVE_TIMEOUT
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Dependency resolution failed: {result.stderr[-2000:]}")
+    _RESOLVED[key] = sorted(
+        _normalize(item['metadata']['name']) + '==' + item['metadata']['version']
+        for item in json.loads(result.stdout).get('install', [])
+    )
+    return _RESOLVED[key]
+
+
+def requirements_key(requirements: List[str]) -> str:
+    """
+    Environment key for a resolved requirement set on this interpreter version.
+
+    Example:
+        >>> requirements_key(['numpy==2.1.0'])
+        'py3.11-98de4fc1a9110869'
+    """
+    digest = hashlib.sha1('\n'.join(requirements).encode('utf-8')).hexdigest()[:16]
+    return f"py{sys.version_info[0]}.{sys.version_info[1]}-{digest}"
+
+
+def _pyproject_dependencies(text: str) -> List[str]:
+    """[project].dependencies of a pyproject.toml ([] if unreadable)."""
+    if tomllib is None:
+        return []
+    try:
+        return list(tomllib.loads(text).get('project', {}).get('dependencies', []))
+    except (ValueError, AttributeError):
+        return []
+
+
+def _is_requirement(line: str) -> bool:
+    """True for requirement lines (not blank, comment or pip option)."""
+    line = line.strip()
+    return bool(line) and not line.startswith(('#', '-'))
+
+
+def _normalize(line: str) -> str:
+    """Canonical form: no whitespace, lower case, PEP 503 project name."""
+    line = ''.join(line.split()).lower()
+    name = _NAME.match(line)
+    if name is None:
+        return line
+    return re.sub(r'[._-]+', '-', name.group()) + line[name.end():]
@@ -0,0 +1,41 @@
+"""
+File Entry Module
+
+Per-file records of the ProjectSnapshot index and the role classifier
+that assigns each file to source, test, doc, config, data or other.
+"""
+
+import os
+
+from ..models.compact import frozen_model
+from .file_finder_config import TEST_NAME_MARKERS, ROLE_EXTENSIONS, CONFIG_FILE_NAMES
+
+
+@frozen_model
+class FileEntry:
+    """A single file recorded in the snapshot."""
+    path: str  # Same form as find_code_files output (project_path joined)
+    rel_path: str  # POSIX-style path relative to the project root
+    size: int
+    mtime: float
+    extension: str
+    role: str  # 'source', 'test', 'doc', 'config', 'data' or 'other'
+
+    @property
+    def name(self) -> str:
+        """File name without directories."""
+        return os.path.basename(self.path)
+
+
+def classify_role(file_name: str) -> str:
+    """Classify a file name into its project role."""
+    ext = os.path.splitext(file_name)[1].lower()
+    if file_name in CONFIG_FILE_NAMES:
+        return 'config'
+    if ext in ROLE_EXTENSIONS['source']:
+        is_test = any(marker in file_name for marker in TEST_NAME_MARKERS)
+        return 'test' if is_test else 'source'
+    for role, extensions in ROLE_EXTENSIONS.items():
+        if ext in extensions:
+            return role
+    return 'other'
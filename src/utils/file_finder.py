@@ -8,18 +8,21 @@ Key Features:
 - Recursive directory traversal
 - Configurable file extensions
 - Automatic exclusion of common ignore directories
+- Optional ProjectSnapshot to reuse a single traversal
 """
 
 import os
 from typing import List, Set
 
-from .file_finder_config import DEFAULT_IGNORE_DIRS
+from .file_finder_config import DEFAULT_IGNORE_DIRS, TEST_NAME_MARKERS
+from .project_snapshot import ProjectSnapshot
 
 
 def find_code_files(
     project_path: str,
     extensions: List[str] = None,
-    ignore_dirs: Set[str] = None
+    ignore_dirs: Set[str] = None,
+    snapshot: ProjectSnapshot = None
 ) -> List[str]:
     """
     Find all code files in a project directory.
@@ -32,6 +35,8 @@ def find_code_files(
         extensions: List of file extensions to find (e.g., ['.py', '.js'])
                    Default: ['.py', '.js', '.ts']
         ignore_dirs: Set of directory names to skip (default: DEFAULT_IGNORE_DIRS)
+        snapshot: Pre-built project index; when given, no filesystem walk
+                  is performed and ignore_dirs is taken from the snapshot
 
     Returns:
         List[str]: Absolute paths to all matching files, sorted by path
@@ -44,13 +49,16 @@ def find_code_files(
         >>> print(f"Found {len(files)} Python files")
         Found 42 Python files
     """
-    if not os.path.isdir(project_path):
-        raise NotADirectoryError(f"Not a directory: {project_path}")
-
     # Set defaults
     if extensions is None:
         extensions = ['.py', '.js', '.ts']
 
+    if snapshot is not None:
+        return snapshot.paths(extensions=extensions)
+
+    if not os.path.isdir(project_path):
+        raise NotADirectoryError(f"Not a directory: {project_path}")
+
     if ignore_dirs is None:
         ignore_dirs = DEFAULT_IGNORE_DIRS.copy()
 
@@ -71,7 +79,8 @@ def find_code_files(
 
 def find_markdown_files(
     project_path: str,
-    ignore_dirs: Set[str] = None
+    ignore_dirs: Set[str] = None,
+    snapshot: ProjectSnapshot = None
 ) -> List[str]:
     """
     Find all Markdown documentation files in a project.
@@ -79,6 +88,7 @@ def find_markdown_files(
     Args:
         project_path: Root directory to search
         ignore_dirs: Set of directory names to skip
+        snapshot: Pre-built project index (optional)
 
     Returns:
         List[str]: Absolute paths to all .md files
@@ -91,13 +101,15 @@ def find_markdown_files(
     return find_code_files(
         project_path,
         extensions=['.md'],
-        ignore_dirs=ignore_dirs
+        ignore_dirs=ignore_dirs,
+        snapshot=snapshot
     )
 
 
 def find_test_files(
     project_path: str,
-    language: str = 'python'
+    language: str = 'python',
+    snapshot: ProjectSnapshot = None
 ) -> List[str]:
     """
     Find test files based on common naming conventions.
@@ -105,6 +117,7 @@ def find_test_files(
     Args:
         project_path: Root directory to search
         language: Programming language ('python' or 'javascript')
+        snapshot: Pre-built project index (optional)
 
     Returns:
         List[str]: Paths to test files
@@ -121,17 +134,12 @@ def find_test_files(
     else:
         extensions = ['.py']
 
-    all_files = find_code_files(project_path, extensions)
+    all_files = find_code_files(project_path, extensions, snapshot=snapshot)
 
     # Filter for test file naming patterns
     test_files = [
         f for f in all_files
-        if any([
-            'test_' in os.path.basename(f),
-            '_test' in os.path.basename(f),
-            '.test.' in os.path.basename(f),
-            '.spec.' in os.path.basename(f),
-        ])
+        if any(marker in os.path.basename(f) for marker in TEST_NAME_MARKERS)
     ]
 
     return test_files
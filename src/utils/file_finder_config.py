@@ -0,0 +1,37 @@
+"""
+File Finder Configuration
+
+Directory exclusions and file role rules shared by the file finder
+and the project snapshot.
+
+Design Decision: Keep classification data in one place so the
+filesystem walkers and the snapshot index can never disagree.
+"""
+
+# Directories never descended into (mirrors grading_config.yaml)
+DEFAULT_IGNORE_DIRS = {
+    'node_modules',
+    'venv',
+    '.venv',
+    'env',
+    '.git',
+    '__pycache__',
+    'dist',
+    'build',
+    '.pytest_cache',
+    '.mypy_cache',
+}
+
+# Substrings in a file name that mark it as a test file
+TEST_NAME_MARKERS = ('test_', '_test', '.test.', '.spec.')
+
+# Extension -> role for files that are not tests
+ROLE_EXTENSIONS = {
+    'source': {'.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.c', '.cpp', '.h', '.go', '.rs', '.sh'},
+    'doc': {'.md', '.rst', '.txt', '.pdf', '.docx'},
+    'config': {'.yaml', '.yml', '.toml', '.ini', '.cfg', '.env', '.example'},
+    'data': {'.csv', '.json', '.xlsx', '.xls', '.parquet', '.npy', '.pkl', '.db', '.sqlite'},
+}
+
+# Extensionless or dot-files that are configuration
+CONFIG_FILE_NAMES = {'.gitignore', '.env', 'Makefile', 'Dockerfile', 'requirements.txt'}
@@ -3,40 +3,19 @@ Git Command Utilities
 
 Wrapper functions for executing git commands and parsing output.
 Used by git analyzer to inspect repository history.
+
+Only history walking spawns git; repository checks read .git directly
+(see git_refs and git_index).
 """
 
+import os
 import subprocess
+from itertools import islice
 from typing import List
-from dataclasses import dataclass
-
-
-@dataclass
-class CommitInfo:
-    """Information about a git commit."""
-    hash: str
-    message: str
-    author: str
-    date: str
 
-    @property
-    def message_length(self) -> int:
-        """Get commit message length."""
-        return len(self.message)
-
-    @property
-    def is_meaningful(self) -> bool:
-        """Check if commit message is meaningful (not vague)."""
-        import re
-        vague_patterns = [
-            r'^update',
-            r'^fix',
-            r'^wip',
-            r'^tmp',
-            r'^test',
-            r'^\.',
-        ]
-        message_lower = self.message.lower()
-        return not any(re.match(pattern, message_lower) for pattern in vague_patterns)
+from ..models.git_models import CommitInfo
+from .git_log_stream import iter_log_entries
+from .git_refs import find_git_dir
 
 
 def check_git_repo(project_path: str) -> bool:
@@ -47,71 +26,35 @@ def check_git_repo(project_path: str) -> bool:
         project_path: Path to check
 
     Returns:
-        bool: True if git repo exists
+        bool: True if project_path is inside a git work tree (or git dir)
     """
-    try:
-        result = subprocess.run(
-            ['git', 'rev-parse', '--git-dir'],
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        return result.returncode == 0
-    except Exception:
-        return False
+    return os.path.isdir(project_path) and find_git_dir(project_path) is not None
 
 
 def get_commit_history(project_path: str, limit: int = 50) -> List[CommitInfo]:
     """
-    Get git commit history (OPTIMIZED).
+    Get the newest commits of a repository.
 
-    PERFORMANCE IMPROVEMENTS:
-    - Reduced default limit from 100 to 50 (faster)
-    - Shorter timeout (5s instead of 10s)
-    - More efficient format string
+    Reads only as much of the streamed log as needed (see git_log_stream);
+    use summarize_history for whole-history statistics.
 
     Args:
         project_path: Root directory of git repo
-        limit: Maximum commits to fetch (default: 50, reduced for speed)
+        limit: Maximum commits to return (default: 50)
 
     Returns:
-        List[CommitInfo]: Commit information
+        List[CommitInfo]: Commit information, newest first
 
     Example:
         >>> commits = get_commit_history('/path/to/repo')
         >>> print(f"Found {len(commits)} commits")
     """
+    commits: List[CommitInfo] = []
+    stream = iter_log_entries(project_path)
     try:
-        # Get commit log with custom format (optimized)
-        result = subprocess.run(
-            ['git', 'log', f'-{limit}', '--format=%H|%s|%an|%ad', '--date=short'],
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            timeout=5  # Reduced timeout
-        )
-
-        if result.returncode != 0:
-            return []
-
-        commits = []
-        for line in result.stdout.strip().split('\n'):
-            if not line:
-                continue
-
-            parts = line.split('|', 3)
-            if len(parts) == 4:
-                commits.append(CommitInfo(
-                    hash=parts[0][:8],  # Short hash (saves memory)
-                    message=parts[1],
-                    author=parts[2],
-                    date=parts[3]
-                ))
-
-        return commits
-    except subprocess.TimeoutExpired:
-        print("[!] Git command timed out (slow repository)")
-        return []
-    except Exception:
-        return []
+        commits.extend(commit for commit, _ in islice(stream, limit))
+    except (OSError, subprocess.TimeoutExpired):
+        pass  # Keep the commits read before git failed
+    finally:
+        stream.close()  # Stops git once limit commits are read
+    return commits
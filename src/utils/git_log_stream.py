@@ -0,0 +1,150 @@
+"""
+Git Log Stream Module
+
+Reads a repository's full commit history from ONE `git log -z --numstat`
+process, parsing records incrementally from the pipe, so memory does not
+grow with history length and no fixed commit cap is needed.
+
+Key Features:
+- NUL-delimited records: messages and paths need no quoting or escaping
+- Commits are yielded as parsed; HistoryStats and observers aggregate them
+- Author names and emails go through .mailmap (%aN / %aE)
+- Total commit count from `git rev-list --count`, without reading the log
+- A wall-clock limit kills git; the commits read so far are still yielded
+"""
+
+import subprocess
+import sys
+import threading
+from typing import Iterable, Iterator, List, Tuple
+
+from ..models.git_models import CommitInfo, HistoryStats
+from .git_objects import GIT_HISTORY_TIMEOUT
+
+
+_HEADER = '\x1e'  # Starts each commit record; fields are split by \x1f
+LOG_FORMAT = '%x1e%H%x1f%aN%x1f%aE%x1f%ad%x1f%at%x1f%s'
+_CHUNK = 64 * 1024
+
+
+def count_commits(project_path: str, rev: str = 'HEAD') -> int:
+    """
+    Count commits reachable from rev.
+
+    Example:
+        >>> count_commits('/path/to/repo')
+        137
+    """
+    try:
+        result = subprocess.run(['git', 'rev-list', '--count', rev], cwd=project_path,
+                                capture_output=True, text=True, timeout=GIT_HISTORY_TIMEOUT)
+        return int(result.stdout.strip()) if result.returncode == 0 else 0
+    except (OSError, ValueError, subprocess.TimeoutExpired):
+        return 0
+
+
+def iter_log_entries(project_path: str,
+                     timeout: float = GIT_HISTORY_TIMEOUT) -> Iterator[Tuple[CommitInfo, List]]:
+    """
+    Stream commits newest first, each with its per-file numstat changes.
+
+    Args:
+        project_path: Root directory of git repo
+        timeout: Wall-clock limit for the whole log in seconds
+
+    Yields:
+        Tuple of CommitInfo and its changes as (added, deleted, path)
+        tuples (0/0 for binary files; merges list no changes)
+
+    Raises:
+        subprocess.TimeoutExpired: After yielding everything read, if git
+            had to be killed at the time limit
+
+    Example:
+        >>> for commit, changes in iter_log_entries('/path/to/repo'):
+        ...     print(commit.hash, [path for _, _, path in changes])
+    """
+    command = ['git', 'log', '-z', '--numstat', '--no-renames', f'--format={LOG_FORMAT}',
+               '--date=short']
+    with subprocess.Popen(command, cwd=project_path, stdout=subprocess.PIPE,
+                          stderr=subprocess.DEVNULL) as process:
+        expired = threading.Event()
+        timer = threading.Timer(timeout, lambda: (expired.set(), process.kill()))
+        timer.start()
+        try:
+            header, changes, tail = None, [], b''
+            for chunk in iter(lambda: process.stdout.read(_CHUNK), b''):
+                tokens = (tail + chunk).split(b'\0')
+                tail = tokens.pop()  # Incomplete until the next NUL arrives
+                for token in tokens:
+                    text = token.decode('utf-8', errors='replace')
+                    if text.startswith(_HEADER):
+                        if header is not None:
+                            yield _commit(header, changes), changes
+                        header, changes = text[1:], []
+                    elif text.strip():
+                        _add_numstat(changes, text)
+            if header is not None:
+                yield _commit(header, changes), changes
+        finally:
+            timer.cancel()
+    if expired.is_set():
+        raise subprocess.TimeoutExpired(command, timeout)
+
+
+def summarize_history(project_path: str, sample_size: int = 10,
+                      timeout: float = GIT_HISTORY_TIMEOUT,
+                      observers: Iterable = ()) -> HistoryStats:
+    """
+    Aggregate the full history in constant memory.
+
+    Args:
+        project_path: Root directory of git repo
+        sample_size: Newest commits kept for display
+        timeout: Wall-clock limit for the whole log in seconds
+        observers: Further aggregators fed in the same pass; each has
+            add(commit, changes) (e.g. ContributionTracker)
+
+    Returns:
+        HistoryStats: Counters over every streamed commit; complete is
+        False if git was cut off
+
+    Example:
+        >>> stats = summarize_history('/path/to/repo')
+        >>> print(stats.commits, stats.vague_messages, stats.insertions)
+    """
+    stats = HistoryStats(sample_size=sample_size)
+    observers = list(observers)
+    try:
+        for commit, changes in iter_log_entries(project_path, timeout):
+            stats.add(commit)
+            for observer in observers:
+                observer.add(commit, changes)
+    except (OSError, subprocess.TimeoutExpired):
+        stats.complete = False
+    return stats
+
+
+def _commit(header: str, changes: List[Tuple[int, int, str]]) -> CommitInfo:
+    """Build a CommitInfo from a header record and its numstat changes."""
+    commit_hash, author, email, date, stamp, message = (header.split('\x1f', 5) + [''] * 5)[:6]
+    return CommitInfo(
+        hash=commit_hash[:8],  # Short hash (saves memory)
+        message=message,
+        author=sys.intern(author),  # Few authors, many commits
+        date=date,
+        timestamp=int(stamp) if stamp.isdigit() else 0,
+        insertions=sum(added for added, _, _ in changes),
+        deletions=sum(deleted for _, deleted, _ in changes),
+        files_changed=len(changes),
+        email=sys.intern(email)
+    )
+
+
+def _add_numstat(changes: list, entry: str) -> None:
+    """Parse one 'added<TAB>deleted<TAB>path' entry ('-' for binary files)."""
+    fields = entry.lstrip('\n').split('\t', 2)
+    if len(fields) == 3:
+        added, deleted, path = fields
+        changes.append((int(added) if added.isdigit() else 0,
+                        int(deleted) if deleted.isdigit() else 0, path))
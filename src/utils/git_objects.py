@@ -0,0 +1,150 @@
+"""
+Git Object Utilities
+
+Streaming access to every object reachable in a repository's history.
+Used by the history secret scanner to inspect deleted content.
+
+Key Features:
+- Unique blob enumeration with `git rev-list --objects --all`
+- Introducing-commit lookup from one `git log --raw` stream, killed at
+  the same history time limit as every other history command
+- One long-lived `git cat-file --batch` process for all blob reads
+"""
+
+import subprocess
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+GIT_HISTORY_TIMEOUT = 60  # Seconds; history commands walk every commit
+_NULL_SHA = '0' * 40
+
+
+def list_history_blobs(
+    project_path: str,
+    extensions: Iterable[str] = None,
+    ignore_dirs: Iterable[str] = ()
+) -> List[Tuple[str, str]]:
+    """
+    List unique objects reachable from any ref, with the path they appeared at.
+
+    Each object SHA is listed once, even if it occurs in many commits or
+    at several paths.
+
+    Args:
+        project_path: Root directory of git repo
+        extensions: Keep only paths ending with these suffixes (optional)
+        ignore_dirs: Drop paths under directories with these names (optional)
+
+    Returns:
+        List[Tuple[str, str]]: (object_sha, path) pairs; empty on error
+
+    Example:
+        >>> list_history_blobs('/path/to/repo', ['.py'])[:1]
+        [('3b18e512dba79e4c8300dd08aeb37f8e728b8dad', 'src/main.py')]
+    """
+    suffixes = tuple(extensions) if extensions is not None else None
+    ignored = set(ignore_dirs)
+    try:
+        result = subprocess.run(
+            ['git', 'rev-list', '--objects', '--all'],
+            cwd=project_path, capture_output=True, text=True,
+            errors='replace', timeout=GIT_HISTORY_TIMEOUT
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return []
+    if result.returncode != 0:
+        return []
+    blobs = []
+    for line in result.stdout.splitlines():
+        sha, _, path = line.partition(' ')
+        if not path or (suffixes is not None and not path.endswith(suffixes)):
+            continue
+        if ignored and not ignored.isdisjoint(path.split('/')[:-1]):
+            continue  # e.g. a committed venv/ or node_modules/
+        blobs.append((sha, path))
+    return blobs
+
+
+def map_introducing_commits(project_path: str,
+                            timeout: float = GIT_HISTORY_TIMEOUT) -> Tuple[Dict[str, str], bool]:
+    """
+    Map each blob SHA to the oldest commit that introduced it.
+
+    Args:
+        project_path: Root directory of git repo
+        timeout: Wall-clock limit for the whole log in seconds
+
+    Returns:
+        Tuple of the blob SHA -> full commit hash map (empty on error) and
+        a complete flag, False if git was killed at the time limit (the
+        map then covers only the oldest commits read)
+    """
+    introduced: Dict[str, str] = {}
+    command = ['git', 'log', '--all', '--reverse', '--raw', '--no-abbrev',
+               '--no-renames', '--format=%H']
+    try:
+        with subprocess.Popen(command, cwd=project_path, stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, text=True,
+                              errors='replace') as process:
+            expired = threading.Event()
+            timer = threading.Timer(timeout, lambda: (expired.set(), process.kill()))
+            timer.start()
+            try:
+                commit = ''
+                for line in process.stdout:
+                    if line.startswith(':'):
+                        # ":<old mode> <new mode> <old sha> <new sha> <status>\t<path>"
+                        new_sha = line.split('\t', 1)[0].split()[3]
+                        if new_sha != _NULL_SHA and new_sha not in introduced:
+                            introduced[new_sha] = commit
+                    elif line.strip():
+                        commit = line.strip()
+            finally:
+                timer.cancel()
+    except OSError:
+        return {}, False
+    return introduced, not expired.is_set()
+
+
+class BlobReader:
+    """
+    Reads many objects through one `git cat-file --batch` process.
+
+    Example:
+        >>> with BlobReader('/path/to/repo') as reader:
+        ...     data = reader.read('3b18e512dba79e4c8300dd08aeb37f8e728b8dad')
+    """
+
+    def __init__(self, project_path: str):
+        """Start the cat-file process for the repository at project_path."""
+        self._process = subprocess.Popen(
+            ['git', 'cat-file', '--batch'], cwd=project_path,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+
+    def read(self, sha: str) -> Optional[bytes]:
+        """Return the contents of a blob, or None if missing or not a blob."""
+        self._process.stdin.write(sha.encode('ascii') + b'\n')
+        self._process.stdin.flush()
+        header = self._process.stdout.readline().split()
+        if len(header) != 3:
+            return None  # "<sha> missing" (or the process died)
+        data = self._process.stdout.read(int(header[2]))
+        self._process.stdout.read(1)  # Trailing newline after the contents
+        return data if header[1] == b'blob' else None
+
+    def close(self) -> None:
+        """Stop the cat-file process."""
+        try:
+            self._process.stdin.close()
+        except OSError:
+            pass  # Process already exited
+        self._process.wait()
+        self._process.stdout.close()
+
+    def __enter__(self) -> 'BlobReader':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
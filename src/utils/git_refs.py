@@ -0,0 +1,143 @@
+"""
+Git Refs Module
+
+In-process answers to "is this a repository" and "what is HEAD", read
+straight from the .git directory instead of spawning `git rev-parse`.
+
+Key Features:
+- Repository discovery like git's: walks up from the project path and
+  follows `gitdir:` files (worktrees, submodules)
+- Symbolic refs (HEAD -> refs/heads/main) resolved through loose ref
+  files first, then packed-refs
+- Worktrees read shared refs from the common directory (commondir)
+
+Design Decision: Only history walking still uses subprocess git; across
+a cohort these small checks were thousands of fork/execs.
+"""
+
+import os
+import re
+from typing import Dict, Optional, Tuple
+
+
+_SHA = re.compile(r'^[0-9a-f]{40}(?:[0-9a-f]{24})?$')  # SHA-1 or SHA-256
+_MAX_SYMREF_DEPTH = 5  # Same limit as git's
+
+
+def find_git_dir(project_path: str) -> Optional[str]:
+    """
+    Find the git directory governing project_path (None if not in a repo).
+
+    Example:
+        >>> find_git_dir('/path/to/repo/src')
+        '/path/to/repo/.git'
+    """
+    repo = find_repo(project_path)
+    return repo[1] if repo else None
+
+
+def find_repo(project_path: str) -> Optional[Tuple[str, str]]:
+    """
+    Find the (work tree root, git directory) pair governing project_path.
+
+    Example:
+        >>> find_repo('/path/to/repo/src')
+        ('/path/to/repo', '/path/to/repo/.git')
+    """
+    path = os.path.abspath(project_path)
+    while True:
+        dot_git = os.path.join(path, '.git')
+        if os.path.isfile(dot_git):
+            dot_git = _read_gitdir_file(dot_git)
+        if dot_git and _is_git_dir(dot_git):
+            return path, dot_git
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def read_head(git_dir: str) -> Optional[str]:
+    """
+    SHA of the commit HEAD points to (None in a repo without commits).
+
+    Example:
+        >>> read_head(find_git_dir('/path/to/repo'))
+        '3b18e512dba79e4c8300dd08aeb37f8e728b8dad'
+    """
+    return resolve_ref(git_dir, 'HEAD')
+
+
+def resolve_ref(git_dir: str, name: str) -> Optional[str]:
+    """Resolve a ref name (following symbolic refs) to an object SHA."""
+    for _ in range(_MAX_SYMREF_DEPTH):
+        value = _read_loose_ref(git_dir, name)
+        if value is None:
+            return read_packed_refs(git_dir).get(name)
+        if not value.startswith('ref: '):
+            return value if _SHA.match(value) else None
+        name = value[5:].strip()
+    return None
+
+
+def read_packed_refs(git_dir: str) -> Dict[str, str]:
+    """
+    Parse packed-refs into {ref name: SHA} (peeled '^' lines skipped).
+
+    Example:
+        >>> read_packed_refs(git_dir)['refs/heads/main']
+        '3b18e512dba79e4c8300dd08aeb37f8e728b8dad'
+    """
+    refs = {}
+    try:
+        with open(os.path.join(common_dir(git_dir), 'packed-refs'), encoding='utf-8') as f:
+            for line in f:
+                if line.startswith(('#', '^')):
+                    continue
+                sha, _, name = line.rstrip('\n').partition(' ')
+                if name and _SHA.match(sha):
+                    refs[name] = sha
+    except OSError:
+        pass
+    return refs
+
+
+def _read_loose_ref(git_dir: str, name: str) -> Optional[str]:
+    """Contents of a loose ref file; per-worktree refs first, then shared ones."""
+    directories = [git_dir] if name == 'HEAD' else [git_dir, common_dir(git_dir)]
+    for directory in directories:
+        try:
+            with open(os.path.join(directory, *name.split('/')), encoding='utf-8') as f:
+                return f.read().strip()
+        except (OSError, UnicodeDecodeError):
+            continue
+    return None
+
+
+def common_dir(git_dir: str) -> str:
+    """Directory holding shared refs and objects (differs for linked worktrees)."""
+    try:
+        with open(os.path.join(git_dir, 'commondir'), encoding='utf-8') as f:
+            return os.path.normpath(os.path.join(git_dir, f.read().strip()))
+    except OSError:
+        return git_dir
+
+
+def _read_gitdir_file(dot_git: str) -> Optional[str]:
+    """Target of a 'gitdir: <path>' file (worktrees and submodules)."""
+    try:
+        with open(dot_git, encoding='utf-8') as f:
+            content = f.read().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if not content.startswith('gitdir:'):
+        return None
+    return os.path.normpath(os.path.join(os.path.dirname(dot_git), content[7:].strip()))
+
+
+def _is_git_dir(path: str) -> bool:
+    """Check for HEAD, objects and refs, as git's discovery does."""
+    common = common_dir(path)
+    return (os.path.isfile(os.path.join(path, 'HEAD'))
+            and os.path.isdir(os.path.join(common, 'objects'))
+            and os.path.isdir(os.path.join(common, 'refs')))
@@ -0,0 +1,105 @@
+"""
+Line Classifier Module
+
+Classifies every line of a source file as code, comment or blank in ONE
+pass over the text. Backs all LOC-based rubric items.
+
+Key Features:
+- Python: tokenize-equivalent string/comment rules; docstrings and
+  '#' comments count as comments (see python_line_lexer)
+- JavaScript/TypeScript and other C-style languages: small state machine
+  for '//' and '/* */' comments, quotes and template literals
+- Shell/YAML/TOML: '#' comment lines
+- Batch API for classifying many files with one call
+
+Design Decision: Line-oriented state machines with a fast path for plain
+code lines. On Python < 3.12 the tokenize module is pure Python and was
+measured slower than the old four-read counter, so it is not used here.
+"""
+
+import os
+from typing import Dict, Iterable, List, Tuple
+
+from .c_style_lexer import C_STYLE_EXTENSIONS, count_c_style_lines
+from .content_store import ContentStore, read_text
+from .python_line_lexer import count_python_lines
+
+
+HASH_COMMENT_EXTENSIONS = {'.sh', '.yaml', '.yml', '.toml', '.r', '.rb'}
+
+
+def classify_lines(text: str, extension: str = '') -> Dict[str, int]:
+    """
+    Count total, code, comment and blank lines in a single pass.
+
+    A line holding both code and a comment counts as code.
+
+    Args:
+        text: Decoded file contents (universal newlines)
+        extension: File extension used to pick the lexer (e.g. '.py')
+
+    Returns:
+        Dict with 'total', 'code', 'comments' and 'blank' counts
+
+    Example:
+        >>> classify_lines("'''Doc.'''\\n\\nx = 1  # set\\n", '.py')
+        {'total': 3, 'code': 1, 'comments': 1, 'blank': 1}
+    """
+    lines = text.split('\n')
+    if lines[-1] == '':
+        lines.pop()  # Trailing newline does not start a new line
+
+    ext = extension.lower()
+    if ext == '.py':
+        code, comments, blank = count_python_lines(lines)
+    elif ext in C_STYLE_EXTENSIONS:
+        code, comments, blank = count_c_style_lines(lines)
+    else:
+        marker = '#' if ext in HASH_COMMENT_EXTENSIONS else None
+        code, comments, blank = _count_marker_lines(lines, marker)
+
+    return {'total': len(lines), 'code': code, 'comments': comments, 'blank': blank}
+
+
+def classify_files(
+    file_paths: Iterable[str],
+    store: ContentStore = None
+) -> Dict[str, Dict[str, int]]:
+    """
+    Classify many files in one call (each file is read exactly once).
+
+    Args:
+        file_paths: Files to classify
+        store: Shared content cache (optional)
+
+    Returns:
+        Dict mapping each readable file path to its line statistics;
+        unreadable files are omitted
+
+    Example:
+        >>> stats = classify_files(find_code_files('/path/to/project'))
+        >>> sum(s['code'] for s in stats.values())
+        4210
+    """
+    results = {}
+    for file_path in file_paths:
+        try:
+            text = read_text(file_path, store)
+        except OSError:
+            continue
+        results[file_path] = classify_lines(text, os.path.splitext(file_path)[1])
+    return results
+
+
+def _count_marker_lines(lines: List[str], marker: str) -> Tuple[int, int, int]:
+    """Classify lines where comments are whole lines starting with marker."""
+    code = comments = blank = 0
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            blank += 1
+        elif marker and stripped.startswith(marker):
+            comments += 1
+        else:
+            code += 1
+    return code, comments, blank
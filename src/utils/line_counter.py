@@ -2,25 +2,31 @@
 Line Counter Utility Module
 
 Counts lines of code with optional filtering for comments and blank lines.
-Supports multiple programming languages with different comment styles.
 
 Key Features:
-- Accurate line counting
-- Comment filtering by language
-- Blank line detection
+- One read and one classification pass per file (code, comment, blank)
+- Comment filtering by language, including Python docstrings
+- Zero-decode newline counting; one read per file for size-limit checks
 """
 
 import os
-import re
 from typing import Dict
 
-from .comment_patterns import COMMENT_PATTERNS, EXTENSION_LANGUAGE_MAP
+from .analysis_cache import AnalysisCache
+from .cache_lookup import cached_call
+from .content_store import ContentStore, read_text
+from .line_classifier import classify_lines
+
+
+CHUNK_SIZE = 1024 * 1024  # Binary read size for newline counting
+LINE_STATS_CACHE_VERSION = 1
 
 
 def count_lines(
     file_path: str,
     exclude_comments: bool = False,
-    exclude_blank: bool = False
+    exclude_blank: bool = False,
+    store: ContentStore = None
 ) -> int:
     """
     Count lines in a file with optional filtering.
@@ -29,6 +35,7 @@ def count_lines(
         file_path: Path to file
         exclude_comments: If True, don't count comment-only lines
         exclude_blank: If True, don't count blank lines
+        store: Shared content cache (optional)
 
     Returns:
         int: Number of lines (after applying filters)
@@ -42,101 +49,101 @@ def count_lines(
         >>> print(f"Total: {total}, Code only: {code_only}")
         Total: 150, Code only: 120
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
-
-    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-        lines = f.readlines()
-
-    if not exclude_comments and not exclude_blank:
-        return len(lines)
-
-    # Determine language from extension
-    ext = os.path.splitext(file_path)[1]
-    lang = _detect_language(ext)
-
-    count = 0
-    in_multi_line_comment = False
-
-    for line in lines:
-        stripped = line.strip()
-
-        # Skip blank lines if requested
-        if exclude_blank and not stripped:
-            continue
-
-        # Skip comments if requested
-        if exclude_comments and lang:
-            if _is_comment_line(stripped, lang, in_multi_line_comment):
-                # Update multi-line comment state
-                in_multi_line_comment = _update_comment_state(
-                    stripped, lang, in_multi_line_comment
-                )
-                continue
-
-        count += 1
+    stats = get_line_stats(file_path, store)
 
+    count = stats['total']
+    if exclude_comments:
+        count -= stats['comments']
+    if exclude_blank:
+        count -= stats['blank']
     return count
 
 
-def get_line_stats(file_path: str) -> Dict[str, int]:
+def get_line_stats(file_path: str, store: ContentStore = None,
+                   cache: AnalysisCache = None) -> Dict[str, int]:
     """
     Get detailed line statistics for a file.
 
     Args:
         file_path: Path to file
+        store: Shared content cache (optional)
+        cache: Persistent analysis cache (optional, serves unchanged files)
 
     Returns:
         Dict containing:
             - total: Total lines
             - code: Lines with code
-            - comments: Comment-only lines
+            - comments: Comment-only lines (including docstrings)
             - blank: Blank lines
 
+    Raises:
+        FileNotFoundError: If file doesn't exist
+
     Example:
         >>> stats = get_line_stats('script.py')
         >>> print(f"Code: {stats['code']}, Comments: {stats['comments']}")
         Code: 120, Comments: 25
     """
-    total = count_lines(file_path, exclude_comments=False, exclude_blank=False)
-    code = count_lines(file_path, exclude_comments=True, exclude_blank=True)
-    blank_count = count_lines(file_path, exclude_blank=False) - \
-                  count_lines(file_path, exclude_blank=True)
-
-    return {
-        'total': total,
-        'code': code,
-        'comments': total - code - blank_count,
-        'blank': blank_count
-    }
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}")
 
+    extension = os.path.splitext(file_path)[1]
+    return cached_call(cache, file_path, f'line_stats{extension}', LINE_STATS_CACHE_VERSION,
+                       lambda: classify_lines(read_text(file_path, store), extension), store)
 
-def _detect_language(extension: str) -> str:
-    """Detect language from file extension."""
-    return EXTENSION_LANGUAGE_MAP.get(extension.lower(), '')
 
+def count_newlines(file_path: str, stop_after: int = None) -> int:
+    """
+    Count lines at the byte level, without decoding the file.
 
-def _is_comment_line(line: str, lang: str, in_multi: bool) -> bool:
-    """Check if line is a comment."""
-    if in_multi:
-        return True
+    Counts exactly like readlines() in text mode: '\\n', '\\r\\n' and a lone
+    '\\r' each end a line, and a final unterminated line counts too.
 
-    patterns = COMMENT_PATTERNS.get(lang, {})
-    single_pattern = patterns.get('single_line')
+    Args:
+        file_path: Path to file
+        stop_after: Stop reading once the count exceeds this value
+            (the result is then a lower bound)
 
-    if single_pattern and re.match(single_pattern, line):
-        return True
+    Returns:
+        int: Number of lines (exact unless stop_after was exceeded)
 
-    return False
+    Example:
+        >>> count_newlines('script.py')
+        150
+    """
+    count = 0
+    last = b''
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            count += chunk.count(b'\n')
+            if b'\r' in chunk:
+                count += chunk.count(b'\r') - chunk.count(b'\r\n')
+            if last == b'\r' and chunk[:1] == b'\n':
+                count -= 1  # CRLF split across two chunks
+            last = chunk[-1:]
+            if stop_after is not None and count > stop_after:
+                return count
+    if last and last not in b'\r\n':
+        count += 1
+    return count
 
 
-def _update_comment_state(line: str, lang: str, in_multi: bool) -> bool:
-    """Update multi-line comment tracking state."""
-    patterns = COMMENT_PATTERNS.get(lang, {})
+def exceeds_line_limit(file_path: str, limit: int, size: int = None) -> int:
+    """
+    Count a file's lines if it has more than limit, reading it at most once.
 
-    if patterns.get('multi_line_start') and re.match(patterns['multi_line_start'], line):
-        return True
-    if patterns.get('multi_line_end') and re.search(patterns['multi_line_end'], line):
-        return False
+    Args:
+        file_path: Path to file
+        limit: Maximum allowed lines
+        size: File size in bytes if already known (e.g. from a ProjectSnapshot)
 
-    return in_multi
+    Returns:
+        int: Exact line count if over the limit, else 0 (a pass/fail flag too)
+    """
+    if (os.path.getsize(file_path) if size is None else size) <= limit:
+        return 0  # Every line takes at least one byte: not even opened
+    line_count = count_newlines(file_path)
+    return line_count if line_count > limit else 0
@@ -0,0 +1,138 @@
+"""
+Line Coverage Module
+
+Low-overhead line-coverage collector for student test runs.
+
+On Python 3.12+ it uses sys.monitoring: each LINE event callback returns
+DISABLE, so every line costs one callback the first time it runs and
+nothing afterwards - loops and hot helpers run at full speed. Older
+interpreters fall back to sys.settrace (every line event, every time).
+
+Standard library only and runnable as a script, so it works inside
+pooled student environments that have nothing but pytest installed:
+
+    python line_coverage.py --source DIR --output lines.json [--omit PATTERNS] -m pytest -q
+
+The output maps each executed file to its executed line numbers; see
+coverage_report for the per-file fractions the rubric uses.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import runpy
+import sys
+import threading
+from typing import Dict, Iterable, Set
+
+MONITORING = hasattr(sys, 'monitoring')  # Python 3.12+
+
+
+class LineCollector:
+    """
+    Records executed lines of the .py files under a source directory.
+
+    Example:
+        >>> collector = LineCollector('/tmp/work', omit=['*/tests/*'])
+        >>> collector.start(); run_tests(); collector.stop()
+        >>> collector.executed['/tmp/work/calc.py']
+        {1, 2, 5}
+    """
+
+    def __init__(self, source: str, omit: Iterable[str] = (), use_monitoring: bool = MONITORING):
+        """Track files under source except those matching an omit pattern."""
+        self.source = os.path.join(os.path.realpath(source), '')
+        self.omit = tuple(omit)
+        self.use_monitoring = use_monitoring
+        self.executed: Dict[str, Set[int]] = {}
+        self._tracked: Dict[str, bool] = {}  # co_filename -> tracked?
+        self._tracers = {}  # co_filename -> local settrace function
+
+    def tracks(self, filename: str) -> bool:
+        """Check (once per file name) whether a file's lines are recorded."""
+        tracked = self._tracked.get(filename)
+        if tracked is None:
+            path = os.path.realpath(filename)
+            tracked = (path.startswith(self.source) and path.endswith('.py')
+                       and not any(fnmatch.fnmatch(path, pattern) for pattern in self.omit))
+            self._tracked[filename] = tracked
+        return tracked
+
+    def start(self) -> None:
+        """Begin recording in all threads."""
+        if self.use_monitoring:
+            monitoring = sys.monitoring
+            monitoring.use_tool_id(monitoring.COVERAGE_ID, 'auto-grader')
+            monitoring.register_callback(monitoring.COVERAGE_ID, monitoring.events.LINE,
+                                         self._on_line)
+            monitoring.set_events(monitoring.COVERAGE_ID, monitoring.events.LINE)
+            monitoring.restart_events()  # Re-arm lines disabled by an earlier session
+        else:
+            threading.settrace(self._on_call)
+            sys.settrace(self._on_call)
+
+    def stop(self) -> None:
+        """Stop recording."""
+        if self.use_monitoring:
+            monitoring = sys.monitoring
+            monitoring.set_events(monitoring.COVERAGE_ID, 0)
+            monitoring.register_callback(monitoring.COVERAGE_ID, monitoring.events.LINE, None)
+            monitoring.free_tool_id(monitoring.COVERAGE_ID)
+        else:
+            sys.settrace(None)
+            threading.settrace(None)
+
+    def _on_line(self, code, line_number: int):
+        """sys.monitoring LINE callback: record, then never fire here again."""
+        filename = code.co_filename
+        if self.tracks(filename):
+            self.executed.setdefault(filename, set()).add(line_number)
+        return sys.monitoring.DISABLE
+
+    def _on_call(self, frame, event: str, arg):
+        """settrace global function: trace only frames of tracked files."""
+        filename = frame.f_code.co_filename
+        if not self.tracks(filename):
+            return None
+        tracer = self._tracers.get(filename)
+        if tracer is None:
+            lines = self.executed.setdefault(filename, set())
+
+            def tracer(frame, event, arg):
+                if event == 'line':
+                    lines.add(frame.f_lineno)
+                return tracer
+            self._tracers[filename] = tracer
+        return tracer
+
+
+def main(argv=None) -> int:
+    """Run a module (like python -m) under the collector; write executed lines."""
+    argv = sys.argv[1:] if argv is None else argv
+    split = argv.index('-m') + 2 if '-m' in argv else len(argv)  # Module args pass through
+    parser = argparse.ArgumentParser(description='Run a module under the line collector')
+    parser.add_argument('--source', required=True, help='Directory whose files are measured')
+    parser.add_argument('--output', required=True, help='JSON file for executed lines')
+    parser.add_argument('--omit', default='', help='Comma-separated fnmatch patterns')
+    parser.add_argument('-m', dest='module', required=True, help='Module to run')
+    options = parser.parse_args(argv[:split])
+
+    sys.argv = [options.module] + argv[split:]
+    sys.path[0] = os.getcwd()  # As with python -m, not this script's directory
+    collector = LineCollector(options.source, [p for p in options.omit.split(',') if p])
+    collector.start()
+    try:
+        runpy.run_module(options.module, run_name='__main__', alter_sys=True)
+        code = 0
+    except SystemExit as exit_:
+        code = exit_.code if isinstance(exit_.code, int) else int(exit_.code is not None)
+    finally:
+        collector.stop()
+        with open(options.output, 'w', encoding='utf-8') as f:
+            json.dump({path: sorted(lines) for path, lines in collector.executed.items()}, f)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+Output Capture Module
+
+Drains a child process's stdout/stderr pipe on a background thread while
+keeping only the last max_bytes, so a job that prints without end cannot
+exhaust the grader's memory (subprocess.communicate buffers everything).
+
+Key Features:
+- Constant memory per stream: the kept tail is trimmed as chunks arrive
+- The pipe keeps being drained, so the child never blocks on a full pipe
+- join() takes a timeout: a grandchild that escaped the process group
+  and still holds the pipe open cannot hang the caller
+
+Design Decision: The reader threads are daemons. A reader still blocked
+on a pipe held open by an escaped process is abandoned, not closed under
+it, and exits on its own once that process does.
+"""
+
+import threading
+from typing import IO
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+class TailCapture:
+    """
+    Background reader keeping the last max_bytes of a binary stream.
+
+    Example:
+        >>> capture = TailCapture(proc.stdout, max_bytes=16000)
+        >>> proc.wait()
+        >>> capture.join(timeout=5)
+        >>> capture.text(4000)
+    """
+
+    def __init__(self, stream: IO[bytes], max_bytes: int):
+        """Start draining stream; data beyond the last max_bytes is dropped."""
+        self.max_bytes = max_bytes
+        self.truncated = False
+        self._stream = stream
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def join(self, timeout: float) -> bool:
+        """Wait up to timeout seconds for end of stream; True if it was reached."""
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def data(self) -> bytes:
+        """Bytes kept so far (the tail of the stream)."""
+        with self._lock:
+            return bytes(self._buffer)
+
+    def text(self, max_chars: int) -> str:
+        """Decode the last max_chars characters kept."""
+        return self.data().decode('utf-8', errors='replace')[-max_chars:]
+
+    def _drain(self) -> None:
+        """Read chunks until end of stream, trimming the kept tail."""
+        try:
+            for chunk in iter(lambda: self._stream.read1(CHUNK_SIZE), b''):
+                with self._lock:
+                    self._buffer += chunk
+                    excess = len(self._buffer) - self.max_bytes
+                    if excess > 0:
+                        del self._buffer[:excess]
+                        self.truncated = True
+        except (OSError, ValueError):
+            pass  # Pipe closed under us
+        finally:
+            try:
+                self._stream.close()
+            except OSError:
+                pass
@@ -0,0 +1,146 @@
+"""
+Python Line Lexer Module
+
+Line-oriented state machine that classifies Python source lines as code,
+comment or blank, following tokenize's rules for strings and comments.
+
+Design Decision: Lines without quotes or '#' (the vast majority) take a
+fast path of a few C-level string operations; only the remaining lines
+are lexed with compiled regexes. Statement-level string literals
+(docstrings) are classified as comments, exactly like a tokenize-based
+classifier, but without tokenize's per-token Python overhead.
+"""
+
+import re
+from typing import List, Tuple
+
+# Start of a comment or of a string literal
+_START = re.compile(r'''[#'"]''')
+
+# String prefixes; letters directly before a quote are never an identifier
+_PREFIXES = {'r', 'u', 'b', 'f', 'br', 'rb', 'fr', 'rf'}
+
+# Remainder of a string literal after its opening delimiter
+_END = {
+    "'''": re.compile(r"[^'\\]*(?:(?:\\.|'(?!''))[^'\\]*)*'''"),
+    '"""': re.compile(r'[^"\\]*(?:(?:\\.|"(?!""))[^"\\]*)*"""'),
+    "'": re.compile(r"[^'\\]*(?:\\.[^'\\]*)*'"),
+    '"': re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"'),
+}
+
+
+def _bracket_delta(fragments: List[str]) -> int:
+    """Net bracket depth change over a batch of code fragments."""
+    code = ''.join(fragments)
+    fragments.clear()
+    return (code.count('(') + code.count('[') + code.count('{')
+            - code.count(')') - code.count(']') - code.count('}'))
+
+
+def _is_prefix(fragment: str) -> bool:
+    """Check whether a fragment before a quote is only a string prefix."""
+    return fragment.lstrip().lower() in _PREFIXES
+
+
+def _is_statement_end(rest: str) -> bool:
+    """Check that nothing but whitespace or a comment follows a string."""
+    rest = rest.strip()
+    return not rest or rest[0] == '#'
+
+
+def count_python_lines(lines: List[str]) -> Tuple[int, int, int]:
+    """
+    Classify Python source lines in one pass.
+
+    Args:
+        lines: Source lines without trailing newlines
+
+    Returns:
+        Tuple[int, int, int]: (code, comments, blank) line counts
+    """
+    code = comments = blank = 0
+    open_quote = None  # Delimiter of a string continuing past this line
+    open_is_doc = False  # That string started a statement at depth 0
+    open_lines = 0  # Lines spanned so far by the open string
+    pending: List[str] = []  # Code fragments not yet bracket-counted
+    depth = 0
+    continued = False  # Previous code line ended with a backslash
+
+    for line in lines:
+        pos = 0
+        has_code = has_comment = False
+        if open_quote is not None:
+            end = _END[open_quote].match(line)
+            if end is None:
+                open_lines += 1
+                continue
+            pos = end.end()
+            if open_is_doc and _is_statement_end(line[pos:]):
+                comments += open_lines + 1
+                open_quote = None
+                continue
+            code += open_lines
+            open_quote = None
+            has_code = True
+        else:
+            stripped = line.strip()
+            if not stripped:
+                blank += 1
+                continue
+            if stripped[0] == '#':
+                comments += 1
+                continue
+            if '#' not in line and "'" not in line and '"' not in line:
+                code += 1
+                pending.append(line)
+                continued = line.endswith('\\')
+                continue
+
+        while True:
+            match = _START.search(line, pos)
+            start = match.start() if match else len(line)
+            fragment = line[pos:start]
+            if fragment.strip() and not (match and _is_prefix(fragment)):
+                has_code = True
+                pending.append(fragment)
+            if match is None:
+                break
+            token = match.group()
+            if token == '#':
+                has_comment = True
+                break
+
+            quote = token * 3 if line.startswith(token * 3, start) else token
+            candidate = not has_code and not continued
+            if candidate:
+                depth += _bracket_delta(pending)
+                candidate = depth <= 0
+            end = _END[quote].match(line, start + len(quote))
+            if end is None and (len(quote) == 3 or line.endswith('\\')):
+                open_quote, open_is_doc, open_lines = quote, candidate, 1
+                break
+            if end is None:
+                has_code = True  # Unterminated literal: rest of line is code
+                break
+            if candidate and _is_statement_end(line[end.end():]):
+                has_comment = True  # Single-line docstring
+                break
+            has_code = True
+            pos = end.end()
+
+        if open_quote is not None:
+            continued = False
+        elif has_code:
+            code += 1
+            continued = not has_comment and line.endswith('\\')
+        elif has_comment:
+            comments += 1
+        else:
+            blank += 1
+
+    if open_quote is not None:  # Unterminated string at end of file
+        if open_is_doc:
+            comments += open_lines
+        else:
+            code += open_lines
+    return code, comments, blank
@@ -0,0 +1,148 @@
+"""
+Sandbox Module
+
+Runs untrusted student code (test suites) in a resource-limited child
+process.
+
+Key Features:
+- Wall-clock timeout; the whole process group is killed on expiry, so
+  grandchildren spawned by the tests die too
+- RLIMIT_AS (memory), RLIMIT_CPU, RLIMIT_FSIZE and no core dumps (POSIX)
+- Scrubbed environment: only PATH and locale variables are inherited, so
+  tokens and credentials of the grading host never reach student code
+- Output is drained into bounded tails (see output_capture), so a noisy
+  job cannot exhaust the grader's memory
+
+Design Decision: The limits are plain POSIX rlimits, which need no
+privileges or container runtime. A tiny launcher interpreter sets them
+and then execs the job, instead of a preexec_fn, which is unsafe when
+the cohort runner's threads are alive. On Windows only the timeout
+applies. Network access is not restricted.
+"""
+
+import os
+import signal
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+from ..models.compact import frozen_model
+from .output_capture import TailCapture
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+DEFAULT_TIMEOUT = 300  # Wall-clock seconds per job
+DEFAULT_MEMORY_MB = 1024  # Address-space limit per job
+MAX_OUTPUT_FILE_MB = 256  # Largest file the job may write
+OUTPUT_TAIL = 4000  # Characters of stdout/stderr kept in the result
+CAPTURE_BYTES = OUTPUT_TAIL * 4  # Enough bytes for OUTPUT_TAIL UTF-8 characters
+DRAIN_TIMEOUT = 5  # Seconds to wait for pipes after the job exits
+_INHERITED_ENV = ('PATH', 'LANG', 'LC_ALL', 'SYSTEMROOT', 'TMPDIR')
+_LAUNCHER = """import os, resource, sys
+for item in sys.argv[1].split(','):
+    name, value = item.split('=')
+    limit, value = getattr(resource, name), int(value)
+    hard = resource.getrlimit(limit)[1]
+    if hard != resource.RLIM_INFINITY:
+        value = min(value, hard)
+    resource.setrlimit(limit, (value, value))
+os.execv(sys.argv[2], sys.argv[2:])
+"""
+
+
+@frozen_model
+class SandboxResult:
+    """Outcome of a sandboxed command."""
+    returncode: int
+    stdout: str  # Tail only (OUTPUT_TAIL characters)
+    stderr: str
+    timed_out: bool
+    duration: float
+
+
+def sandbox_env(home: str, extra: Dict[str, str] = None) -> Dict[str, str]:
+    """Minimal environment for a sandboxed job, with HOME pointed at home."""
+    env = {key: os.environ[key] for key in _INHERITED_ENV if key in os.environ}
+    env.update({'HOME': home, 'PYTHONDONTWRITEBYTECODE': '1', 'PYTHONHASHSEED': '0'})
+    env.update(extra or {})
+    return env
+
+
+def run_sandboxed(
+    cmd: List[str],
+    cwd: str,
+    env: Dict[str, str],
+    timeout: float = DEFAULT_TIMEOUT,
+    memory_mb: int = DEFAULT_MEMORY_MB
+) -> SandboxResult:
+    """
+    Run a command under the sandbox limits.
+
+    Args:
+        cmd: Command and arguments (cmd[0] an absolute program path)
+        cwd: Working directory (a scratch copy of the submission)
+        env: Complete child environment (see sandbox_env)
+        timeout: Wall-clock limit in seconds
+        memory_mb: Address-space limit in MB
+
+    Returns:
+        SandboxResult: Exit code (negative signal number if killed), output
+        tails, whether the timeout fired, and elapsed seconds
+
+    Example:
+        >>> result = run_sandboxed([sys.executable, '-m', 'pytest'], work, env, timeout=60)
+        >>> print(result.timed_out, result.returncode)
+    """
+    start = time.perf_counter()
+    posix = sys.platform != 'win32'
+    if resource is not None:
+        cmd = [sys.executable, '-c', _LAUNCHER, _limits(timeout, memory_mb)] + list(cmd)
+    proc = subprocess.Popen(
+        cmd, cwd=cwd, env=env, stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        start_new_session=posix  # Own process group, killed as a whole
+    )
+    captures = [TailCapture(proc.stdout, CAPTURE_BYTES), TailCapture(proc.stderr, CAPTURE_BYTES)]
+    try:
+        proc.wait(timeout=timeout)
+        timed_out = False
+    except subprocess.TimeoutExpired:
+        _kill_group(proc, posix)
+        proc.wait()
+        timed_out = True
+    for capture in captures:
+        capture.join(DRAIN_TIMEOUT)  # A grandchild that escaped the group may hold the pipe
+
+    return SandboxResult(
+        returncode=proc.returncode,
+        stdout=captures[0].text(OUTPUT_TAIL),
+        stderr=captures[1].text(OUTPUT_TAIL),
+        timed_out=timed_out,
+        duration=time.perf_counter() - start
+    )
+
+
+def _limits(timeout: float, memory_mb: int) -> str:
+    """Encode the rlimits for the launcher as NAME=value pairs."""
+    return ','.join([
+        f"RLIMIT_CPU={int(timeout) + 1}",
+        f"RLIMIT_AS={memory_mb * 1024 * 1024}",
+        f"RLIMIT_FSIZE={MAX_OUTPUT_FILE_MB * 1024 * 1024}",
+        "RLIMIT_CORE=0",
+    ])
+
+
+def _kill_group(proc: subprocess.Popen, posix: bool) -> None:
+    """Kill the job and everything it spawned."""
+    try:
+        if posix:
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError):
+        pass  # Already exited
@@ -0,0 +1,60 @@
+"""
+Sharding Utilities
+
+Splits work items into size-balanced shards for process pools, so one
+huge file (a vendored dataset, a minified bundle) does not leave every
+other worker idle while it is processed.
+
+Design Decision: Longest-processing-time-first greedy assignment. Items
+are taken largest first and each goes to the currently lightest shard,
+which is within 4/3 of the optimal makespan and runs in O(n log n).
+"""
+
+import heapq
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .project_snapshot import ProjectSnapshot
+
+
+def shard_by_size(items: Iterable[Tuple[str, int]], shard_count: int) -> List[List[str]]:
+    """
+    Distribute (name, size) items over shards with balanced total size.
+
+    Args:
+        items: (name, size) pairs, e.g. file paths and byte sizes
+        shard_count: Maximum number of shards to produce
+
+    Returns:
+        List[List[str]]: Non-empty shards of names (largest work first)
+
+    Example:
+        >>> shard_by_size([('a', 90), ('b', 50), ('c', 40), ('d', 10)], 2)
+        [['a', 'd'], ['b', 'c']]
+    """
+    ordered = sorted(items, key=lambda item: (-item[1], item[0]))
+    shard_count = max(1, min(shard_count, len(ordered)))
+    shards: List[List[str]] = [[] for _ in range(shard_count)]
+    heap = [(0, index) for index in range(shard_count)]  # (total size, shard)
+
+    for name, size in ordered:
+        total, index = heapq.heappop(heap)
+        shards[index].append(name)
+        heapq.heappush(heap, (total + size, index))
+    return [shard for shard in shards if shard]
+
+
+def file_sizes(
+    file_paths: List[str],
+    snapshot: Optional[ProjectSnapshot] = None
+) -> Dict[str, int]:
+    """Byte size of each file, from the snapshot when available."""
+    if snapshot is not None:
+        return {e.path: e.size for e in snapshot.entries}
+    sizes = {}
+    for file_path in file_paths:
+        try:
+            sizes[file_path] = os.path.getsize(file_path)
+        except OSError:
+            sizes[file_path] = 0
+    return sizes
@@ -0,0 +1,150 @@
+"""
+Venv Pool Module
+
+Reusable virtual environments for running student test suites, keyed by
+the hash of each submission's resolved dependency set (see
+dependency_spec). Most of a class shares the same 3-4 dependency sets,
+so a cohort needs only a handful of environments instead of one each.
+
+Key Features:
+- Offline installs: pip --no-index --only-binary=:all: from a local
+  wheel cache (filled once with fill_wheel_cache), so no student setup.py
+  runs and grading works without network access
+- Environments are built in a staging directory and renamed into place,
+  so a crashed build never leaves a half-installed environment behind
+- Idle environments beyond max_envs are evicted least recently used
+- Thread-safe: one build per key, concurrent users share the result
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import venv
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from .analysis_cache import DEFAULT_CACHE_DIR
+from .dependency_spec import read_requirements, requirements_key, resolve_requirements
+from .project_snapshot import ProjectSnapshot
+
+
+DEFAULT_VENV_DIR = os.path.join(DEFAULT_CACHE_DIR, 'venvs')
+DEFAULT_WHEEL_DIR = os.path.join(DEFAULT_CACHE_DIR, 'wheels')
+DEFAULT_MAX_ENVS = 8
+GRADER_TOOLS = ('pytest',)  # Needed by test_runner in every environment
+INSTALL_TIMEOUT = 600
+_READY = '.ready'  # Marker written last; its mtime is the last-use time
+
+
+class VenvPool:
+    """
+    Pool of virtual environments shared by submissions with equal requirements.
+
+    Example:
+        >>> pool = VenvPool()
+        >>> with pool.environment(snapshot) as python:
+        ...     result = run_test_suite(path, snapshot, python=python)
+    """
+
+    def __init__(self, root: str = DEFAULT_VENV_DIR, wheel_dir: str = DEFAULT_WHEEL_DIR,
+                 max_envs: int = DEFAULT_MAX_ENVS, tools: tuple = GRADER_TOOLS):
+        """Use root for environments and install from wheel_dir; keep at most max_envs."""
+        self.root = root
+        self.wheel_dir = wheel_dir
+        self.max_envs = max_envs
+        self.tools = tuple(tools)
+        os.makedirs(root, exist_ok=True)
+        os.makedirs(wheel_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._in_use = Counter()
+
+    @contextmanager
+    def environment(self, snapshot: ProjectSnapshot) -> Iterator[str]:
+        """
+        Provide the interpreter of an environment satisfying the submission.
+
+        Yields:
+            str: Path of the environment's python executable
+
+        Raises:
+            RuntimeError: If a dependency is missing from the wheel cache
+            OSError, subprocess.SubprocessError: If venv creation fails
+        """
+        requirements = resolve_requirements(read_requirements(snapshot), self.wheel_dir)
+        key = requirements_key(requirements)
+        with self._lock:
+            self._in_use[key] += 1  # Protects the environment from eviction
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                env_dir = os.path.join(self.root, key)
+                if os.path.exists(os.path.join(env_dir, _READY)):
+                    os.utime(os.path.join(env_dir, _READY))
+                else:
+                    self._build(env_dir, requirements)
+            yield _python(env_dir)
+        finally:
+            with self._lock:
+                self._in_use[key] -= 1
+            self._evict()
+
+    def fill_wheel_cache(self, requirements: List[str]) -> bool:
+        """Download wheels for requirements (and the grader tools); needs network."""
+        result = subprocess.run(
+            [sys.executable, '-m', 'pip', 'download', '--only-binary=:all:', '-q',
+             '--disable-pip-version-check', '-d', self.wheel_dir, *self.tools, *requirements],
+            capture_output=True, text=True, timeout=INSTALL_TIMEOUT
+        )
+        return result.returncode == 0
+
+    def _build(self, env_dir: str, requirements: List[str]) -> None:
+        """Create and install an environment in staging, then move it into place."""
+        staging = tempfile.mkdtemp(prefix='.staging-', dir=self.root)
+        try:
+            packages = list(self.tools) + requirements
+            venv.EnvBuilder(with_pip=bool(packages), symlinks=os.name != 'nt').create(staging)
+            if packages:
+                result = subprocess.run(
+                    [_python(staging), '-m', 'pip', 'install', '--no-index', '--only-binary=:all:',
+                     '-q', '--disable-pip-version-check', '--find-links', self.wheel_dir,
+                     *packages],
+                    capture_output=True, text=True, timeout=INSTALL_TIMEOUT
+                )
+                if result.returncode != 0:
+                    raise RuntimeError(f"Dependency install failed: {result.stderr[-2000:]}")
+            with open(os.path.join(staging, 'requirements.lock'), 'w', encoding='utf-8') as f:
+                f.write('\n'.join(packages))
+            open(os.path.join(staging, _READY), 'w').close()
+            shutil.rmtree(env_dir, ignore_errors=True)  # Leftover without a marker
+            os.rename(staging, env_dir)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _evict(self) -> None:
+        """Remove least recently used idle environments beyond max_envs."""
+        with self._lock:
+            ready = []
+            for name in os.listdir(self.root):
+                marker = os.path.join(self.root, name, _READY)
+                if not name.startswith('.') and os.path.exists(marker):
+                    ready.append((os.path.getmtime(marker), name))
+            ready.sort()
+            excess = len(ready) - self.max_envs
+            for _, name in ready:
+                if excess <= 0:
+                    break
+                if self._in_use[name] == 0:
+                    shutil.rmtree(os.path.join(self.root, name), ignore_errors=True)
+                    excess -= 1
+
+
+def _python(env_dir: str) -> str:
+    """Interpreter path inside a virtual environment."""
+    if sys.platform == 'win32':
+        return os.path.join(env_dir, 'Scripts', 'python.exe')
+    return os.path.join(env_dir, 'bin', 'python')
@@ -12,13 +12,16 @@ import os
 from typing import Dict, List
 
 from ..models.code_models import DocumentIssue
+from ..utils.content_store import read_text
 from ..utils.markdown_utils import count_words, extract_sections
+from ..utils.project_snapshot import ProjectSnapshot
 
 
 def validate_document(
     doc_path: str,
     required_sections: List[str],
-    min_words: int
+    min_words: int,
+    snapshot: ProjectSnapshot = None
 ) -> Dict:
     """
     Validate a single documentation file.
@@ -27,6 +30,7 @@ def validate_document(
         doc_path: Path to documentation file
         required_sections: List of required section names
         min_words: Minimum word count
+        snapshot: Pre-built project index (optional)
 
     Returns:
         Dict with validation results
@@ -39,7 +43,8 @@ def validate_document(
     issues = []
 
     # Check if file exists
-    if not os.path.exists(doc_path):
+    exists = snapshot.contains(doc_path) if snapshot else os.path.exists(doc_path)
+    if not exists:
         return {
             'passed': False,
             'exists': False,
@@ -55,8 +60,7 @@ def validate_document(
 
     # Read content
     try:
-        with open(doc_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        content = read_text(doc_path, snapshot.store if snapshot else None)
     except Exception as e:
         return {
             'passed': False,
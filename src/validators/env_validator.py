@@ -9,13 +9,17 @@ Validates environment variable configuration:
 import os
 from typing import Dict
 
+from ..utils.content_store import read_text
+from ..utils.project_snapshot import ProjectSnapshot
 
-def check_env_template(project_path: str) -> Dict:
+
+def check_env_template(project_path: str, snapshot: ProjectSnapshot = None) -> Dict:
     """
     Check if .env.example template exists and .env is properly ignored.
 
     Args:
         project_path: Root directory of project
+        snapshot: Pre-built project index (optional)
 
     Returns:
         Dict containing:
@@ -35,15 +39,15 @@ def check_env_template(project_path: str) -> Dict:
     env_file = os.path.join(project_path, '.env')
     gitignore = os.path.join(project_path, '.gitignore')
 
-    env_example_exists = os.path.exists(env_example)
-    env_exists = os.path.exists(env_file)
+    exists = snapshot.contains if snapshot else os.path.exists
+    env_example_exists = exists(env_example)
+    env_exists = exists(env_file)
 
     # Check if .env is in .gitignore
     env_in_gitignore = False
-    if os.path.exists(gitignore):
-        with open(gitignore, 'r', encoding='utf-8') as f:
-            content = f.read()
-            env_in_gitignore = '.env' in content
+    if exists(gitignore):
+        content = read_text(gitignore, snapshot.store if snapshot else None)
+        env_in_gitignore = '.env' in content
 
     # Determine if passed
     passed = True
@@ -7,6 +7,9 @@ Validates .gitignore file exists and contains required security patterns.
 import os
 from typing import Dict, Set
 
+from ..utils.content_store import read_text
+from ..utils.project_snapshot import ProjectSnapshot
+
 
 REQUIRED_GITIGNORE_PATTERNS: Set[str] = {
     '.env',
@@ -17,12 +20,13 @@ REQUIRED_GITIGNORE_PATTERNS: Set[str] = {
 }
 
 
-def validate_gitignore(project_path: str) -> Dict:
+def validate_gitignore(project_path: str, snapshot: ProjectSnapshot = None) -> Dict:
     """
     Validate .gitignore file exists and contains security patterns.
 
     Args:
         project_path: Root directory of project
+        snapshot: Pre-built project index (optional)
 
     Returns:
         Dict containing:
@@ -38,7 +42,8 @@ def validate_gitignore(project_path: str) -> Dict:
     """
     gitignore_path = os.path.join(project_path, '.gitignore')
 
-    if not os.path.exists(gitignore_path):
+    exists = snapshot.contains(gitignore_path) if snapshot else os.path.exists(gitignore_path)
+    if not exists:
         return {
             'exists': False,
             'missing_patterns': list(REQUIRED_GITIGNORE_PATTERNS),
@@ -47,8 +52,7 @@ def validate_gitignore(project_path: str) -> Dict:
         }
 
     # Read .gitignore
-    with open(gitignore_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = read_text(gitignore_path, snapshot.store if snapshot else None)
 
     # Check for required patterns
     missing = []
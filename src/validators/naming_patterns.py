@@ -0,0 +1,30 @@
+"""
+Naming Pattern Definitions
+
+Compiled identifier patterns and predicates for the naming validator.
+
+Design Decision: Keep the conventions in one place so the validator
+stays small and a new convention only requires modifying this file.
+"""
+
+import re
+
+
+SNAKE_CASE = re.compile(r'^[a-z_][a-z0-9_]*$')
+PASCAL_CASE = re.compile(r'^[A-Z][a-zA-Z0-9]*$')
+UPPER_SNAKE_CASE = re.compile(r'^[A-Z_][A-Z0-9_]*$')
+
+
+def is_snake_case(name: str) -> bool:
+    """Check if name follows snake_case."""
+    return bool(SNAKE_CASE.match(name))
+
+
+def is_pascal_case(name: str) -> bool:
+    """Check if name follows PascalCase."""
+    return bool(PASCAL_CASE.match(name))
+
+
+def is_upper_snake_case(name: str) -> bool:
+    """Check if name follows UPPER_SNAKE_CASE."""
+    return bool(UPPER_SNAKE_CASE.match(name))
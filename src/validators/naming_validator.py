@@ -8,40 +8,28 @@ Validates Python naming conventions:
 - Variables: snake_case
 """
 
-import re
-from typing import Dict
+from typing import Dict, Optional
 
-from ..parsers.python_parser import parse_python_file, extract_functions, extract_classes
-from ..models.code_models import NamingViolation
+from ..models.code_models import ModuleSummary, NamingViolation
+from ..models.compact import ViolationTable
+from ..parsers.module_summary import NOT_SUMMARIZED, summarize_file
+from ..parsers.parallel_summaries import summarize_files
+from ..utils.content_store import ContentStore
+from ..utils.file_finder import find_code_files
+from ..utils.project_snapshot import ProjectSnapshot
+from .naming_patterns import is_pascal_case, is_snake_case
 
 
-# Naming patterns
-SNAKE_CASE = re.compile(r'^[a-z_][a-z0-9_]*$')
-PASCAL_CASE = re.compile(r'^[A-Z][a-zA-Z0-9]*$')
-UPPER_SNAKE_CASE = re.compile(r'^[A-Z_][A-Z0-9_]*$')
-
-
-def is_snake_case(name: str) -> bool:
-    """Check if name follows snake_case."""
-    return bool(SNAKE_CASE.match(name))
-
-
-def is_pascal_case(name: str) -> bool:
-    """Check if name follows PascalCase."""
-    return bool(PASCAL_CASE.match(name))
-
-
-def is_upper_snake_case(name: str) -> bool:
-    """Check if name follows UPPER_SNAKE_CASE."""
-    return bool(UPPER_SNAKE_CASE.match(name))
-
-
-def validate_naming_conventions(file_path: str) -> Dict:
+def validate_naming_conventions(file_path: str, store: ContentStore = None,
+                                summary: Optional[ModuleSummary] = NOT_SUMMARIZED) -> Dict:
     """
     Validate naming conventions in a Python file.
 
     Args:
         file_path: Path to Python file
+        store: Shared content cache (optional)
+        summary: Pre-built module summary, None if it failed to parse
+            (optional, avoids a parse)
 
     Returns:
         Dict containing:
@@ -55,8 +43,9 @@ def validate_naming_conventions(file_path: str) -> Dict:
         ...     for v in result['violations']:
         ...         print(f"{v.item_name} should be {v.expected_pattern}")
     """
-    tree = parse_python_file(file_path)
-    if not tree:
+    if summary is NOT_SUMMARIZED:
+        summary = summarize_file(file_path, store)
+    if summary is None:
         return {
             'total_items': 0,
             'violations': [],
@@ -68,8 +57,7 @@ def validate_naming_conventions(file_path: str) -> Dict:
     total_items = 0
 
     # Check function names
-    functions = extract_functions(tree)
-    for func in functions:
+    for func in summary.functions:
         # Skip magic methods
         if func.name.startswith('__') and func.name.endswith('__'):
             continue
@@ -85,8 +73,7 @@ def validate_naming_conventions(file_path: str) -> Dict:
             ))
 
     # Check class names
-    classes = extract_classes(tree)
-    for cls in classes:
+    for cls in summary.classes:
         total_items += 1
         if not is_pascal_case(cls.name):
             violations.append(NamingViolation(
@@ -99,7 +86,6 @@ def validate_naming_conventions(file_path: str) -> Dict:
 
         # Check method names
         for method in cls.methods:
-            # Skip magic methods
             if method.name.startswith('__') and method.name.endswith('__'):
                 continue
 
@@ -120,25 +106,28 @@ def validate_naming_conventions(file_path: str) -> Dict:
     }
 
 
-def analyze_project_naming(project_path: str) -> Dict:
+def analyze_project_naming(project_path: str, snapshot: ProjectSnapshot = None,
+                           workers: int = 1) -> Dict:
     """
     Analyze naming conventions across entire project.
 
     Args:
         project_path: Root directory
+        snapshot: Pre-built project index (optional, avoids a directory walk)
+        workers: Worker processes for parsing large projects (default: 1)
 
     Returns:
-        Dict with project-wide naming analysis
+        Dict with project-wide naming analysis; violations is a ViolationTable
+        (read-only Sequence; list(result['violations']) for a list)
     """
-    from ..utils.file_finder import find_code_files
-
-    python_files = find_code_files(project_path, extensions=['.py'])
+    python_files = find_code_files(project_path, extensions=['.py'], snapshot=snapshot)
+    summaries = summarize_files(python_files, snapshot, workers)
 
     total_items = 0
-    all_violations = []
+    all_violations = ViolationTable(NamingViolation)
 
     for file_path in python_files:
-        result = validate_naming_conventions(file_path)
+        result = validate_naming_conventions(file_path, summary=summaries[file_path])
         total_items += result['total_items']
         all_violations.extend(result['violations'])
 
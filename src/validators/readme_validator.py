@@ -9,15 +9,18 @@ import os
 import re
 from typing import Dict
 
+from ..utils.content_store import read_text
 from ..utils.markdown_utils import extract_sections
+from ..utils.project_snapshot import ProjectSnapshot
 
 
-def check_readme_usability(project_path: str) -> Dict:
+def check_readme_usability(project_path: str, snapshot: ProjectSnapshot = None) -> Dict:
     """
     Check README for user-friendly content.
 
     Args:
         project_path: Root directory of project
+        snapshot: Pre-built project index (optional)
 
     Returns:
         Dict with README usability metrics (score out of 4)
@@ -28,7 +31,8 @@ def check_readme_usability(project_path: str) -> Dict:
     """
     readme_path = os.path.join(project_path, 'README.md')
 
-    if not os.path.exists(readme_path):
+    exists = snapshot.contains(readme_path) if snapshot else os.path.exists(readme_path)
+    if not exists:
         return {
             'score': 0,
             'has_readme': False,
@@ -36,8 +40,7 @@ def check_readme_usability(project_path: str) -> Dict:
         }
 
     try:
-        with open(readme_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        content = read_text(readme_path, snapshot.store if snapshot else None)
 
         sections = extract_sections(content)
         sections_lower = [s.lower() for s in sections]
@@ -0,0 +1,20 @@
+"""
+Git repository helpers for testing.
+
+Provides one git command runner with a fixed test identity, so tests
+building repositories do not depend on the machine's git config.
+"""
+
+import subprocess
+
+
+TEST_AUTHOR = ('Student', 's@example.edu')
+
+
+def run_git(repo, *args, author=TEST_AUTHOR) -> str:
+    """Run a git command in repo as author and return its output."""
+    name, email = author
+    return subprocess.run(
+        ['git', '-c', f'user.name={name}', '-c', f'user.email={email}', *args],
+        cwd=repo, check=True, capture_output=True, text=True
+    ).stdout
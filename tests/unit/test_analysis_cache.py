@@ -0,0 +1,92 @@
+"""
+Unit tests for analysis_cache module.
+
+Tests the persistent per-file cache and its use by analyzers.
+"""
+
+import os
+from pathlib import Path
+
+from src.analyzers.security_scanner import scan_for_secrets
+from src.parsers.module_summary import get_module_summary
+from src.utils.analysis_cache import MISSING, AnalysisCache, blob_sha
+from src.utils.cache_lookup import cached_call
+from src.utils.project_snapshot import ProjectSnapshot
+
+
+def test_blob_sha_matches_git():
+    """Test keys are git blob SHAs (as printed by git hash-object)."""
+    assert blob_sha(b'') == 'e69de29bb2d1d6434b8b29ae775ad8c2e48c5391'
+    assert blob_sha(b'hello\n') == 'ce013625030ba8dba906f756967f9e9ca394464a'
+
+
+def test_entries_persist_across_instances(temp_dir):
+    """Test a stored payload is served by a later cache instance."""
+    cache_dir = os.path.join(temp_dir, 'cache')
+    with AnalysisCache(cache_dir) as cache:
+        cache.put('abc', 'line_stats.py', 1, {'total': 3})
+        assert cache.get('abc', 'line_stats.py', 2) is MISSING
+
+    with AnalysisCache(cache_dir) as cache:
+        assert cache.get('abc', 'line_stats.py', 1) == {'total': 3}
+        assert cache.stats()['hits'] == 1
+
+
+def test_eviction_drops_least_recently_used(temp_dir):
+    """Test the size budget evicts the entry used longest ago."""
+    with AnalysisCache(os.path.join(temp_dir, 'cache'), max_bytes=2500) as cache:
+        cache.put('old', 'a', 1, b'x' * 1000)
+        cache.put('new', 'a', 1, b'y' * 1000)
+        assert cache.get('old', 'a', 1) == b'x' * 1000  # Now most recently used
+        cache.put('newest', 'a', 1, b'z' * 1000)
+
+        assert cache.get('new', 'a', 1) is MISSING
+        assert cache.get('old', 'a', 1) is not MISSING
+        assert cache.evictions == 1
+
+
+def test_rewriting_a_key_counts_its_size_once(temp_dir):
+    """Test replacing an entry does not inflate the used bytes or evict early."""
+    with AnalysisCache(os.path.join(temp_dir, 'cache'), max_bytes=10000) as cache:
+        cache.put('other', 'a', 1, b'x' * 1000)
+        for _ in range(10):
+            cache.put('same', 'a', 1, b'y' * 1000)
+
+        assert cache.stats()['bytes_used'] == cache._total_size()
+        assert cache.evictions == 0 and cache.get('other', 'a', 1) is not MISSING
+
+
+def test_cached_call_recomputes_only_changed_files(temp_dir):
+    """Test unchanged contents are served from the cache."""
+    path = Path(temp_dir) / 'module.py'
+    path.write_text('x = 1\n')
+    calls = []
+    with AnalysisCache(os.path.join(temp_dir, 'cache')) as cache:
+        for _ in range(2):
+            cached_call(cache, str(path), 'probe', 1, lambda: calls.append(1))
+        path.write_text('x = 2\n')
+        cached_call(cache, str(path), 'probe', 1, lambda: calls.append(1))
+
+    assert len(calls) == 2
+
+
+def test_analyzers_reuse_results_across_projects(temp_dir):
+    """Test a second project with identical files is served from the cache."""
+    source = 'def main():\n    pass\n\nAPI_KEY = "sk-abcdefghijklmnopqrstuvwxyz123456"\n'
+    for name in ('alice', 'bob'):
+        os.makedirs(os.path.join(temp_dir, name))
+        Path(temp_dir, name, 'main.py').write_text(source)
+
+    with AnalysisCache(os.path.join(temp_dir, 'cache')) as cache:
+        results = []
+        for name in ('alice', 'bob'):
+            root = os.path.join(temp_dir, name)
+            snapshot = ProjectSnapshot.build(root, cache=cache)
+            summary = get_module_summary(os.path.join(root, 'main.py'), snapshot)
+            results.append((summary, scan_for_secrets(root, snapshot=snapshot)))
+        assert cache.stats()['hits'] == 2
+
+    (alice_summary, alice_secrets), (bob_summary, bob_secrets) = results
+    assert bob_summary == alice_summary
+    assert [f.secret_type for f in bob_secrets] == [f.secret_type for f in alice_secrets]
+    assert bob_secrets[0].file_path == os.path.join(temp_dir, 'bob', 'main.py')
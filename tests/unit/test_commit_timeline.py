@@ -0,0 +1,112 @@
+"""
+Unit tests for commit_timeline module.
+
+Tests the commit-time distribution and its effect on the git score.
+"""
+
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.analyzers.commit_timeline import DAY_SECONDS, CommitTimeline, burstiness
+from src.analyzers.git_analyzer import _calculate_git_score, assess_git_workflow
+from src.models.git_models import CommitInfo
+from tests.fixtures.git_repo import run_git
+
+
+START = 1767225600  # 2026-01-01 00:00 UTC
+
+
+def _timeline(*commits):
+    """Feed (seconds after START, lines changed) pairs newest first, like the stream."""
+    timeline = CommitTimeline()
+    for offset, lines in sorted(commits, reverse=True):
+        commit = CommitInfo(hash='0', message='Work', author='A', date='',
+                            insertions=lines, timestamp=START + offset)
+        timeline.add(commit, [])
+    return timeline
+
+
+def test_distribution_per_day_gap_and_final_churn():
+    """Test daily counts, longest gap and the final-24h churn share."""
+    hour = 3600
+    timeline = _timeline((0, 10), (hour, 10), (2 * DAY_SECONDS, 20),
+                         (6 * DAY_SECONDS, 30), (6 * DAY_SECONDS + hour, 30))
+    report = timeline.report(deadline=START + 6 * DAY_SECONDS + hour)
+
+    assert report['daily_commits'] == [2, 0, 1, 0, 0, 0, 2]
+    assert (report['span_days'], report['active_days'], report['max_commits_per_day']) == (7, 3, 2)
+    assert report['longest_gap_hours'] == 96.0
+    assert report['final_day_churn'] == 0.6  # 60 of 100 lines
+    assert timeline.report(deadline=START + 2 * DAY_SECONDS + hour)['final_day_churn'] == 0.2
+    assert timeline.report()['final_day_churn'] is None  # No deadline, no final window
+
+
+def test_burstiness_range():
+    """Test regular gaps give -1, bursts approach 1 and short histories give None."""
+    assert burstiness(np.array([3600] * 5)) == -1.0
+    assert burstiness(np.array([1] * 20 + [30 * DAY_SECONDS])) > 0.6
+    assert burstiness(np.array([3600])) is None
+    assert _timeline().report()['burstiness'] is None
+
+
+def test_timeline_feeds_git_score():
+    """Test a last-minute, single-day history loses points a steady one keeps."""
+    steady = _timeline(*[(day * DAY_SECONDS, 10) for day in range(12)]).report()
+    crammed = _timeline(*[(minute * 60, 10) for minute in range(12)]).report(START + 3600)
+
+    assert _calculate_git_score(12, 10, 0, 0, 12, steady)[0] == 10
+    score, message = _calculate_git_score(12, 10, 0, 0, 12, crammed)
+    assert score == 7 and 'final 24 hours' in message and 'day(s)' in message
+
+
+def test_no_deadline_skips_last_minute_penalty():
+    """Test a history ending in one big commit is not penalized without a deadline."""
+    big_finish = _timeline(*[(day * DAY_SECONDS, 1) for day in range(11)],
+                           (11 * DAY_SECONDS, 500))
+
+    assert _calculate_git_score(12, 10, 0, 0, 12, big_finish.report())[0] == 10
+    with_deadline = big_finish.report(deadline=START + 11 * DAY_SECONDS + 3600)
+    assert with_deadline['final_day_churn'] > 0.9
+    assert _calculate_git_score(12, 10, 0, 0, 12, with_deadline)[0] == 8
+
+
+def test_git_score_scale():
+    """Test count/message penalties stay first-match and timeline penalties add on top."""
+    crammed = _timeline(*[(minute * 60, 10) for minute in range(4)]).report(START + 3600)
+
+    assert _calculate_git_score(4, 10, 4, 4, 4)[0] == 5  # Few commits, vague: still -5
+    assert _calculate_git_score(20, 10, 10, 10, 20)[0] == 8  # Short and vague: -2
+    assert _calculate_git_score(4, 10, 4, 4, 4, crammed)[0] == 2  # Floor of the scale
+
+
+@pytest.mark.skipif(shutil.which('git') is None, reason='git not installed')
+def test_assessment_reports_timeline_from_stream(temp_dir):
+    """Test author times reach the timeline through the streamed log."""
+    run_git(temp_dir, 'init', '-q')
+    for day in (1, 2, 9):
+        (Path(temp_dir) / f'day{day}.txt').write_text('line\n' * day)
+        run_git(temp_dir, 'add', '.')
+        run_git(temp_dir, 'commit', '-q', '-m', f'Add notes for day {day}',
+                f'--date=2026-03-0{day}T12:00:00Z')
+    deadline = 1773100800  # 2026-03-10 00:00 UTC
+    timeline = assess_git_workflow(temp_dir, min_commits=3, deadline=deadline)['timeline']
+
+    assert (timeline['commits'], timeline['span_days'], timeline['active_days']) == (3, 9, 3)
+    assert timeline['longest_gap_hours'] == 168.0
+    assert timeline['final_day_churn'] == 0.75  # 9 of 12 lines
+
+
+@pytest.mark.skipif(shutil.which('git') is None, reason='git not installed')
+def test_days_are_author_local_dates(temp_dir):
+    """Test commits around local midnight count as two days, as in ContributionTracker."""
+    run_git(temp_dir, 'init', '-q')
+    for stamp in ('2026-03-01T23:30:00+03:00', '2026-03-02T00:30:00+03:00'):  # Same UTC day
+        run_git(temp_dir, 'commit', '-q', '--allow-empty', '-m', 'Work around midnight',
+                f'--date={stamp}')
+    result = assess_git_workflow(temp_dir, min_commits=2)
+
+    assert result['timeline']['daily_commits'] == [1, 1]
+    assert result['contributors']['authors'][0].active_days == 2
@@ -0,0 +1,62 @@
+"""
+Unit tests for compact result models.
+
+Tests frozen, slotted models and the columnar ViolationTable.
+"""
+
+import sys
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from src.models.code_models import NamingViolation, SecretFinding
+from src.models.compact import ViolationTable
+
+
+def _violations():
+    """Build violations whose paths are equal but distinct string objects."""
+    return [
+        NamingViolation(''.join(['src/', 'app.py']), 'function', 'badName', 4, 'snake_case'),
+        NamingViolation(''.join(['src/', 'app.py']), 'class', 'lower_class', 9, 'PascalCase'),
+    ]
+
+
+def test_models_are_frozen_and_slotted():
+    """Test models reject mutation and carry no per-instance __dict__."""
+    finding = SecretFinding('api_key', 'config.py', 3, 'API_KEY = "..."')
+
+    with pytest.raises(FrozenInstanceError):
+        finding.line_number = 4
+    if sys.version_info >= (3, 10):
+        assert not hasattr(finding, '__dict__')
+    assert len({finding, SecretFinding('api_key', 'config.py', 3, 'API_KEY = "..."')}) == 1
+
+
+def test_violation_table_round_trips_records():
+    """Test records come back equal, in order, from the columns."""
+    violations = _violations()
+    table = ViolationTable(NamingViolation, violations)
+
+    assert len(table) == 2
+    assert table == violations and violations == table
+    assert table[-1] == violations[-1]
+    assert table[:1] == violations[:1]
+    assert list(table.column('line_number')) == [4, 9]
+
+
+def test_violation_table_interns_paths():
+    """Test equal paths are stored as one shared string object."""
+    table = ViolationTable(NamingViolation, _violations())
+
+    first, second = table.column('file_path')
+    assert first is second
+
+
+def test_violation_table_concatenates_as_list():
+    """Test + with lists works from either side and yields plain lists."""
+    violations = _violations()
+    table = ViolationTable(NamingViolation, violations[:1])
+
+    assert table + violations[1:] == violations
+    assert violations[1:] + table == violations[1:] + violations[:1]
+    assert isinstance(table + [], list) and list(table) == violations[:1]
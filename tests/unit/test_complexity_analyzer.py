@@ -0,0 +1,81 @@
+"""
+Unit tests for complexity_analyzer module.
+
+Tests McCabe complexity computed in the shared summary pass.
+"""
+
+from pathlib import Path
+
+from src.analyzers.complexity_analyzer import analyze_project_complexity, check_complexity
+
+
+SOURCE = '''
+def simple():
+    return 1
+
+
+def branchy(x, items):
+    if x and items:
+        for item in items:
+            if item:
+                pass
+        else:
+            pass
+    elif x:
+        pass
+    try:
+        pass
+    except ValueError:
+        pass
+    except KeyError:
+        pass
+
+    def nested(y):
+        return y if y else None
+    return [item for item in items if item]
+
+
+class Service:
+    def run(self, job):
+        while job.pending or job.retry:
+            job.step()
+'''
+
+
+def test_complexity_follows_mccabe_rules(temp_dir):
+    """Test decision points per construct; nested defs scored separately."""
+    path = Path(temp_dir) / 'module.py'
+    path.write_text(SOURCE)
+
+    result = check_complexity(str(path))
+
+    assert result['functions'] == [
+        ('simple', 2, 1), ('branchy', 6, 11), ('nested', 22, 2), ('Service.run', 28, 3)
+    ]
+    assert [(v.item_type, v.item_name, v.complexity) for v in result['violations']] == [
+        ('function', 'branchy', 11)
+    ]
+
+
+def test_project_complexity_reports_violators(temp_dir):
+    """Test project totals and the configurable limit."""
+    (Path(temp_dir) / 'module.py').write_text(SOURCE)
+
+    result = analyze_project_complexity(temp_dir)
+    relaxed = analyze_project_complexity(temp_dir, max_complexity=11)
+
+    assert result['total_functions'] == 4
+    assert result['max_complexity_found'] == 11
+    assert result['passed'] is False and len(result['violations']) == 1
+    assert relaxed['passed'] is True
+
+
+def test_try_else_counts_like_radon(temp_dir):
+    """Test a try's else clause adds one point on top of its handlers."""
+    path = Path(temp_dir) / 'module.py'
+    path.write_text(
+        'def load(path):\n    try:\n        f = open(path)\n    except OSError:\n'
+        '        return None\n    else:\n        return f\n'
+    )
+
+    assert check_complexity(str(path))['functions'] == [('load', 1, 3)]
@@ -0,0 +1,74 @@
+"""
+Unit tests for content_store module.
+
+Tests shared file reads, decoding policy and LRU eviction.
+"""
+
+import pytest
+from pathlib import Path
+
+from src.utils.content_store import ContentStore, read_lines, read_text
+
+
+@pytest.fixture
+def text_file(temp_dir):
+    """Create a file with mixed newlines and invalid UTF-8."""
+    path = Path(temp_dir) / "mixed.py"
+    path.write_bytes(b"a = 1\r\nb = 2\rc = '\xff'\nlast")
+    return str(path)
+
+
+def test_views_match_open_semantics(text_file):
+    """Test that store views equal plain open() with errors='ignore'."""
+    store = ContentStore()
+
+    assert store.read_text(text_file) == read_text(text_file)
+    assert store.read_lines(text_file) == read_lines(text_file)
+    assert store.read_bytes(text_file).startswith(b"a = 1\r\n")
+
+
+def test_file_read_once(text_file):
+    """Test that repeated views are served from the cache."""
+    store = ContentStore()
+    store.read_text(text_file)
+    store.read_lines(text_file)
+    store.read_bytes(text_file)
+
+    stats = store.stats()
+    assert stats['misses'] == 1
+    assert stats['hits'] == 2
+
+
+def test_lru_eviction_respects_budget(temp_dir):
+    """Test that least recently used files are evicted over budget."""
+    paths = []
+    for i in range(4):
+        path = Path(temp_dir) / f"f{i}.txt"
+        path.write_bytes(b"x" * 100)
+        paths.append(str(path))
+
+    store = ContentStore(max_bytes=250)
+    for path in paths:
+        store.read_bytes(path)
+
+    stats = store.stats()
+    assert stats['bytes_used'] <= 250
+    assert stats['evictions'] == 2
+    store.read_bytes(paths[-1])
+    assert store.stats()['hits'] == 1
+
+
+def test_large_files_not_retained(temp_dir):
+    """Test that files above the per-file cap bypass the cache."""
+    path = Path(temp_dir) / "data.csv"
+    path.write_bytes(b"1,2\n" * 1000)
+
+    store = ContentStore(max_bytes=10_000, max_file_bytes=100)
+    assert len(store.read_lines(str(path))) == 1000
+    assert store.stats()['cached_files'] == 0
+
+
+def test_missing_file_raises():
+    """Test that missing files raise like open()."""
+    with pytest.raises(FileNotFoundError):
+        ContentStore().read_text('/nonexistent/file.py')
@@ -0,0 +1,66 @@
+"""
+Unit tests for contribution_analyzer and author_identity modules.
+
+Tests per-author analytics with .mailmap and email folding.
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.analyzers.contribution_analyzer import analyze_contributions
+from src.utils.author_identity import IdentityFolder, email_key
+from tests.fixtures.git_repo import run_git
+
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason='git not installed')
+
+
+def _commit(repo, author, email, date, files):
+    """Write files and commit them as the given author on the given date."""
+    for name, lines in files.items():
+        (Path(repo) / name).write_text(''.join(f'line {i}\n' for i in range(lines)))
+    run_git(repo, 'add', '.')
+    run_git(repo, 'commit', '-q', '--allow-empty', '-m', f'Work by {author}',
+            f'--date={date}T12:00:00', author=(author, email))
+
+
+@pytest.fixture
+def pair_repo(temp_dir):
+    """Two partners, each committing under two identities."""
+    run_git(temp_dir, 'init', '-q')
+    (Path(temp_dir) / '.mailmap').write_text('Omer Katz <omer@uni.ac.il> <omer@laptop.local>\n')
+    _commit(temp_dir, 'Dana Levi', 'dana@uni.ac.il', '2026-03-01', {'parser.py': 30})
+    _commit(temp_dir, 'dana  levi', 'Dana@Gmail.com', '2026-03-02', {'parser.py': 40})
+    _commit(temp_dir, 'Omer K', 'omer@laptop.local', '2026-03-02', {'report.py': 20})
+    _commit(temp_dir, 'Omer Katz', 'omer@uni.ac.il', '2026-03-02', {'report.py': 30})
+    return temp_dir
+
+
+def test_partners_folded_with_mailmap_and_email(pair_repo):
+    """Test identities fold, and totals, days and ownership are per person."""
+    result = analyze_contributions(pair_repo)
+    dana, omer = sorted(result['authors'], key=lambda author: author.name.lower())
+
+    assert len(result['authors']) == 2
+    assert (dana.name, dana.commits, dana.insertions, dana.active_days) == (
+        'Dana Levi', 2, 41, 2  # 30 + 10 lines of parser.py, 1 of .mailmap
+    )
+    assert dana.emails == ('Dana@Gmail.com', 'dana@uni.ac.il')
+    assert (omer.name, omer.commits, omer.active_days, omer.emails) == (
+        'Omer Katz', 2, 1, ('omer@uni.ac.il',)
+    )
+    assert result['file_owners']['parser.py'] == 'Dana Levi'
+    assert result['file_owners']['report.py'] == 'Omer Katz'
+    assert result['balance'] == round(omer.line_share / dana.line_share, 3)
+
+
+def test_generic_identities_never_merge():
+    """Test unconfigured-git defaults stay separate and noreply folds to the login."""
+    folder = IdentityFolder()
+    folder.add('Your Name', 'alice@uni.ac.il')
+    folder.add('Your Name', 'bob@uni.ac.il')
+
+    assert folder.key('Your Name', 'alice@uni.ac.il') != folder.key('Your Name', 'bob@uni.ac.il')
+    assert email_key('12345+Dana@users.noreply.github.com') == 'github:dana'
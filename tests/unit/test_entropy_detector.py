@@ -0,0 +1,84 @@
+"""
+Unit tests for entropy_detector module.
+
+Tests vectorized entropy computation and high-entropy secret detection.
+"""
+
+import math
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from src.analyzers.entropy_detector import find_high_entropy_strings, shannon_entropy  # noqa: E402
+from src.analyzers.security_scanner import scan_for_secrets  # noqa: E402
+
+
+HEX_SECRET = '9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822c'  # 24-byte key
+URL_SECRET = 'Zx9Qr2LmT8vB4nWk7YpD3sHf'
+
+
+def test_shannon_entropy_matches_definition():
+    """Test batch entropy against a direct per-string computation."""
+    tokens = ['aaaa', 'abcd', 'aab', URL_SECRET]
+    expected = []
+    for token in tokens:
+        probabilities = [token.count(c) / len(token) for c in set(token)]
+        expected.append(-sum(p * math.log2(p) for p in probabilities))
+
+    assert np.allclose(shannon_entropy(tokens), expected)
+
+
+def test_detects_unnamed_and_url_secrets():
+    """Test secrets that no named pattern catches are flagged."""
+    text = (
+        f'client_cred = "{HEX_SECRET}"\n'
+        f'endpoint = "https://api.example.io/v1?c={URL_SECRET}"\n'
+    )
+    findings = find_high_entropy_strings(text)
+
+    assert [(line, kind) for line, kind, _, _, _ in findings] == [
+        (1, 'high_entropy_hex'), (2, 'high_entropy_base64')
+    ]
+    assert [token for _, _, _, token, _ in findings] == [HEX_SECRET, URL_SECRET]
+    assert all(0.0 < confidence <= 1.0 for _, _, _, _, confidence in findings)
+
+
+def test_detects_short_random_key():
+    """Test a 20-char key is flagged although no 20-char token reaches 4.5 bits."""
+    key = 'aK3xP9mQ2vL7aZ4tR8wK'  # Two repeated characters, about 4.12 bits
+    findings = find_high_entropy_strings(f'token = "{key}"\n')
+
+    assert shannon_entropy([key])[0] < 4.5
+    assert [(kind, token) for _, kind, _, token, _ in findings] == [('high_entropy_base64', key)]
+
+
+def test_ignores_commit_shas_and_digests():
+    """Test hex tokens of SHA-1/SHA-256 length are not reported as secrets."""
+    text = (
+        'FIXED_IN = "3b18e512dba79e4c8300dd08aeb37f8e728b8dad"\n'
+        'CHECKSUM = "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08"\n'
+    )
+    assert find_high_entropy_strings(text) == []
+
+
+def test_ignores_words_paths_and_low_entropy():
+    """Test ordinary literals are not reported."""
+    text = (
+        'name = "src/analyzers/security_scanner"\n'
+        'label = "ThisIsJustAVeryLongIdentifierName"\n'
+        'padding = "aaaaaaaaaaaaaaaaaaaaaaaa1"\n'
+    )
+    assert find_high_entropy_strings(text) == []
+
+
+def test_scanner_reports_entropy_findings_with_confidence(temp_dir):
+    """Test entropy findings reach SecretFinding only when enabled."""
+    (Path(temp_dir) / 'settings.py').write_text(f'client_cred = "{HEX_SECRET}"\n')
+
+    assert scan_for_secrets(temp_dir) == []
+    findings = scan_for_secrets(temp_dir, detect_entropy=True)
+    assert len(findings) == 1
+    assert findings[0].secret_type == 'high_entropy_hex'
+    assert findings[0].confidence < 1.0
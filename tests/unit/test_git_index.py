@@ -0,0 +1,87 @@
+"""
+Unit tests for git_index and git_refs modules.
+
+Tests the in-process index and refs readers against git's own output.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.utils.git_commands import check_git_repo
+from src.utils.git_index import read_index, tracked_blobs
+from src.utils.git_refs import find_git_dir, read_head
+from tests.fixtures.git_repo import run_git
+
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason='git not installed')
+
+
+def _ls_files(repo) -> dict:
+    """Tracked paths and blob SHAs as git reports them."""
+    output = run_git(repo, 'ls-files', '-s', '-z')
+    return {line.split('\t', 1)[1]: line.split()[1] for line in output.split('\0') if line}
+
+
+@pytest.fixture
+def repo(temp_dir):
+    """Repo with nested, shared-prefix and non-ASCII paths, one commit on main."""
+    run_git(temp_dir, 'init', '-q', '-b', 'main')
+    for name in ('README.md', 'src/app/main.py', 'src/app/main_test.py', 'src/apps.py',
+                 'docs/résumé.txt', 'a' * 120 + '.py'):
+        path = Path(temp_dir) / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f'contents of {name}\n')
+    run_git(temp_dir, 'add', '.')
+    run_git(temp_dir, 'commit', '-q', '-m', 'Initial project layout')
+    return temp_dir
+
+
+@pytest.mark.parametrize('version', ['2', '3', '4'])
+def test_index_matches_ls_files(repo, version):
+    """Test every index version yields git's own path and blob SHA list."""
+    run_git(repo, 'update-index', '--index-version', version)
+    if version == '3':
+        (Path(repo) / 'notes.txt').write_text('draft\n')
+        run_git(repo, 'add', '-N', 'notes.txt')  # Intent-to-add sets extended flags
+
+    assert tracked_blobs(find_git_dir(repo)) == _ls_files(repo)
+    assert {entry.stage for entry in read_index(find_git_dir(repo))} == {0}
+
+
+def test_head_from_loose_packed_and_detached_refs(repo):
+    """Test HEAD resolves through loose refs, packed-refs and a detached HEAD."""
+    git_dir = find_git_dir(os.path.join(repo, 'src', 'app'))
+    head = run_git(repo, 'rev-parse', 'HEAD').strip()
+
+    assert git_dir == os.path.join(repo, '.git') and read_head(git_dir) == head
+    run_git(repo, 'pack-refs', '--all')
+    assert not os.path.exists(os.path.join(git_dir, 'refs', 'heads', 'main'))
+    assert read_head(git_dir) == head
+    run_git(repo, 'checkout', '-q', '--detach')
+    assert read_head(git_dir) == head
+
+
+def test_worktree_and_non_repo(repo):
+    """Test a linked worktree resolves through its gitdir file; plain dirs are not repos."""
+    worktree = os.path.join(repo, 'wt')
+    run_git(repo, 'worktree', 'add', '-q', '-b', 'feature', worktree)
+    run_git(worktree, 'commit', '-q', '--allow-empty', '-m', 'Work on the feature branch')
+
+    assert read_head(find_git_dir(worktree)) == run_git(worktree, 'rev-parse', 'HEAD').strip()
+    assert tracked_blobs(find_git_dir(worktree)) == _ls_files(worktree)
+    assert check_git_repo(repo) and check_git_repo(worktree)
+    assert not check_git_repo(os.path.join(repo, 'missing'))
+
+
+def test_empty_repo_and_corrupt_index(temp_dir):
+    """Test a fresh repo has no HEAD or entries, and a corrupt index raises ValueError."""
+    run_git(temp_dir, 'init', '-q')
+    git_dir = find_git_dir(temp_dir)
+
+    assert read_head(git_dir) is None and read_index(git_dir) == []
+    Path(git_dir, 'index').write_bytes(b'DIRC\0\0\0\2\0\0\0\5')
+    with pytest.raises(ValueError):
+        read_index(git_dir)
@@ -0,0 +1,61 @@
+"""
+Unit tests for git_log_stream module.
+
+Tests full-history streaming, numstat parsing and the vague-message classifier.
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.analyzers.git_analyzer import assess_git_workflow
+from src.models.git_models import is_vague_message
+from src.utils.git_commands import get_commit_history
+from src.utils.git_log_stream import count_commits, iter_log_entries, summarize_history
+from tests.fixtures.git_repo import run_git
+
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason='git not installed')
+
+
+@pytest.fixture
+def repo(temp_dir):
+    """Create a repo with one text+binary commit followed by 60 empty commits."""
+    run_git(temp_dir, 'init', '-q')
+    (Path(temp_dir) / 'notes.txt').write_text('one\ntwo\nthree\n')
+    (Path(temp_dir) / 'image.bin').write_bytes(b'\0\1\2')
+    run_git(temp_dir, 'add', '.')
+    run_git(temp_dir, 'commit', '-q', '-m', 'Add notes\tand image')
+    for i in range(60):
+        message = 'fix' if i % 4 == 0 else f'Implement feature number {i}'
+        run_git(temp_dir, 'commit', '-q', '--allow-empty', '-m', message)
+    return temp_dir
+
+
+def test_stream_reads_full_history_with_numstat(repo):
+    """Test every commit is streamed, newest first, with numstat totals."""
+    commits = [commit for commit, _ in iter_log_entries(repo)]
+
+    assert len(commits) == count_commits(repo) == 61
+    assert commits[0].message == 'Implement feature number 59'
+    assert commits[-1].message == 'Add notes\tand image'
+    assert (commits[-1].insertions, commits[-1].files_changed) == (3, 2)  # Binary: 0 lines
+
+
+def test_summary_and_assessment_are_not_capped(repo):
+    """Test aggregates and commit_count cover more than the old 50-commit cap."""
+    stats = summarize_history(repo, sample_size=5)
+    result = assess_git_workflow(repo)
+
+    assert (stats.commits, stats.vague_messages, stats.short_messages) == (61, 15, 15)
+    assert stats.complete and len(stats.sample) == 5
+    assert result['commit_count'] == 61 and result['analyzed_commits'] == 61
+    assert len(get_commit_history(repo, limit=7)) == 7
+
+
+def test_vague_message_classifier():
+    """Test the precompiled classifier keeps the original prefix rules."""
+    assert [is_vague_message(m) for m in ('Update README', 'WIP', '.', 'tmp save')] == [True] * 4
+    assert not is_vague_message('Add streaming git log reader')
+    assert not is_vague_message('Refactor: fix later')
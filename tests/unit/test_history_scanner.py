@@ -0,0 +1,88 @@
+"""
+Unit tests for history_scanner module.
+
+Tests secret detection across git history with blob deduplication.
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.analyzers.history_scanner import scan_history_for_secrets
+from src.analyzers.security_prefilter import ScanStats
+from src.utils.git_objects import map_introducing_commits
+from tests.fixtures.git_repo import run_git
+
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason='git not installed')
+
+SECRET_LINE = 'API_KEY = "abcdefghijklmnopqrstuvwxyz012345"\n'
+
+
+def _commit_hash(repo, ref):
+    """Return the short hash of a ref."""
+    return run_git(repo, 'rev-parse', '--short=8', ref).strip()
+
+
+@pytest.fixture
+def repo_with_deleted_secret(temp_dir):
+    """Create a repo where a secret was committed, copied, then deleted."""
+    repo = Path(temp_dir)
+    run_git(repo, 'init', '-q')
+    (repo / 'config.py').write_text(SECRET_LINE)
+    run_git(repo, 'add', '.')
+    run_git(repo, 'commit', '-q', '-m', 'Add config')
+    shutil.copy(repo / 'config.py', repo / 'settings.py')
+    run_git(repo, 'add', '.')
+    run_git(repo, 'commit', '-q', '-m', 'Copy config')
+    run_git(repo, 'rm', '-q', 'config.py', 'settings.py')
+    (repo / 'main.py').write_text('x = 1\n')
+    run_git(repo, 'add', '.')
+    run_git(repo, 'commit', '-q', '-m', 'Remove config')
+    return temp_dir
+
+
+def test_deleted_secret_found_with_introducing_commit(repo_with_deleted_secret):
+    """Test that a deleted secret is reported with the commit that added it."""
+    findings = scan_history_for_secrets(repo_with_deleted_secret)
+
+    assert findings
+    assert {f.commit for f in findings} == {_commit_hash(repo_with_deleted_secret, 'HEAD~2')}
+    assert all(f.line_number == 1 for f in findings)
+
+
+def test_identical_blobs_scanned_once(repo_with_deleted_secret):
+    """Test that a blob shared by two paths and commits is scanned once."""
+    stats = ScanStats()
+    scan_history_for_secrets(repo_with_deleted_secret, stats=stats)
+
+    assert stats.files_scanned == 1  # config.py and settings.py share one blob
+    assert stats.files_skipped == 1  # main.py
+
+
+def test_ignored_directories_are_not_scanned(repo_with_deleted_secret):
+    """Test blobs under ignored directories (a committed venv) are skipped."""
+    repo = Path(repo_with_deleted_secret)
+    (repo / 'venv' / 'lib').mkdir(parents=True)
+    (repo / 'venv' / 'lib' / 'vendored.py').write_text(SECRET_LINE.replace('abc', 'xyz'))
+    run_git(repo, 'add', '.')
+    run_git(repo, 'commit', '-q', '-m', 'Commit the virtualenv')
+
+    findings = scan_history_for_secrets(repo_with_deleted_secret)
+
+    assert findings and not any('venv' in f.file_path for f in findings)
+
+
+def test_non_repository_returns_empty(temp_dir):
+    """Test that a plain directory yields no history findings."""
+    assert scan_history_for_secrets(temp_dir) == []
+
+
+def test_introducing_commit_map_is_time_limited(repo_with_deleted_secret):
+    """Test the git log behind the commit map is killed at the time limit."""
+    introduced, complete = map_introducing_commits(repo_with_deleted_secret)
+    assert complete and len(introduced) == 2  # The secret blob and main.py
+
+    _, complete = map_introducing_commits(repo_with_deleted_secret, timeout=0)
+    assert not complete
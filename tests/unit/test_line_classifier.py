@@ -0,0 +1,131 @@
+"""
+Unit tests for line_classifier module.
+
+Tests single-pass line classification and the line_counter API built on it.
+"""
+
+from pathlib import Path
+
+from src.analyzers.file_size_analyzer import check_file_sizes
+from src.utils.content_store import ContentStore
+from src.utils.line_classifier import classify_lines, classify_files
+from src.utils import line_counter
+from src.utils.line_counter import (
+    count_lines, get_line_stats, count_newlines, exceeds_line_limit
+)
+
+
+PYTHON_SOURCE = '''"""Module docstring
+spanning two lines."""
+
+import os  # trailing comment
+
+
+def run():
+    r"""Raw docstring."""
+    # full-line comment
+    text = "# not a comment"
+    query = """
+SELECT 1
+"""
+    return text, query
+'''
+
+
+def test_python_docstrings_and_comments():
+    """Test docstrings count as comments and strings with '#' as code."""
+    stats = classify_lines(PYTHON_SOURCE, '.py')
+
+    assert stats == {'total': 14, 'code': 7, 'comments': 4, 'blank': 3}
+
+
+def test_python_string_statement_inside_brackets_is_code():
+    """Test that a string inside an open bracket is not a docstring."""
+    source = "call(\n    'argument',\n)\n"
+    assert classify_lines(source, '.py')['code'] == 3
+
+
+def test_c_style_comments_and_templates():
+    """Test JavaScript block comments, line comments and template literals."""
+    source = (
+        "/* header\n"
+        "   block */\n"
+        "const url = 'http://example.com';  // site\n"
+        "const t = `line one\n"
+        "// inside template\n"
+        "`;\n"
+        "\n"
+    )
+    stats = classify_lines(source, '.js')
+
+    assert stats == {'total': 7, 'code': 4, 'comments': 2, 'blank': 1}
+
+
+def test_hash_comments_and_unknown_extension():
+    """Test '#' comment languages and files without comment rules."""
+    assert classify_lines("# c\nkey: 1\n", '.yaml')['comments'] == 1
+    assert classify_lines("# c\nkey: 1\n", '.txt')['comments'] == 0
+
+
+def test_classify_files_reads_each_file_once(temp_dir):
+    """Test the batch API reads through the shared store and skips missing files."""
+    path = Path(temp_dir) / 'mod.py'
+    path.write_text("x = 1\n\n# note\n")
+    store = ContentStore()
+
+    stats = classify_files([str(path), str(Path(temp_dir) / 'missing.py')], store)
+
+    assert stats == {str(path): {'total': 3, 'code': 1, 'comments': 1, 'blank': 1}}
+    assert store.stats()['misses'] == 2
+
+
+def test_count_lines_filters(temp_dir):
+    """Test count_lines and get_line_stats agree on one classification."""
+    path = Path(temp_dir) / 'script.py'
+    path.write_text(PYTHON_SOURCE)
+
+    assert count_lines(str(path)) == 14
+    assert count_lines(str(path), exclude_blank=True) == 11
+    assert count_lines(str(path), exclude_comments=True, exclude_blank=True) == 7
+    assert get_line_stats(str(path))['comments'] == 4
+
+
+def test_count_newlines_matches_readlines(temp_dir, monkeypatch):
+    """Test byte-level counting handles CRLF, lone CR and chunk boundaries."""
+    path = Path(temp_dir) / 'mixed.py'
+    path.write_bytes(b"a\r\nb\rc\n\r\nd")
+    monkeypatch.setattr(line_counter, 'CHUNK_SIZE', 2)  # Splits a CRLF pair
+
+    assert count_newlines(str(path)) == 5
+    assert count_newlines(str(path)) == count_lines(str(path))
+
+
+def test_exceeds_line_limit_counts_violators(temp_dir):
+    """Test violators get their exact count, small files are never opened."""
+    path = Path(temp_dir) / 'big.py'
+    path.write_text("x = 1\n" * 200)
+
+    assert exceeds_line_limit(str(path), 150) == 200
+    assert exceeds_line_limit(str(path), 200) == 0
+    assert not exceeds_line_limit(str(path), 150, size=100)
+    assert 150 < count_newlines(str(path), stop_after=150) <= 200
+
+
+def test_check_file_sizes_reads_each_file_once(temp_dir, monkeypatch):
+    """Test each file is counted in one pass and tiny files are not read at all."""
+    (Path(temp_dir) / 'small.py').write_text("x = 1\n" * 100)
+    (Path(temp_dir) / 'big.py').write_text("x = 1\n" * 200)
+    (Path(temp_dir) / 'tiny.py').write_text("x = 1\n")
+    exact_counts = []
+    count = line_counter.count_newlines
+
+    def spy(file_path, stop_after=None):
+        if stop_after is None:
+            exact_counts.append(Path(file_path).name)
+        return count(file_path, stop_after)
+
+    monkeypatch.setattr(line_counter, 'count_newlines', spy)
+    violations = check_file_sizes(temp_dir, limit=150, extensions=['.py'])
+
+    assert [(Path(v.file_path).name, v.line_count) for v in violations] == [('big.py', 200)]
+    assert sorted(exact_counts) == ['big.py', 'small.py']
@@ -0,0 +1,49 @@
+"""
+Unit tests for line_coverage and coverage_report modules.
+
+Tests the collector in every mode this interpreter supports.
+"""
+
+import os
+
+import pytest
+
+from src.utils.coverage_report import statement_lines
+from src.utils.line_coverage import MONITORING, LineCollector
+
+
+SOURCE = '''def add(a, b):
+    return a + b
+
+def unused(x):
+    if x:
+        return 1
+    return 2
+
+RESULT = [add(i, 1) for i in range(3)]
+'''
+
+
+@pytest.mark.parametrize('use_monitoring', [False] + ([True] if MONITORING else []))
+def test_collector_records_executed_lines(temp_dir, use_monitoring):
+    """Test executed lines (loops recorded once) and untracked files ignored."""
+    path = os.path.join(temp_dir, 'calc.py')
+    collector = LineCollector(temp_dir, use_monitoring=use_monitoring)
+
+    collector.start()
+    exec(compile(SOURCE, path, 'exec'), {})
+    exec(compile(SOURCE, os.path.join(os.path.dirname(temp_dir), 'other.py'), 'exec'), {})
+    collector.stop()
+
+    assert list(collector.executed) == [path]
+    assert collector.executed[path] == {1, 2, 4, 9}
+
+
+def test_statement_lines_and_omit(temp_dir):
+    """Test executable lines include nested code and omitted files are skipped."""
+    collector = LineCollector(temp_dir, omit=['*/tests/*'])
+
+    assert statement_lines(SOURCE) == {1, 2, 4, 5, 6, 7, 9}
+    assert statement_lines('def broken(:\n') == set()
+    assert collector.tracks(os.path.join(temp_dir, 'calc.py'))
+    assert not collector.tracks(os.path.join(temp_dir, 'tests', 'test_calc.py'))
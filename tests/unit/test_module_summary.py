@@ -0,0 +1,82 @@
+"""
+Unit tests for module_summary module.
+
+Tests the single-pass module summary and its reuse across AST consumers.
+"""
+
+import ast
+from pathlib import Path
+
+from src.analyzers.docstring_analyzer import analyze_project_docstrings
+from src.parsers.module_summary import get_module_summary, summarize_module
+from src.utils.project_snapshot import ProjectSnapshot
+from src.validators.naming_validator import analyze_project_naming
+
+
+SOURCE = '''"""Module docstring."""
+
+
+def top_level():
+    """Documented."""
+    def helper():
+        pass
+    return helper
+
+
+async def fetch():
+    pass
+
+
+class Service:
+    """Service class."""
+
+    def run(self, job):
+        """Run a job."""
+
+    async def poll(self):
+        pass
+
+    class Config:
+        def load(self):
+            pass
+'''
+
+
+def test_summary_separates_functions_and_methods():
+    """Test methods are recorded once, under their class only."""
+    summary = summarize_module(ast.parse(SOURCE))
+
+    assert summary.docstring == 'Module docstring.'
+    assert [(f.name, f.depth) for f in summary.functions] == [
+        ('top_level', 0), ('helper', 1), ('fetch', 0)
+    ]
+    assert [(c.name, c.depth) for c in summary.classes] == [('Service', 0), ('Config', 1)]
+    assert [m.name for m in summary.methods] == ['run', 'poll', 'load']
+    assert all(m.is_method for m in summary.methods)
+
+
+def test_summary_flags_async_defs():
+    """Test async functions and methods are included and flagged."""
+    summary = summarize_module(ast.parse(SOURCE))
+
+    async_defs = [f.name for f in summary.functions + summary.methods if f.is_async]
+    assert async_defs == ['fetch', 'poll']
+
+
+def test_docstring_and_naming_parse_each_file_once(temp_dir, monkeypatch):
+    """Test both checks share one parse per file through the snapshot."""
+    (Path(temp_dir) / 'service.py').write_text(SOURCE)
+    (Path(temp_dir) / 'util.py').write_text('def badName():\n    pass\n')
+    snapshot = ProjectSnapshot.build(temp_dir)
+
+    parsed = []
+    real_parse = ast.parse
+    monkeypatch.setattr(ast, 'parse', lambda source, **kw: parsed.append(1) or real_parse(source, **kw))
+
+    docstrings = analyze_project_docstrings(temp_dir, snapshot=snapshot)
+    naming = analyze_project_naming(temp_dir, snapshot=snapshot)
+
+    assert len(parsed) == 2
+    assert docstrings['total_files'] == naming['total_files'] == 2
+    assert [v.item_name for v in naming['violations']] == ['badName']
+    assert get_module_summary(snapshot.paths(['.py'])[0], snapshot) is not None
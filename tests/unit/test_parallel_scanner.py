@@ -0,0 +1,89 @@
+"""
+Unit tests for parallel_scanner and sharding modules.
+
+Tests size-balanced sharding and deterministic parallel secret scanning.
+"""
+
+import os
+from concurrent.futures import Future
+from pathlib import Path
+
+from src.analyzers import parallel_scanner, security_scanner
+from src.analyzers.security_prefilter import ScanStats
+from src.analyzers.security_scanner import scan_for_secrets
+from src.utils.analysis_cache import AnalysisCache
+from src.utils.project_snapshot import ProjectSnapshot
+from src.utils.sharding import shard_by_size
+
+
+def test_shard_by_size_balances_and_keeps_everything():
+    """Test longest-first assignment to the lightest shard."""
+    items = [('bundle.js', 1000), ('a.py', 400), ('b.py', 300), ('c.py', 200), ('d.py', 100)]
+    shards = shard_by_size(items, 2)
+
+    assert shards == [['bundle.js'], ['a.py', 'b.py', 'c.py', 'd.py']]
+    assert shard_by_size(items[:1], 8) == [['bundle.js']]
+    assert shard_by_size([], 4) == []
+
+
+def test_parallel_scan_matches_serial_order(temp_dir, monkeypatch):
+    """Test that worker processes return the serial findings in the same order."""
+    root = Path(temp_dir)
+    for index in range(6):
+        (root / f'module_{index}.py').write_text(
+            'x = 1\n' * index + f'password = "hunter{index}hunter{index}"\n'
+        )
+    (root / 'data.yaml').write_text('token: "%s"\n' % ('Q' * 40) * 50)
+    monkeypatch.setattr(security_scanner, 'PARALLEL_MIN_BYTES', 0)
+    serial_stats, parallel_stats = ScanStats(), ScanStats()
+
+    serial = scan_for_secrets(temp_dir, stats=serial_stats)
+    parallel = scan_for_secrets(temp_dir, stats=parallel_stats, workers=3)
+
+    assert parallel == serial
+    assert len(serial) == 56
+    assert parallel_stats == serial_stats
+
+
+def test_parallel_scan_uses_the_analysis_cache(temp_dir, monkeypatch):
+    """Test cached files skip the pool and worker results are written back."""
+    project = Path(temp_dir) / 'project'
+    project.mkdir()
+    for index in range(4):
+        (project / f'module_{index}.py').write_text(f'password = "hunter{index}hunter{index}"\n')
+    monkeypatch.setattr(security_scanner, 'PARALLEL_MIN_BYTES', 0)
+
+    with AnalysisCache(os.path.join(temp_dir, 'cache')) as cache:
+        first = scan_for_secrets(str(project), snapshot=ProjectSnapshot.build(
+            str(project), cache=cache), workers=2)
+        (project / 'module_0.py').write_text('password = "changedchanged"\n')
+        shards = []
+
+        def unreadable_shard(paths, detect_entropy):
+            shards.append(paths)
+            return {path: None for path in paths}
+
+        monkeypatch.setattr(parallel_scanner, '_scan_shard', unreadable_shard)
+        monkeypatch.setattr(parallel_scanner, 'ProcessPoolExecutor', _InlinePool)
+        stats = ScanStats()
+        second = scan_for_secrets(str(project), snapshot=ProjectSnapshot.build(
+            str(project), cache=cache), stats=stats, workers=2)
+
+    assert len(first) == 4 and second == first[1:]
+    assert [[os.path.basename(p) for p in shard] for shard in shards] == [['module_0.py']]
+    assert stats.files_scanned == 3
+
+
+class _InlinePool:
+    """Executor stand-in that runs submissions in this process."""
+
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+
+    def submit(self, function, *args):
+        future = Future()
+        future.set_result(function(*args))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
@@ -0,0 +1,88 @@
+"""
+Unit tests for parallel_summaries module.
+
+Tests process-pool module summaries and their in-process fallback.
+"""
+
+import os
+from pathlib import Path
+
+from src.analyzers.complexity_analyzer import analyze_project_complexity
+from src.analyzers.docstring_analyzer import analyze_project_docstrings
+from src.parsers import module_summary, parallel_summaries
+from src.parsers.parallel_summaries import summarize_files
+from src.utils.analysis_cache import AnalysisCache
+from src.utils.project_snapshot import ProjectSnapshot
+from src.validators.naming_validator import analyze_project_naming
+
+
+def _write_modules(root: Path, count: int) -> None:
+    """Write small modules with a mix of documented and misnamed defs."""
+    for index in range(count):
+        (root / f'module_{index}.py').write_text(
+            f'"""Module {index}."""\n\n\n'
+            f'def handler_{index}():\n    """Handle."""\n\n\n'
+            f'class Worker{index}:\n    def Run(self):\n        pass\n'
+        )
+
+
+def test_parallel_results_match_in_process(temp_dir, monkeypatch):
+    """Test worker processes produce the same project results."""
+    _write_modules(Path(temp_dir), 6)
+    monkeypatch.setattr(parallel_summaries, 'PARALLEL_MIN_FILES', 2)
+
+    for analyze in (analyze_project_docstrings, analyze_project_naming):
+        assert analyze(temp_dir, workers=2) == analyze(temp_dir)
+
+
+def test_small_projects_stay_in_process(temp_dir, monkeypatch):
+    """Test no pool is started below PARALLEL_MIN_FILES."""
+    _write_modules(Path(temp_dir), 3)
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError('process pool started')
+
+    monkeypatch.setattr(parallel_summaries, 'ProcessPoolExecutor', no_pool)
+    summaries = summarize_files(sorted(map(str, Path(temp_dir).glob('*.py'))), workers=8)
+
+    assert [s.functions[0].name for s in summaries.values()] == [
+        'handler_0', 'handler_1', 'handler_2'
+    ]
+
+
+def test_parallel_summaries_fill_snapshot_and_cache(temp_dir, monkeypatch):
+    """Test worker results are stored so later runs skip the pool."""
+    project = Path(temp_dir) / 'project'
+    project.mkdir()
+    _write_modules(project, 4)
+    monkeypatch.setattr(parallel_summaries, 'PARALLEL_MIN_FILES', 2)
+
+    with AnalysisCache(os.path.join(temp_dir, 'cache')) as cache:
+        snapshot = ProjectSnapshot.build(str(project), cache=cache)
+        first = summarize_files(snapshot.paths(['.py']), snapshot, workers=2)
+        assert set(snapshot.summaries) == set(first)
+
+        monkeypatch.setattr(parallel_summaries, 'ProcessPoolExecutor', None)
+        rebuilt = ProjectSnapshot.build(str(project), cache=cache)
+        assert summarize_files(rebuilt.paths(['.py']), rebuilt, workers=2) == first
+        assert cache.hits == 4
+
+
+def test_unparseable_file_is_parsed_once(temp_dir, monkeypatch):
+    """Test a file that failed to summarize is not re-parsed by each check."""
+    _write_modules(Path(temp_dir), 2)
+    (Path(temp_dir) / 'broken.py').write_text('def broken(:\n')
+    parses = []
+    original = module_summary.parse_python_file
+
+    def counting_parse(file_path, store=None):
+        parses.append(file_path)
+        return original(file_path, store)
+
+    monkeypatch.setattr(module_summary, 'parse_python_file', counting_parse)
+    snapshot = ProjectSnapshot.build(temp_dir)
+    analyze_project_docstrings(temp_dir, snapshot=snapshot)
+    analyze_project_naming(temp_dir, snapshot=snapshot)
+    analyze_project_complexity(temp_dir, snapshot=snapshot)
+
+    assert len(parses) == 3
@@ -0,0 +1,99 @@
+"""
+Unit tests for project_snapshot module.
+
+Tests the single-traversal project index and its use by analyzers.
+"""
+
+import pytest
+from pathlib import Path
+
+from src.utils.project_snapshot import ProjectSnapshot, classify_role
+from src.utils.file_finder import find_code_files, find_test_files
+from src.analyzers.research_analyzer import evaluate_research_quality
+
+
+@pytest.fixture
+def snapshot_project(temp_dir):
+    """Create a small project tree with ignored directories."""
+    root = Path(temp_dir)
+    (root / "src").mkdir()
+    (root / "src" / "main.py").write_text("print('hi')\n")
+    (root / "src" / "app.ts").write_text("let x = 1;\n")
+    (root / "tests").mkdir()
+    (root / "tests" / "test_main.py").write_text("def test_x():\n    assert True\n")
+    (root / "venv").mkdir()
+    (root / "venv" / "lib.py").write_text("x = 1\n")
+    (root / "README.md").write_text("# Readme\n")
+    (root / "config.yaml").write_text("lr: 0.1\n")
+    (root / "results.csv").write_text("a,b\n1,2\n")
+    return temp_dir
+
+
+def test_build_skips_ignored_dirs(snapshot_project):
+    """Test that ignored directories are not indexed."""
+    snapshot = ProjectSnapshot.build(snapshot_project)
+    rel_paths = {e.rel_path for e in snapshot.entries}
+
+    assert 'src/main.py' in rel_paths
+    assert 'venv/lib.py' not in rel_paths
+
+
+def test_paths_match_find_code_files(snapshot_project):
+    """Test snapshot filtering matches a fresh directory walk."""
+    snapshot = ProjectSnapshot.build(snapshot_project)
+
+    for exts in (['.py'], ['.py', '.js', '.ts'], ['.md']):
+        assert snapshot.paths(extensions=exts) == find_code_files(snapshot_project, exts)
+        assert find_code_files(snapshot_project, exts, snapshot=snapshot) == \
+            find_code_files(snapshot_project, exts)
+
+
+def test_entry_metadata(snapshot_project):
+    """Test that size, extension and role are recorded."""
+    snapshot = ProjectSnapshot.build(snapshot_project)
+    entry = snapshot.get('src/main.py')
+
+    assert entry.size == len("print('hi')\n")
+    assert entry.extension == '.py'
+    assert entry.role == 'source'
+    assert entry.mtime > 0
+    assert snapshot.get('tests/test_main.py').role == 'test'
+    assert snapshot.get('config.yaml').role == 'config'
+    assert snapshot.get('results.csv').role == 'data'
+    assert snapshot.get('README.md').role == 'doc'
+
+
+def test_classify_role_defaults():
+    """Test role classification for special and unknown files."""
+    assert classify_role('.gitignore') == 'config'
+    assert classify_role('requirements.txt') == 'config'
+    assert classify_role('widget.spec.ts') == 'test'
+    assert classify_role('image.png') == 'other'
+
+
+def test_find_test_files_with_snapshot(snapshot_project):
+    """Test that test discovery reuses the snapshot."""
+    snapshot = ProjectSnapshot.build(snapshot_project)
+    assert find_test_files(snapshot_project, snapshot=snapshot) == \
+        find_test_files(snapshot_project)
+
+
+def test_contains_uses_index(snapshot_project):
+    """Test existence checks against the snapshot."""
+    snapshot = ProjectSnapshot.build(snapshot_project)
+
+    assert snapshot.contains(str(Path(snapshot_project) / 'README.md'))
+    assert not snapshot.contains(str(Path(snapshot_project) / 'PRD.md'))
+
+
+def test_research_analyzer_accepts_snapshot(snapshot_project):
+    """Test analyzer results are identical with and without a snapshot."""
+    snapshot = ProjectSnapshot.build(snapshot_project)
+    assert evaluate_research_quality(snapshot_project, snapshot=snapshot) == \
+        evaluate_research_quality(snapshot_project)
+
+
+def test_build_rejects_missing_directory():
+    """Test that a nonexistent root raises NotADirectoryError."""
+    with pytest.raises(NotADirectoryError):
+        ProjectSnapshot.build('/nonexistent/path')
@@ -0,0 +1,63 @@
+"""
+Unit tests for secret_baseline module.
+
+Tests fingerprinting, baseline persistence and finding suppression.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.analyzers.secret_baseline import (
+    fingerprint, load_baseline, save_baseline
+)
+from src.analyzers.security_scanner import scan_for_secrets
+from src.models.code_models import SecretFinding
+
+
+def _finding(file_path, line_number=1, match='password = "hunter22hunter"'):
+    """Build a password finding."""
+    return SecretFinding('password', file_path, line_number, match, match=match)
+
+
+def test_fingerprint_ignores_root_line_and_whitespace():
+    """Test that fingerprints are stable across copies, edits and reformatting."""
+    first = fingerprint(_finding('/class/alice/src/app.py', 3), '/class/alice')
+    moved = fingerprint(_finding('/class/bob/src/app.py', 40), '/class/bob')
+    spaced = fingerprint(
+        _finding('/class/alice/src/app.py', match='password  =  "hunter22hunter"'),
+        '/class/alice'
+    )
+
+    assert first == moved == spaced
+    assert first != fingerprint(_finding('/class/alice/src/other.py'), '/class/alice')
+
+
+def test_baseline_round_trip(temp_dir):
+    """Test saving and loading a baseline file."""
+    path = str(Path(temp_dir) / 'baseline.json')
+
+    assert load_baseline(path) == set()
+    assert save_baseline(['b', 'a', 'a'], path) == 2
+    assert load_baseline(path) == {'a', 'b'}
+
+
+def test_invalid_baseline_raises(temp_dir):
+    """Test that a corrupt baseline file is reported, not ignored."""
+    path = Path(temp_dir) / 'baseline.json'
+    path.write_text('[1, 2')
+
+    with pytest.raises(ValueError):
+        load_baseline(str(path))
+
+
+def test_scanner_drops_baselined_findings(temp_dir):
+    """Test that reviewed findings are suppressed and new ones still reported."""
+    root = Path(temp_dir)
+    (root / 'docs.py').write_text('password = "hunter22hunter"\n')
+    reviewed = {fingerprint(f, temp_dir) for f in scan_for_secrets(temp_dir)}
+    (root / 'app.py').write_text('password = "n3wS3cretValue"\n')
+
+    findings = scan_for_secrets(temp_dir, baseline=reviewed)
+
+    assert [Path(f.file_path).name for f in findings] == ['app.py']
@@ -0,0 +1,50 @@
+"""
+Unit tests for the streaming secret scan API.
+
+Tests iter_secrets laziness and the stop_after early exit.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.analyzers import security_scanner
+from src.analyzers.security_prefilter import ScanStats
+from src.analyzers.security_scanner import iter_secrets, scan_for_secrets
+
+
+@pytest.fixture
+def leaky_project(temp_dir):
+    """Create ten files that each hold one hardcoded password."""
+    for index in range(10):
+        (Path(temp_dir) / f'module_{index}.py').write_text(
+            f'password = "hunter{index}hunter{index}"\n'
+        )
+    return temp_dir
+
+
+def test_iter_secrets_is_lazy(leaky_project):
+    """Test that taking the first finding scans only the first file."""
+    stats = ScanStats()
+    first = next(iter_secrets(leaky_project, stats=stats))
+
+    assert first.file_path.endswith('module_0.py')
+    assert stats.files_scanned == 1
+
+
+def test_stop_after_limits_findings_and_work(leaky_project):
+    """Test that stop_after returns the first N findings and stops scanning."""
+    stats = ScanStats()
+    findings = scan_for_secrets(leaky_project, stats=stats, stop_after=2)
+
+    assert findings == scan_for_secrets(leaky_project)[:2]
+    assert stats.files_scanned == 2
+
+
+def test_stop_after_with_workers(leaky_project, monkeypatch):
+    """Test early exit from the process-pool mode keeps file order."""
+    monkeypatch.setattr(security_scanner, 'PARALLEL_MIN_BYTES', 0)
+
+    findings = scan_for_secrets(leaky_project, workers=2, stop_after=3)
+
+    assert findings == scan_for_secrets(leaky_project)[:3]
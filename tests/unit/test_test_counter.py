@@ -0,0 +1,124 @@
+"""
+Unit tests for test_counter module.
+
+Tests pytest-style test collection and metrics from the module summary.
+"""
+
+from pathlib import Path
+
+from src.analyzers.test_analyzer import evaluate_tests
+from src.analyzers.test_counter import analyze_test_file, count_python_tests
+from src.parsers import module_summary
+from src.utils.project_snapshot import ProjectSnapshot
+
+
+SOURCE = '''
+import pytest
+
+NOTE = "assert nothing here"
+
+
+@pytest.fixture
+def client():
+    return object()
+
+
+def check(value):
+    assert value
+
+
+@pytest.mark.parametrize("a", [1, 2, 3])
+@pytest.mark.parametrize("b", (True, False))
+def test_grid(a, b):
+    """Grid of cases."""
+    check(a)
+    # assert in a comment
+    assert "assert" not in str(b)
+
+
+async def test_async(client):
+    with pytest.raises(ValueError):
+        raise ValueError()
+
+
+class TestThing:
+    def test_method(self):
+        self.assertEqual(1, 1)
+
+    def helper(self):
+        pass
+
+
+class Helper:
+    def test_not_collected(self):
+        pass
+'''
+
+
+def test_tests_cases_and_fixtures_from_ast(temp_dir):
+    """Test collection rules, parametrize expansion and fixture detection."""
+    path = Path(temp_dir) / 'test_sample.py'
+    path.write_text(SOURCE)
+
+    result = analyze_test_file(str(path))
+
+    assert result['num_tests'] == 3
+    assert result['num_cases'] == 6 + 1 + 1
+    assert result['num_async_tests'] == 1
+    assert result['fixtures'] == ['client']
+    assert result['has_docstrings'] is True
+    assert count_python_tests(str(path)) == 3
+
+
+def test_assertions_ignore_strings_and_comments(temp_dir):
+    """Test only real assert nodes, assert* calls and pytest.raises count."""
+    path = Path(temp_dir) / 'test_sample.py'
+    path.write_text(SOURCE)
+
+    result = analyze_test_file(str(path))
+
+    assert result['assertions_per_test'] == {
+        'test_grid': 1, 'test_async': 1, 'TestThing.test_method': 1
+    }
+    assert result['num_assertions'] == 4  # Includes the helper's assert
+
+
+def test_evaluate_tests_reports_cases(temp_dir):
+    """Test project evaluation totals definitions and parametrized cases."""
+    (Path(temp_dir) / 'tests').mkdir()
+    (Path(temp_dir) / 'tests' / 'test_sample.py').write_text(SOURCE)
+
+    result = evaluate_tests(temp_dir)
+
+    assert result['total_tests'] == 3
+    assert result['total_cases'] == 8
+    assert result['total_assertions'] == 4
+
+
+def test_unparseable_test_file_uses_text_metrics_once(temp_dir, monkeypatch):
+    """Test a broken test file is parsed once and still reports its line count."""
+    (Path(temp_dir) / 'tests').mkdir()
+    (Path(temp_dir) / 'tests' / 'test_broken.py').write_text(
+        'def test_one():\n    assert True\n\ndef test_two(:\n'
+    )
+    parses = []
+    original = module_summary.parse_python_file
+
+    def counting_parse(file_path, store=None):
+        parses.append(file_path)
+        return original(file_path, store)
+
+    monkeypatch.setattr(module_summary, 'parse_python_file', counting_parse)
+    result = evaluate_tests(temp_dir, snapshot=ProjectSnapshot.build(temp_dir))
+
+    assert len(parses) == 1
+    assert result['total_tests'] == 2
+    assert result['file_results'][0]['lines'] == 5
+
+
+def test_lines_key_is_kept(temp_dir):
+    """Test parsed test files report lines like the text metrics do."""
+    path = Path(temp_dir) / 'test_sample.py'
+    path.write_text(SOURCE)
+
+    assert analyze_test_file(str(path))['lines'] == len(SOURCE.split('\n'))
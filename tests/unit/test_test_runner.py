@@ -0,0 +1,146 @@
+"""
+Unit tests for test_runner, cohort_test_runner and sandbox modules.
+
+Runs tiny real submissions under pytest and the line collector in the sandbox.
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from src.analyzers.cohort_test_runner import run_cohort_tests
+from src.analyzers.test_runner import run_test_suite
+from src.utils.analysis_cache import AnalysisCache
+from src.utils import sandbox
+from src.utils.sandbox import OUTPUT_TAIL, run_sandboxed, sandbox_env
+
+
+MODULE = '''
+def add(a, b):
+    return a + b
+
+
+def unused(x):
+    if x:
+        return 1
+    return 2
+'''
+
+TESTS = '''
+from calc import add
+
+
+def test_add():
+    assert add(1, 2) == 3
+
+
+def test_add_fails():
+    assert add(1, 1) == 3
+'''
+
+
+def _submission(root: Path, tests: str = TESTS) -> str:
+    """Write a one-module submission with its tests."""
+    root.mkdir(parents=True, exist_ok=True)
+    (root / 'calc.py').write_text(MODULE)
+    (root / 'test_calc.py').write_text(tests)
+    return str(root)
+
+
+def test_run_reports_counts_and_coverage(temp_dir):
+    """Test pass/fail counts and coverage that excludes the test files."""
+    project = _submission(Path(temp_dir) / 'student')
+
+    result = run_test_suite(project, timeout=60)
+
+    assert result['status'] == 'failed'
+    assert (result['tests_run'], result['failures']) == (2, 1)
+    assert result['file_coverage'] == {'calc.py': result['coverage']}  # Tests not measured
+    assert 0 < result['coverage'] < 1
+    assert sorted(os.listdir(project)) == ['calc.py', 'test_calc.py']  # Ran in a scratch copy
+
+
+def test_run_timeout_kills_suite(temp_dir):
+    """Test the wall-clock limit ends a hanging suite."""
+    hang = 'import time\n\n\ndef test_hang():\n    time.sleep(60)\n'
+    project = _submission(Path(temp_dir) / 'student', tests=hang)
+
+    result = run_test_suite(project, timeout=3)
+
+    assert result['status'] == 'timeout'
+    assert result['duration'] < 30
+
+
+def test_cohort_runs_identical_trees_once_and_caches(temp_dir):
+    """Test dedupe within a cohort and cache hits for resubmissions."""
+    paths = [_submission(Path(temp_dir) / name) for name in ('alice', 'bob')]
+
+    with AnalysisCache(os.path.join(temp_dir, 'cache')) as cache:
+        first = run_cohort_tests(paths, workers=2, cache=cache, timeout=60)
+        second = run_cohort_tests(paths, workers=2, cache=cache, timeout=60)
+
+    assert [first[p]['cached'] for p in paths] == [False, False]
+    assert [second[p]['cached'] for p in paths] == [True, True]
+    assert second[paths[0]]['tests_run'] == 2
+
+
+class _BrokenPool:
+    """Venv pool whose environments never build (e.g. a missing wheel)."""
+
+    @contextmanager
+    def environment(self, snapshot):
+        raise RuntimeError('pip install failed: no matching distribution for numpy')
+        yield
+
+
+def test_cohort_error_result_has_every_key(temp_dir):
+    """Test a failed environment yields the same keys as a real run, and is not cached."""
+    path = _submission(Path(temp_dir) / 'carol')
+    ran = run_test_suite(path, timeout=60)
+
+    with AnalysisCache(os.path.join(temp_dir, 'cache')) as cache:
+        failed = run_cohort_tests([path], cache=cache, pool=_BrokenPool())[path]
+        assert run_cohort_tests([path], cache=cache, pool=_BrokenPool())[path]['cached'] is False
+
+    assert failed['status'] == 'error' and 'numpy' in failed['output']
+    assert set(failed) - {'cached'} == set(ran) and failed['file_coverage'] == {}
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='rlimits are POSIX only')
+def test_sandbox_scrubs_env_and_limits_memory(temp_dir, monkeypatch):
+    """Test host secrets are not inherited and the memory cap holds."""
+    monkeypatch.setenv('GITHUB_TOKEN', 'secret')
+    env = sandbox_env(temp_dir)
+    show = run_sandboxed([sys.executable, '-c', 'import os; print(sorted(os.environ))'],
+                         temp_dir, env, timeout=30)
+    hog = run_sandboxed([sys.executable, '-c', 'x = bytearray(512 * 1024 * 1024)'],
+                        temp_dir, env, timeout=30, memory_mb=256)
+
+    assert 'GITHUB_TOKEN' not in show.stdout and 'HOME' in show.stdout
+    assert hog.returncode != 0 and 'MemoryError' in hog.stderr
+
+
+def test_sandbox_keeps_only_an_output_tail(temp_dir):
+    """Test a job printing far more than the tail is cut to its last characters."""
+    noisy = run_sandboxed(
+        [sys.executable, '-c', "import sys; sys.stdout.write('x' * 50_000_000); print('END')"],
+        temp_dir, sandbox_env(temp_dir), timeout=60
+    )
+
+    assert noisy.returncode == 0 and len(noisy.stdout) == OUTPUT_TAIL
+    assert noisy.stdout.endswith('xEND\n')
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='process groups are POSIX only')
+def test_sandbox_timeout_ignores_escaped_pipe_holders(temp_dir, monkeypatch):
+    """Test a grandchild in its own session holding the pipes cannot hang the kill."""
+    monkeypatch.setattr(sandbox, 'DRAIN_TIMEOUT', 0.5)
+    escape = ('import subprocess, sys, time; subprocess.Popen([sys.executable, "-c", '
+              '"import time; time.sleep(20)"], start_new_session=True); time.sleep(60)')
+    result = run_sandboxed([sys.executable, '-c', escape], temp_dir, sandbox_env(temp_dir),
+                           timeout=1)
+
+    assert result.timed_out and result.duration < 10
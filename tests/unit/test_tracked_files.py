@@ -0,0 +1,75 @@
+"""
+Unit tests for tracked_files module.
+
+Tests tracked-only snapshots built from the git index.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.utils import tracked_files
+from src.utils.project_snapshot import ProjectSnapshot
+from src.utils.tracked_files import list_tracked_files
+from tests.fixtures.git_repo import run_git
+
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason='git not installed')
+
+
+def _write(root, files):
+    """Create files (relative POSIX path -> text) under root."""
+    for name, text in files.items():
+        path = Path(root, *name.split('/'))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+
+
+@pytest.fixture
+def polluted_repo(temp_dir):
+    """Committed project plus untracked build output, a local venv and a deleted file."""
+    _write(temp_dir, {'README.md': '# Project\n', 'app/main.py': 'print(1)\n',
+                      'app/test_main.py': 'def test_x():\n    assert True\n',
+                      'app/old.py': 'x = 1\n', 'venv/site.py': 'y = 2\n'})
+    for args in (['init', '-q'], ['add', '.'], ['commit', '-q', '-m', 'Submit project']):
+        run_git(temp_dir, *args)
+    os.remove(os.path.join(temp_dir, 'app', 'old.py'))
+    _write(temp_dir, {'out/lib/main.py': 'print(1)\n', '.myenv/lib/six.py': 'z = 3\n',
+                      'app/generated_pb2.py': 'GEN = 1\n'})
+    return temp_dir
+
+
+def test_tracked_only_snapshot_skips_untracked_files(polluted_repo):
+    """Test only tracked, present, non-ignored files are indexed."""
+    walked = {e.rel_path for e in ProjectSnapshot.build(polluted_repo).entries}
+    tracked = ProjectSnapshot.build(polluted_repo, tracked_only=True)
+
+    assert [e.rel_path for e in tracked.entries] == ['README.md', 'app/main.py',
+                                                     'app/test_main.py']
+    assert {'out/lib/main.py', '.myenv/lib/six.py', 'app/generated_pb2.py'} <= walked
+    assert tracked.paths(role='test') == [os.path.join(polluted_repo, 'app', 'test_main.py')]
+    assert tracked.get('app/main.py').size == len('print(1)\n')
+
+
+def test_nested_non_repo_directory_is_walked(polluted_repo):
+    """Test a directory inside another checkout is walked, not read from its index."""
+    nested = os.path.join(polluted_repo, 'submissions', 'alice')
+    _write(nested, {'solver.py': 'x = 1\n', 'tests/test_solver.py': 'def test_x():\n    pass\n'})
+    snapshot = ProjectSnapshot.build(nested, tracked_only=True)
+
+    assert list_tracked_files(nested) is None
+    assert list_tracked_files(os.path.join(polluted_repo, 'app')) is None  # Tracked subdir
+    assert [e.rel_path for e in snapshot.entries] == ['solver.py', 'tests/test_solver.py']
+
+
+def test_unreadable_index_falls_back_to_ls_files(polluted_repo, monkeypatch):
+    """Test an index the reader rejects is listed by git ls-files instead."""
+    expected = list_tracked_files(polluted_repo)
+
+    def reject(git_dir):
+        raise ValueError('Sparse index (directory entries) is not supported')
+
+    monkeypatch.setattr(tracked_files, 'tracked_blobs', reject)
+    assert list_tracked_files(polluted_repo) == expected
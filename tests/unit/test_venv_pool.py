@@ -0,0 +1,86 @@
+"""
+Unit tests for venv_pool and dependency_spec modules.
+
+Builds real environments offline from a hand-made wheel.
+"""
+
+import os
+import subprocess
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from src.utils.dependency_spec import read_requirements, requirements_key, resolve_requirements
+from src.utils.project_snapshot import ProjectSnapshot
+from src.utils.venv_pool import VenvPool
+
+
+def _project(root: Path, requirements: str = None, pyproject: str = None) -> ProjectSnapshot:
+    """Write a submission declaring the given dependencies and index it."""
+    root.mkdir(parents=True, exist_ok=True)
+    if requirements is not None:
+        (root / 'requirements.txt').write_text(requirements)
+    if pyproject is not None:
+        (root / 'pyproject.toml').write_text(pyproject)
+    return ProjectSnapshot.build(str(root))
+
+
+def _wheel(wheel_dir: str) -> None:
+    """Write a minimal pure-Python wheel 'grade_dep' 1.0 into wheel_dir."""
+    info = 'grade_dep-1.0.dist-info'
+    files = {
+        'grade_dep.py': 'VALUE = 42\n',
+        f'{info}/METADATA': 'Metadata-Version: 2.1\nName: grade_dep\nVersion: 1.0\n',
+        f'{info}/WHEEL': 'Wheel-Version: 1.0\nGenerator: test\nRoot-Is-Purelib: true\n'
+                         'Tag: py3-none-any\n',
+    }
+    files[f'{info}/RECORD'] = ''.join(f'{name},,\n' for name in files) + f'{info}/RECORD,,\n'
+    with zipfile.ZipFile(os.path.join(wheel_dir, 'grade_dep-1.0-py3-none-any.whl'), 'w') as whl:
+        for name, text in files.items():
+            whl.writestr(name, text)
+
+
+def test_equivalent_requirement_files_share_a_key(temp_dir):
+    """Test comments, order, case, '_'/'-' and pip options do not change the key."""
+    first = _project(Path(temp_dir) / 'a', requirements='NumPy>=1.20  # arrays\n\npandas\n')
+    second = _project(Path(temp_dir) / 'b', requirements='-i https://mirror\npandas\n',
+                      pyproject='[project]\ndependencies = ["numpy >= 1.20"]\n')
+    third = _project(Path(temp_dir) / 'c', requirements='scikit_learn\n')
+
+    assert read_requirements(first) == ['numpy>=1.20', 'pandas']
+    assert requirements_key(read_requirements(first)) == requirements_key(read_requirements(second))
+    assert read_requirements(third) == ['scikit-learn']
+
+
+def test_pool_installs_offline_reuses_and_evicts(temp_dir):
+    """Test offline install from the wheel cache, reuse by resolved set and LRU eviction."""
+    pool = VenvPool(os.path.join(temp_dir, 'envs'), os.path.join(temp_dir, 'wheels'),
+                    max_envs=1, tools=())
+    _wheel(pool.wheel_dir)
+    with_dep = _project(Path(temp_dir) / 'a', requirements='grade-dep\n')
+
+    with pool.environment(with_dep) as python:
+        output = subprocess.run([python, '-c', 'import grade_dep; print(grade_dep.VALUE)'],
+                                capture_output=True, text=True).stdout
+    with pool.environment(_project(Path(temp_dir) / 'b', requirements='Grade_Dep>=0.5\n')) as again:
+        pass
+    with pool.environment(_project(Path(temp_dir) / 'c')):  # No dependencies
+        pass
+    envs = sorted(os.listdir(pool.root))  # Eviction happens on release
+
+    assert output.strip() == '42'
+    assert again == python
+    assert len(envs) == 1 and envs[0] == requirements_key([])  # LRU entry evicted
+
+
+def test_specs_resolving_alike_share_a_key(temp_dir):
+    """Test the key follows the resolved packages, not the declared strings."""
+    wheels = os.path.join(temp_dir, 'wheels')
+    os.makedirs(wheels)
+    _wheel(wheels)
+
+    pinned = resolve_requirements(['grade-dep==1.0'], wheels)
+    assert pinned == resolve_requirements(['grade-dep>=0.5'], wheels) == ['grade-dep==1.0']
+    with pytest.raises(RuntimeError):
+        resolve_requirements(['grade-dep>=2'], wheels)